@@ -1,5 +1,9 @@
 from .analogs import Analogs
 from .angles import Angles
 from .dataarray_accessor import DataArrayAccessor
+from .force_plates import ForcePlates
+from .kinematic_chain import KinematicChain
 from .markers import Markers
+from .processing.filter import StreamingFilter
 from .rototrans import Rototrans
+from .trial import read_c3d_trial
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Union, Optional, List, Tuple
+from typing import Union, Optional, List, Tuple, Iterator
 
 import numpy as np
 import pandas as pd
@@ -15,6 +15,7 @@ class Analogs:
         channels: Optional[list] = None,
         time: Optional[Union[np.array, list, pd.Series]] = None,
         *args,
+        chunks: Optional[Union[int, tuple, dict]] = None,
         **kwargs,
     ) -> xr.DataArray:
         """
@@ -27,6 +28,7 @@ class Analogs:
             time: Time vector in seconds associated with the `data` parameter
             args: Positional argument(s) to be passed to xarray.DataArray
             kwargs: Keyword argument(s) to be passed to xarray.DataArray
+            chunks: If specified, the data is backed by a dask array with these chunk sizes (see `xarray.DataArray.chunk`)
 
         Returns:
             Analogs `xarray.DataArray` with the specified data and coordinates
@@ -69,13 +71,16 @@ class Analogs:
             coords["channel"] = channels
         if time is not None:
             coords["time"] = time
-        return xr.DataArray(
-            data=data,
-            dims=("channel", "time"),
-            coords=coords,
-            name="analogs",
-            *args,
-            **kwargs,
+        return utils.chunk(
+            xr.DataArray(
+                data=data,
+                dims=("channel", "time"),
+                coords=coords,
+                name="analogs",
+                *args,
+                **kwargs,
+            ),
+            chunks,
         )
 
     @classmethod
@@ -133,6 +138,9 @@ class Analogs:
         skiprows: Optional[List[int]] = None,
         pandas_kwargs: Optional[dict] = None,
         attrs: Optional[dict] = None,
+        start: Optional[Union[int, float]] = None,
+        stop: Optional[Union[int, float]] = None,
+        chunks: Optional[Union[int, tuple, dict]] = None,
     ) -> xr.DataArray:
         """
         Analogs DataArray from a csv file.
@@ -151,6 +159,11 @@ class Analogs:
             skiprows: Line numbers to skip (0-indexed)
             pandas_kwargs: Keyword arguments to be passed to `pandas.read_csv`
             attrs: attrs to be passed to `xr.DataArray`. If attrs['rate'] is provided, compute the time accordingly
+            start: First frame (int) or time in seconds from the first frame (float, requires attrs['rate'])
+                of the time window to read. The rows before the window are skipped without being parsed
+            stop: Last frame (int, excluded) or time in seconds from the first frame (float, requires attrs['rate'])
+                of the time window to read. The rows after the window are not read
+            chunks: If specified, the data is backed by a dask array with these chunk sizes (see `xarray.DataArray.chunk`)
 
         Returns:
             Analogs `xarray.DataArray` with the specified data and coordinates
@@ -209,10 +222,104 @@ class Analogs:
             )
             ```
         """
-        return read.read_csv_or_excel(
+        return utils.chunk(
+            read.read_csv_or_excel(
+                cls,
+                "csv",
+                filename,
+                usecols,
+                header,
+                first_row,
+                first_column,
+                time_column,
+                last_column_to_remove,
+                prefix_delimiter,
+                suffix_delimiter,
+                skiprows,
+                pandas_kwargs,
+                attrs,
+                start=start,
+                stop=stop,
+            ),
+            chunks,
+        )
+
+    @classmethod
+    def from_csv_chunks(
+        cls,
+        filename: Union[str, Path],
+        chunksize: int,
+        usecols: Optional[List[Union[str, int]]] = None,
+        header: Optional[int] = None,
+        first_row: int = 0,
+        first_column: Optional[Union[str, int]] = None,
+        time_column: Optional[Union[str, int]] = None,
+        last_column_to_remove: Optional[Union[str, int]] = None,
+        prefix_delimiter: Optional[str] = None,
+        suffix_delimiter: Optional[str] = None,
+        skiprows: Optional[List[int]] = None,
+        pandas_kwargs: Optional[dict] = None,
+        attrs: Optional[dict] = None,
+        start: Optional[Union[int, float]] = None,
+        stop: Optional[Union[int, float]] = None,
+    ) -> Iterator[xr.DataArray]:
+        """
+        Iterate over a csv file by blocks of `chunksize` frames, each block being a Analogs DataArray.
+
+        Only one block is parsed and held in memory at a time, which allows to process csv files larger than the memory.
+        The arguments are the same as `Analogs.from_csv`.
+
+        Arguments:
+            filename: Any valid string path
+            chunksize: Number of frames of each block
+            usecols: All elements must either be positional or strings that correspond to column names.
+                For example, a valid list-like usecols parameter would be [0, 1, 2] or ['foo', 'bar', 'baz'].
+            header: Row of the header (0-indexed)
+            first_row: First row of the data (0-indexed)
+            first_column: First column of the data (0-indexed)
+            time_column: Column of the time column. If None, we associate the index
+            last_column_to_remove: If for some reason the csv reads extra columns, how many should be ignored
+            prefix_delimiter: Delimiter that split each column name by its prefix (we keep only the column name)
+            suffix_delimiter: Delimiter that split each column name by its suffix (we keep only the column name)
+            skiprows: Line numbers to skip (0-indexed)
+            pandas_kwargs: Keyword arguments to be passed to `pandas.read_csv`
+            attrs: attrs to be passed to `xr.DataArray`. If attrs['rate'] is provided, compute the time accordingly
+            start: First frame (int) or time in seconds from the first frame (float, requires attrs['rate'])
+                of the time window to read
+            stop: Last frame (int, excluded) or time in seconds from the first frame (float, requires attrs['rate'])
+                of the time window to read
+
+        Returns:
+            Iterator of Analogs `xarray.DataArray`, each one covering at most `chunksize` frames
+
+        !!! example
+            ```python
+            from pyomeca import Analogs
+
+            data_path = "./tests/data/analogs.csv"
+            csv_kwargs = dict(header=3, first_row=5, first_column=2)
+
+            for chunk in Analogs.from_csv_chunks(data_path, chunksize=100, **csv_kwargs):
+                print(chunk.time[0].item(), chunk.time[-1].item())
+            ```
+
+            The blocks can be summarized one after the other so that the whole file is never in memory:
+
+            ```python
+            import xarray as xr
+
+            channels = ["IM EMG1", "IM EMG2"]
+            chunks = Analogs.from_csv_chunks(
+                data_path, chunksize=100, usecols=channels, **csv_kwargs
+            )
+            maximum = xr.concat([chunk.meca.abs().max("time") for chunk in chunks], "time")
+            maximum = maximum.max("time")
+            ```
+        """
+        return read.read_csv_chunks(
             cls,
-            "csv",
             filename,
+            chunksize,
             usecols,
             header,
             first_row,
@@ -224,6 +331,8 @@ class Analogs:
             skiprows,
             pandas_kwargs,
             attrs,
+            start,
+            stop,
         )
 
     @classmethod
@@ -242,6 +351,9 @@ class Analogs:
         skiprows: Optional[List[int]] = None,
         pandas_kwargs: Optional[dict] = None,
         attrs: Optional[dict] = None,
+        start: Optional[Union[int, float]] = None,
+        stop: Optional[Union[int, float]] = None,
+        chunks: Optional[Union[int, tuple, dict]] = None,
     ) -> xr.DataArray:
         """
         Analogs DataArray from a excel file.
@@ -261,6 +373,11 @@ class Analogs:
             skiprows: Line numbers to skip (0-indexed)
             pandas_kwargs: Keyword arguments to be passed to `pandas.read_excel`
             attrs: attrs to be passed to `xr.DataArray`. If attrs['rate'] is provided, compute the time accordingly
+            start: First frame (int) or time in seconds from the first frame (float, requires attrs['rate'])
+                of the time window to read. The rows before the window are skipped without being parsed
+            stop: Last frame (int, excluded) or time in seconds from the first frame (float, requires attrs['rate'])
+                of the time window to read. The rows after the window are not read
+            chunks: If specified, the data is backed by a dask array with these chunk sizes (see `xarray.DataArray.chunk`)
 
         Returns:
             Analogs `xarray.DataArray` with the specified data and coordinates
@@ -303,27 +420,38 @@ class Analogs:
             ```
 
         """
-        return read.read_csv_or_excel(
-            cls,
-            "excel",
-            filename,
-            usecols,
-            header,
-            first_row,
-            first_column,
-            time_column,
-            last_column_to_remove,
-            prefix_delimiter,
-            suffix_delimiter,
-            skiprows,
-            pandas_kwargs,
-            attrs,
-            sheet_name,
+        return utils.chunk(
+            read.read_csv_or_excel(
+                cls,
+                "excel",
+                filename,
+                usecols,
+                header,
+                first_row,
+                first_column,
+                time_column,
+                last_column_to_remove,
+                prefix_delimiter,
+                suffix_delimiter,
+                skiprows,
+                pandas_kwargs,
+                attrs,
+                sheet_name,
+                start,
+                stop,
+            ),
+            chunks,
         )
 
     @classmethod
     def from_sto(
-        cls, filename: Union[str, Path], end_header: Optional[bool] = None, **kwargs
+        cls,
+        filename: Union[str, Path],
+        end_header: Optional[bool] = None,
+        start: Optional[Union[int, float]] = None,
+        stop: Optional[Union[int, float]] = None,
+        chunks: Optional[Union[int, tuple, dict]] = None,
+        **kwargs,
     ) -> xr.DataArray:
         """
         Analogs DataArray from a sto file.
@@ -332,7 +460,10 @@ class Analogs:
             filename: Any valid string path
             end_header: Index where `endheader` appears (0 indexed).
                 If not provided, the index is automatically determined
+            start: First frame (int) or time in seconds from the first frame (float) of the time window to read
+            stop: Last frame (int, excluded) or time in seconds from the first frame (float) of the time window to read
             kwargs: Keyword arguments to be passed to `from_csv`
+            chunks: If specified, the data is backed by a dask array with these chunk sizes (see `xarray.DataArray.chunk`)
 
         Returns:
             Analogs `xarray.DataArray` with the specified data and coordinates
@@ -361,12 +492,27 @@ class Analogs:
             channels = [3, 4]
             analogs = Analogs.from_sto(data_path, usecols=channels)
             ```
+
+            To read only a time window, specify the first and last frames (int) or times in seconds (float):
+
+            ```python
+            analogs = Analogs.from_sto(data_path, start=0.5, stop=1.5)
+            ```
         """
-        return read.read_sto_or_mot(cls, filename, end_header, **kwargs)
+        return utils.chunk(
+            read.read_sto_or_mot(cls, filename, end_header, start, stop, **kwargs),
+            chunks,
+        )
 
     @classmethod
     def from_mot(
-        cls, filename: Union[str, Path], end_header: Optional[bool] = None, **kwargs
+        cls,
+        filename: Union[str, Path],
+        end_header: Optional[bool] = None,
+        start: Optional[Union[int, float]] = None,
+        stop: Optional[Union[int, float]] = None,
+        chunks: Optional[Union[int, tuple, dict]] = None,
+        **kwargs,
     ) -> xr.DataArray:
         """
         Analogs DataArray from a mot file.
@@ -374,7 +520,10 @@ class Analogs:
         Arguments:
             filename: Any valid string path
             end_header: Index where `endheader` appears (0 indexed). If not provided, the index is automatically determined.
+            start: First frame (int) or time in seconds from the first frame (float) of the time window to read
+            stop: Last frame (int, excluded) or time in seconds from the first frame (float) of the time window to read
             kwargs: Keyword arguments to be passed to `from_csv`
+            chunks: If specified, the data is backed by a dask array with these chunk sizes (see `xarray.DataArray.chunk`)
 
         Returns:
             Analogs `xarray.DataArray` with the specified data and coordinates
@@ -404,7 +553,10 @@ class Analogs:
             analogs = Analogs.from_mot(data_path, usecols=channels)
             ```
         """
-        return read.read_sto_or_mot(cls, filename, end_header, **kwargs)
+        return utils.chunk(
+            read.read_sto_or_mot(cls, filename, end_header, start, stop, **kwargs),
+            chunks,
+        )
 
     @classmethod
     def from_c3d(
@@ -414,6 +566,10 @@ class Analogs:
         prefix_delimiter: Optional[str] = None,
         suffix_delimiter: Optional[str] = None,
         attrs: Optional[dict] = None,
+        engine: str = "ezc3d",
+        start: Optional[Union[int, float]] = None,
+        stop: Optional[Union[int, float]] = None,
+        chunks: Optional[Union[int, tuple, dict]] = None,
     ) -> xr.DataArray:
         """
         Analogs DataArray from a c3d file.
@@ -425,6 +581,15 @@ class Analogs:
             prefix_delimiter: Delimiter that split each column name by its prefix (we keep only the column name)
             suffix_delimiter: Delimiter that split each column name by its suffix (we keep only the column name)
             attrs: attrs to be passed to xr.DataArray
+            engine: Parser used to read the file. `"ezc3d"` (default) reads the whole file with ezc3d.
+                `"native"` reads only the requested channels directly from the c3d data section,
+                so that the memory used scales with the selection and not with the file.
+                `"memmap"` maps the c3d data section in memory without reading it:
+                the values are read from the file only when they are accessed (e.g., after slicing a time window)
+            start: First frame (int) or time in seconds from the first frame (float) of the time window to read.
+                With the `"native"` and `"memmap"` engines, only the frames of the window are read from the file
+            stop: Last frame (int, excluded) or time in seconds from the first frame (float) of the time window to read
+            chunks: If specified, the data is backed by a dask array with these chunk sizes (see `xarray.DataArray.chunk`)
 
         Returns:
             Analogs `xarray.DataArray` with the specified data and coordinates
@@ -456,11 +621,88 @@ class Analogs:
             channels = ["1", "2", "3"]
             analogs = Analogs.from_c3d(data_path, usecols=channels, prefix_delimiter=".")
             ```
+
+            The `"native"` engine reads only the requested channels from the file,
+            which is much lighter on memory when selecting a few channels in a large file:
+
+            ```python
+            analogs = Analogs.from_c3d(
+                data_path, usecols=channels, prefix_delimiter=".", engine="native"
+            )
+            ```
+
+            For very long captures, the `"memmap"` engine does not read any data until it is needed.
+            Selecting a time window then only reads the corresponding part of the file:
+
+            ```python
+            analogs = Analogs.from_c3d(data_path, engine="memmap")
+            first_second = analogs.sel(time=slice(0, 1)).load()
+            ```
+
+            To read only a time window, specify the first and last frames (int) or times in seconds (float):
+
+            ```python
+            analogs = Analogs.from_c3d(data_path, engine="native", start=1.0, stop=2.0)
+            ```
         """
-        return read.read_c3d(
-            cls, filename, usecols, prefix_delimiter, suffix_delimiter, attrs
+        return utils.chunk(
+            read.read_c3d(
+                cls,
+                filename,
+                usecols,
+                prefix_delimiter,
+                suffix_delimiter,
+                attrs,
+                engine,
+                start,
+                stop,
+            ),
+            chunks,
         )
 
+    @classmethod
+    def from_c3d_many(
+        cls,
+        filenames: List[Union[str, Path]],
+        n_jobs: Optional[int] = None,
+        concat: bool = False,
+        **kwargs,
+    ) -> Union[List[Optional[xr.DataArray]], xr.DataArray]:
+        """
+        Analogs DataArrays from several c3d files read in parallel.
+
+        Arguments:
+            filenames: List of valid string paths
+            n_jobs: Number of processes used to read the files (defaults to the number of processors).
+                With `n_jobs=1`, the files are read one after the other in the current process
+            concat: If True, the files are concatenated along a new `trial` dimension
+                (the time and channel coordinates are aligned with an outer join)
+            kwargs: Keyword arguments passed to `Analogs.from_c3d`
+
+        Returns:
+            List of Analogs `xarray.DataArray` (`None` for the files that could not be read),
+                or a single Analogs `xarray.DataArray` with a `trial` dimension if `concat=True`
+
+        !!! note
+            A file that cannot be read does not stop the batch: a warning is raised with the error
+            and the file is skipped.
+
+        !!! example
+            ```python
+            from pyomeca import Analogs
+
+            data_paths = ["./tests/data/markers_analogs.c3d"] * 4
+            analogs = Analogs.from_c3d_many(data_paths, n_jobs=2)
+            ```
+
+            To get a single DataArray with a `trial` dimension:
+
+            ```python
+            analogs = Analogs.from_c3d_many(data_paths, n_jobs=2, concat=True, engine="native")
+            ```
+        """
+        return read.read_many(cls.from_c3d, filenames, n_jobs, concat, **kwargs)
+
     @staticmethod
     def _reshape_flat_array(array: Union[np.array, np.ndarray]) -> xr.DataArray:
         """
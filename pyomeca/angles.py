@@ -114,8 +114,10 @@ class Angles:
         Angles DataArray from a rototranslation matrix and specified angle sequence.
 
         Arguments:
-            rototrans: Rototranslation matrix created with pyomeca.Rototrans()
-            angle_sequence: Euler sequence of angles. Valid values are all permutations of "xyz"
+            rototrans: Rototranslation matrix created with pyomeca.Rototrans().
+                Extra dimensions (e.g., `segment` or `trial`) between `col` and `time` are kept in the output
+            angle_sequence: Euler sequence of angles. Valid values are all permutations of "xyz",
+                the proper Euler sequences ("xyx", "xzx", "yxy", "yzy", "zxz", "zyz") and "zyzz"
 
         Returns:
             Angles `xarray.DataArray` from the specified rototrans and angles sequence
@@ -234,6 +234,69 @@ class DataArrayAccessor(object):
         """
         return algebra.rms(self._obj)
 
+    def moving_average(self, window: int, step: int = 1) -> xr.DataArray:
+        """
+        Moving average along the time dimension.
+
+        The averages are computed from cumulative sums, in a time independent of the window length.
+        Windows containing missing values are missing.
+
+        Arguments:
+            window: Number of frames in each window
+            step: Number of frames between the beginning of two successive windows
+
+        Returns:
+            A `xarray.DataArray` containing the average of each window, the time being the center of the windows
+
+        !!! example
+            To get the average of windows of 100 frames every 10 frames:
+
+            ```python
+            from pyomeca import Analogs
+
+            analogs = Analogs.from_random_data(size=(16, 10_000))
+            averaged = analogs.meca.moving_average(window=100, step=10)
+            ```
+        """
+        return algebra.moving_average(self._obj, window, step)
+
+    def moving_rms(self, window: int, step: int = 1) -> xr.DataArray:
+        """
+        Moving root-mean-square along the time dimension.
+
+        The root-mean-squares are computed from cumulative sums, in a time independent of the window length.
+        Windows containing missing values are missing.
+
+        Arguments:
+            window: Number of frames in each window
+            step: Number of frames between the beginning of two successive windows
+
+        Returns:
+            A `xarray.DataArray` containing the root-mean-square of each window, the time being the center of the windows
+
+        !!! example
+            To get the RMS envelope of an EMG with windows of 100 ms every 10 ms:
+
+            ```python
+            import matplotlib.pyplot as plt
+
+            from pyomeca import Analogs
+
+            data_path = "./tests/data/markers_analogs.c3d"
+            muscles = ["Delt_ant", "Delt_med", "Delt_post"]
+            emg = Analogs.from_c3d(data_path, suffix_delimiter=".", usecols=muscles)
+
+            window = int(0.1 * emg.rate)
+            step = int(0.01 * emg.rate)
+            rms = emg.meca.moving_rms(window=window, step=step)
+            rms.plot.line(x="time")
+            plt.show()
+            ```
+
+            ![moving_rms](../images/api/moving_rms.svg)
+        """
+        return algebra.moving_rms(self._obj, window, step)
+
     def center(
         self, mu: Union[xr.DataArray, np.array, float, int] = None
     ) -> xr.DataArray:
@@ -373,11 +436,64 @@ class DataArrayAccessor(object):
 
             time_normalized = analogs.meca.time_normalize(time_vector=np.linspace(0, 200, 300))
             ```
+
+        !!! notes
+            Rototrans are interpolated with spherical linear interpolation (SLERP) of their quaternions,
+            so that the interpolated matrices are still rotation matrices.
         """
         return interp.time_normalize(
             self._obj, time_vector, n_frames, norm_time=norm_time
         )
 
+    def downsample(self, rate: Union[int, float], method: str = "mean") -> xr.DataArray:
+        """
+        Downsampling to a rate that divides the rate of the data, without interpolation.
+
+        Typically used to align the analogs of a c3d file on the markers frames.
+        The samples are grouped by frame of the new rate with a reshape, which is much faster than `time_normalize`
+        on long and wide arrays.
+
+        Arguments:
+            rate: Desired rate. The `rate` attribute of the data must be a multiple of `rate`
+            method: `mean` or `rms` of the samples of each frame (the last incomplete frame is dropped),
+                or `decimate` for a polyphase decimation with an anti-aliasing low-pass filter
+
+        Returns:
+            A `xarray.DataArray` at `rate`, each frame being timed at its first sample
+
+        !!! example
+            To get the EMG envelope at the markers rate:
+
+            ```python
+            import matplotlib.pyplot as plt
+
+            from pyomeca import Analogs, Markers
+
+            data_path = "./tests/data/markers_analogs.c3d"
+            muscles = ["Delt_ant", "Delt_med", "Delt_post"]
+            emg = Analogs.from_c3d(data_path, suffix_delimiter=".", usecols=muscles)
+            markers = Markers.from_c3d(data_path, prefix_delimiter=":")
+
+            emg_rms = emg.meca.downsample(rate=markers.rate, method="rms")
+            print(emg_rms.time.size == markers.time.size)  # True
+
+            emg_rms.plot.line(x="time")
+            plt.show()
+            ```
+
+            ![downsample](../images/api/downsample.svg)
+
+            To keep the shape of the signal while avoiding aliasing, use a polyphase decimation:
+
+            ```python
+            decimated = emg.meca.downsample(rate=markers.rate, method="decimate")
+            ```
+
+        !!! notes
+            With `decimate`, a missing value spreads over the length of the anti-aliasing filter.
+        """
+        return interp.downsample(self._obj, rate, method)
+
     # filter ------------------------------------
     def low_pass(
         self, freq: Union[int, float], order: int, cutoff: Union[int, float, np.array]
@@ -543,13 +659,76 @@ class DataArrayAccessor(object):
         return filter.band_pass(self._obj, freq, order, cutoff)
 
     # signal processing misc --------------------
-    def fft(self, freq: Union[int, float], only_positive: bool = True) -> xr.DataArray:
+    def envelope(
+        self,
+        freq: Union[int, float],
+        order: int,
+        cutoff: Union[int, float, np.array],
+        band_pass_cutoff: Optional[Union[list, tuple, np.array]] = None,
+        band_pass_order: Optional[int] = None,
+    ) -> xr.DataArray:
+        """
+        Linear envelope: the signal is rectified and low-pass filtered (with an optional band-pass filter before).
+
+        The filters and the rectification are applied to the underlying data in one function,
+        without creating intermediate DataArrays (e.g., as `band_pass`, `abs` and `low_pass` would).
+
+        Arguments:
+            freq: Sampling frequency (usually stored in `data.rate`)
+            order: Order of the low-pass filter
+            cutoff: Cut-off frequency of the low-pass filter
+            band_pass_cutoff: Lower and upper cut-off frequencies of the band-pass filter applied before the rectification
+            band_pass_order: Order of the band-pass filter (`order` by default)
+
+        Returns:
+            The envelope of the `xarray.DataArray`
+
+        !!! example
+            ```python
+            import matplotlib.pyplot as plt
+
+            from pyomeca import Analogs
+
+            data_path = "./tests/data/markers_analogs.c3d"
+            muscles = ["Delt_ant", "Delt_med", "Delt_post"]
+            emg = Analogs.from_c3d(data_path, suffix_delimiter=".", usecols=muscles)
+
+            envelope = emg.meca.envelope(
+                freq=emg.rate,
+                order=4,
+                cutoff=5,
+                band_pass_cutoff=[10, 425],
+                band_pass_order=2,
+            )
+            envelope.plot.line(x="time")
+            plt.show()
+            ```
+
+            ![envelope](../images/api/envelope.svg)
+        """
+        return filter.envelope(
+            self._obj, freq, order, cutoff, band_pass_cutoff, band_pass_order
+        )
+
+    def fft(
+        self,
+        freq: Union[int, float],
+        only_positive: bool = True,
+        pad: bool = False,
+        workers: Optional[int] = None,
+    ) -> xr.DataArray:
         """
         Performs a discrete Fourier Transform and return a DataArray with the corresponding amplitudes and frequencies.
 
+        The transform runs along the `time` dimension, whatever the other dimensions (e.g., `trial`).
+        With `only_positive=True`, a real FFT is used (half the computation and memory of a complex FFT).
+
         Arguments:
             freq: Sampling frequency (usually stored in `array.attrs["rate"]`)
             only_positive: If `True`, returns only the positive frequencies
+            pad: If `True`, the signal is zero-padded to the next length for which the FFT is fast
+                (a finer frequency resolution, with amplitudes still relative to the signal length)
+            workers: Number of threads used to compute the FFTs of the channels (-1 for all the CPUs)
 
         Returns:
             A `xarray.DataArray` with the corresponding amplitudes and frequencies
@@ -593,8 +772,150 @@ class DataArrayAccessor(object):
             ```
 
             ![fft](../images/api/fft.svg)
+
+            The FFTs of many channels can be padded and computed on several threads:
+
+            ```python
+            analogs = Analogs.from_random_data(size=(64, 10_007))
+            amplitudes = analogs.meca.fft(freq=1000, pad=True, workers=-1)
+            ```
         """
-        return misc.fft(self._obj, freq, only_positive)
+        return misc.fft(self._obj, freq, only_positive, pad, workers)
+
+    def spectrogram(
+        self,
+        freq: Union[int, float],
+        window_length: int,
+        step: Optional[int] = None,
+        window: str = "hann",
+        workers: Optional[int] = None,
+    ) -> xr.DataArray:
+        """
+        Power spectral density of overlapping windows (short-time Fourier transform).
+
+        Each window is detrended (mean removed), tapered and transformed with a real FFT.
+        The overlapping windows are views on the signal, computed in one batched FFT.
+
+        Arguments:
+            freq: Sampling frequency (usually in `data.rate`)
+            window_length: Number of frames in each window
+            step: Number of frames between the beginning of two successive windows (half a window by default)
+            window: Tapering window (see `scipy.signal.get_window`)
+            workers: Number of threads used to compute the FFTs of the windows (-1 for all the CPUs)
+
+        Returns:
+            The power spectral densities, with the `window_time` (center of the windows) and `freq` dimensions
+                instead of the `time` dimension
+
+        !!! example
+            ```python
+            import matplotlib.pyplot as plt
+
+            from pyomeca import Analogs
+
+            data_path = "./tests/data/markers_analogs.c3d"
+            emg = Analogs.from_c3d(data_path, suffix_delimiter=".", usecols=["Delt_ant"])
+
+            psd = emg.meca.spectrogram(freq=emg.rate, window_length=256)
+            psd.sel(freq=slice(0, 500)).plot(x="window_time", y="freq", robust=True)
+            plt.show()
+            ```
+
+            ![spectrogram](../images/api/spectrogram.svg)
+
+            The spectrogram can then be summarized without computing the FFTs again:
+
+            ```python
+            welch = psd.mean("window_time")
+            median_frequency = psd.meca.median_frequency()
+            mean_frequency = psd.meca.mean_frequency()
+            ```
+        """
+        return misc.spectrogram(self._obj, freq, window_length, step, window, workers)
+
+    def welch(
+        self,
+        freq: Union[int, float],
+        window_length: int,
+        step: Optional[int] = None,
+        window: str = "hann",
+        workers: Optional[int] = None,
+    ) -> xr.DataArray:
+        """
+        Power spectral density estimated with the Welch method (average of the spectrogram windows).
+
+        Arguments:
+            freq: Sampling frequency (usually in `data.rate`)
+            window_length: Number of frames in each window
+            step: Number of frames between the beginning of two successive windows (half a window by default)
+            window: Tapering window (see `scipy.signal.get_window`)
+            workers: Number of threads used to compute the FFTs of the windows (-1 for all the CPUs)
+
+        Returns:
+            The power spectral density, with the `freq` dimension instead of the `time` dimension
+
+        !!! example
+            ```python
+            from pyomeca import Analogs
+
+            analogs = Analogs.from_random_data(size=(16, 10_000))
+            psd = analogs.meca.welch(freq=1000, window_length=512)
+            ```
+        """
+        return misc.spectrogram(
+            self._obj, freq, window_length, step, window, workers
+        ).mean("window_time")
+
+    def median_frequency(self) -> xr.DataArray:
+        """
+        Median frequency of power spectral densities (frequency dividing the power in two halves).
+
+        Returns:
+            The median frequencies, without the `freq` dimension
+
+        !!! example
+            To follow the median frequency of an EMG during a fatiguing task:
+
+            ```python
+            import matplotlib.pyplot as plt
+
+            from pyomeca import Analogs
+
+            data_path = "./tests/data/markers_analogs.c3d"
+            emg = Analogs.from_c3d(data_path, suffix_delimiter=".", usecols=["Delt_ant"])
+
+            psd = emg.meca.spectrogram(freq=emg.rate, window_length=1024)
+            psd.meca.median_frequency().plot.line(x="window_time")
+            plt.show()
+            ```
+
+            ![median_frequency](../images/api/median_frequency.svg)
+
+        Note:
+            `median_frequency` works on power spectral densities (e.g., from `spectrogram` or `welch`).
+        """
+        return misc.median_frequency(self._obj)
+
+    def mean_frequency(self) -> xr.DataArray:
+        """
+        Mean frequency of power spectral densities (frequencies weighted by their power).
+
+        Returns:
+            The mean frequencies, without the `freq` dimension
+
+        !!! example
+            ```python
+            from pyomeca import Analogs
+
+            analogs = Analogs.from_random_data(size=(16, 10_000))
+            psd = analogs.meca.spectrogram(freq=1000, window_length=512)
+            mean_frequency = psd.meca.mean_frequency()
+            ```
+
+        Note:
+            `mean_frequency` works on power spectral densities (e.g., from `spectrogram` or `welch`).
+        """
+        return misc.mean_frequency(self._obj)
 
     def detect_onset(
         self,
@@ -659,11 +980,65 @@ class DataArrayAccessor(object):
         !!! warning
             `detect_onset` works only for 1-dimensional data.
             For example, you can select a dimension using `analogs.sel(channel='EMG1')` or `analogs.isel(channel=0)`.
+            Use `detect_onsets` to detect the onsets of all the channels at once.
         """
         return misc.detect_onset(
             self._obj, threshold, n_above, n_below, threshold2, n_above2
         )
 
+    def detect_onsets(
+        self,
+        threshold: Union[float, int, xr.DataArray],
+        n_above: int = 1,
+        n_below: int = 0,
+        threshold2: Union[float, int, xr.DataArray] = None,
+        n_above2: int = 1,
+    ) -> pd.DataFrame:
+        """
+        Detects onsets based on amplitude threshold along the time dimension of every channel, trial, etc. at once.
+
+        Arguments:
+            threshold: minimum amplitude to detect.
+                Could be a `xarray.DataArray` with a value by channel (e.g., `array.mean("time")`)
+            n_above: minimum number of continuous samples >= `threshold` to detect
+            n_below: minimum number of continuous samples below `threshold`
+                that will be ignored in the detection of `x` >= `threshold`
+            threshold2: minimum amplitude of `n_above2` values in `x` to detect
+            n_above2: minimum number of samples >= `threshold2` to detect
+
+        Returns:
+            A `pandas.DataFrame` with one row by onset event:
+                a column by dimension other than `time` (e.g., `channel`) followed by the initial (`start`)
+                and final (`stop`) indexes of the event
+
+        !!! example
+            To detect the bursts of every channel of an `Analogs`:
+
+            ```python
+            from pyomeca import Analogs
+
+            emg = Analogs.from_random_data(size=(16, 1000)).meca.abs()
+            onsets = emg.meca.detect_onsets(threshold=emg.mean("time"), n_above=10, n_below=5)
+            ```
+
+            Any other dimension, such as trials, is handled the same way:
+
+            ```python
+            import xarray as xr
+
+            trials = xr.concat([emg, emg * 2], dim="trial")
+            onsets = trials.meca.detect_onsets(threshold=1, n_above=10)
+            n_onsets_by_trial = onsets.groupby("trial").size()
+            ```
+
+        Note:
+            It gives the same events as `detect_onset` for each one-dimensional series,
+            without a Python loop over the series or the events.
+        """
+        return misc.detect_onsets(
+            self._obj, threshold, n_above, n_below, threshold2, n_above2
+        )
+
     def detect_outliers(self, threshold: int = 3) -> xr.DataArray:
         """
         Detects data points that are `threshold` times the standard deviation from the mean.
@@ -754,6 +1129,90 @@ class DataArrayAccessor(object):
         """
         return markers.rotate_markers(self._obj, rt)
 
+    def inv(self) -> xr.DataArray:
+        """
+        Inverse of a rototranslation matrix.
+
+        The inverse is computed from the rigid-body structure of the matrix (transposed rotation and rotated translation)
+        for all frames and extra dimensions (e.g., segments) at once.
+
+        Returns:
+            The inverse Rototrans `xarray.DataArray`
+
+        !!! example
+            To express the global reference frame in a segment reference frame:
+
+            ```python
+            from pyomeca import Rototrans
+
+            rt = Rototrans.from_random_data()
+            rt_inv = rt.meca.inv()
+            ```
+
+        Note:
+            `inv` works only for rototranslation matrices (created with `pyomeca.Rototrans`).
+        """
+        return rototrans.inverse(self._obj)
+
+    def compose(self, other: xr.DataArray) -> xr.DataArray:
+        """
+        Compose two rototranslation matrices (`self @ other` for each frame).
+
+        Dimensions are matched by name, so a rototrans with extra dimensions (e.g., `segment`)
+        can be composed with a single rototrans.
+
+        Arguments:
+            other: Rototrans applied after the rototrans (i.e., expressed in its reference frame)
+
+        Returns:
+            The composed Rototrans `xarray.DataArray`
+
+        !!! example
+            To get the kinematics of a child segment relative to its parent segment:
+
+            ```python
+            from pyomeca import Rototrans
+
+            parent = Rototrans.from_random_data()
+            child = Rototrans.from_random_data()
+
+            joint = parent.meca.inv().meca.compose(child)
+            ```
+
+        Note:
+            `compose` works only for rototranslation matrices (created with `pyomeca.Rototrans`).
+        """
+        return rototrans.compose(self._obj, other)
+
+    def to_quaternions(self) -> xr.DataArray:
+        """
+        Quaternions and translations of a rototranslation matrix.
+
+        Each frame is described by 7 values (`qw`, `qx`, `qy`, `qz`, `tx`, `ty` and `tz`) instead of 16.
+        The scalar part `qw` is positive.
+
+        Returns:
+            A `xarray.DataArray` with the `axis` dimension containing the quaternions and translations
+
+        !!! example
+            ```python
+            from pyomeca import Rototrans
+
+            rt = Rototrans.from_random_data()
+            quaternions = rt.meca.to_quaternions()
+            ```
+
+            Use `Rototrans.from_quaternions` to get back the rototranslation matrix:
+
+            ```python
+            rt_from_quaternions = Rototrans.from_quaternions(quaternions)
+            ```
+
+        Note:
+            `to_quaternions` works only for rototranslation matrices (created with `pyomeca.Rototrans`).
+        """
+        return rototrans.quaternions_from_rototrans(self._obj)
+
     @property
     def rotation(self) -> xr.DataArray:
         return rototrans.rotation_getter(self._obj)
@@ -0,0 +1,165 @@
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import xarray as xr
+
+from pyomeca.io import read
+from pyomeca.processing import force_plates, interp
+
+
+class ForcePlates:
+    def __init__(
+        self,
+        corners: np.array,
+        origins: np.array,
+        channels: np.array,
+        calibration_matrices: Optional[np.array] = None,
+        types: Optional[np.array] = None,
+    ):
+        """
+        Force platforms described by the parameters of the FORCE_PLATFORM group of the c3d format,
+        used to compute the forces, moments and centers of pressure of all the plates at once.
+
+        Arguments:
+            corners: Position (3, 4, n_plates) of the corners of the plates in the global reference frame,
+                numbered in the (+x, +y), (-x, +y), (-x, -y) and (+x, -y) quadrants of each plate
+            origins: Vector (3, n_plates) from the center of the plate surface to the plate origin,
+                in the plate reference frame
+            channels: Labels (6, n_plates) of the analog channels of each plate
+            calibration_matrices: Calibration matrices (6, 6, n_plates) converting the channels of type 4 plates
+                into forces and moments (required when there are type 4 plates)
+            types: Type of each plate: 2 (forces and moments channels) or 4 (channels calibrated with a matrix).
+                All the plates are of type 2 by default
+
+        !!! example
+            To describe a plate of 500 by 600 mm whose origin is 40 mm under its surface:
+
+            ```python
+            import numpy as np
+
+            from pyomeca import ForcePlates
+
+            plates = ForcePlates(
+                corners=np.array([[500, 0, 0, 500], [600, 600, 0, 0], [0, 0, 0, 0]])[
+                    ..., np.newaxis
+                ],
+                origins=np.array([[0], [0], [-40]]),
+                channels=np.array([["Fx"], ["Fy"], ["Fz"], ["Mx"], ["My"], ["Mz"]]),
+            )
+            ```
+        """
+        self.corners = np.asarray(corners, dtype=float)
+        self.origins = np.asarray(origins, dtype=float)
+        self.channels = np.asarray(channels)
+        self.calibration_matrices = (
+            None
+            if calibration_matrices is None
+            else np.asarray(calibration_matrices, dtype=float)
+        )
+        self.types = None if types is None else np.asarray(types)
+
+    @classmethod
+    def from_c3d(cls, filename: Union[str, Path]) -> "ForcePlates":
+        """
+        Force platforms from the FORCE_PLATFORM parameters of a c3d file.
+
+        Only the parameters section of the file is read.
+
+        Arguments:
+            filename: Any valid string path
+
+        Returns:
+            The `ForcePlates` in use in the c3d file
+
+        !!! example
+            ```python
+            from pyomeca import Analogs, ForcePlates
+
+            data_path = "./tests/data/force_plates.c3d"
+            plates = ForcePlates.from_c3d(data_path)
+            analogs = Analogs.from_c3d(data_path)
+
+            forces = plates.compute(analogs)
+            ```
+        """
+        return cls(**read.read_c3d_force_platforms(filename))
+
+    def wrenches(self, analogs: xr.DataArray) -> xr.DataArray:
+        """
+        Forces and moments of all the plates, at the plates origins and in the plates reference frames.
+
+        The channels of all the plates are calibrated with one batched matrix product.
+
+        Arguments:
+            analogs: Analogs containing the channels of the plates
+
+        Returns:
+            A `xarray.DataArray` with the `axis` (`Fx`, `Fy`, `Fz`, `Mx`, `My`, `Mz`), `plate` and `time` dimensions
+
+        !!! example
+            ```python
+            from pyomeca import Analogs, ForcePlates
+
+            data_path = "./tests/data/force_plates.c3d"
+            plates = ForcePlates.from_c3d(data_path)
+            analogs = Analogs.from_c3d(data_path)
+
+            wrenches = plates.wrenches(analogs)
+            ```
+        """
+        return force_plates.wrenches(
+            analogs, self.channels, self.calibration_matrices, self.types
+        )
+
+    def compute(
+        self,
+        analogs: xr.DataArray,
+        threshold: Union[int, float] = 0,
+        rate: Optional[Union[int, float]] = None,
+    ) -> xr.DataArray:
+        """
+        Forces, moments, centers of pressure and free moments of all the plates in the global reference frame.
+
+        Arguments:
+            analogs: Analogs containing the channels of the plates
+            threshold: Centers of pressure and free moments are missing when the vertical force of the plate
+                is not larger than `threshold` (in absolute value)
+            rate: If specified, the forces and moments are averaged over the analog samples of each frame at
+                this rate (e.g., the markers rate) before computing the centers of pressure.
+                The analogs rate must be a multiple of `rate`
+
+        Returns:
+            A `xarray.DataArray` with the `axis`, `plate` and `time` dimensions.
+                The `axis` dimension contains the forces (`Fx`, `Fy`, `Fz`), the moments at the center of the plate surface
+                (`Mx`, `My`, `Mz`), the center of pressure (`COPx`, `COPy`, `COPz`) and the free moment (`Tz`)
+
+        !!! example
+            To get the vertical force and the center of pressure of the plates at the markers rate:
+
+            ```python
+            import matplotlib.pyplot as plt
+
+            from pyomeca import Analogs, ForcePlates, Markers
+
+            data_path = "./tests/data/force_plates.c3d"
+            plates = ForcePlates.from_c3d(data_path)
+            analogs = Analogs.from_c3d(data_path)
+            markers = Markers.from_c3d(data_path)
+
+            forces = plates.compute(analogs, threshold=10, rate=markers.rate)
+
+            fig, axes = plt.subplots(ncols=2, figsize=(10, 4))
+            forces.sel(axis="Fz").plot.line(x="time", ax=axes[0])
+            forces.sel(axis="COPx").plot.line(x="time", ax=axes[1])
+            plt.show()
+            ```
+
+            ![compute](../images/api/compute.svg)
+        """
+        wrench = self.wrenches(analogs)
+        if rate is not None:
+            wrench = interp.downsample(wrench, rate, method="mean")
+        return force_plates.forces_moments_cop(
+            wrench, self.corners, self.origins, threshold
+        )
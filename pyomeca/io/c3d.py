@@ -0,0 +1,283 @@
+from pathlib import Path
+from typing import Union, Optional, List, Tuple
+
+import numpy as np
+from xarray.backends import BackendArray
+from xarray.core import indexing
+
+BLOCK_SIZE = 512
+INTEL, DEC, MIPS = 84, 85, 86
+BYTES_BY_BLOCK_TO_READ = 2**23
+
+
+def read_c3d_layout(filename: Union[str, Path]) -> dict:
+    """
+    Parse the header and the parameter section of a c3d file without touching its data section.
+    The returned dict describes where and how the point and analog values are stored in the file.
+    """
+    with open(filename, "rb") as f:
+        header = f.read(BLOCK_SIZE)
+        parameter_block = header[0]
+        f.seek((parameter_block - 1) * BLOCK_SIZE)
+        parameter_header = f.read(4)
+        processor = parameter_header[3]
+        if processor == DEC:
+            raise NotImplementedError(
+                "c3d files written by a DEC processor are not supported by the native engine. "
+                "Use engine='ezc3d' instead."
+            )
+        endian = ">" if processor == MIPS else "<"
+        f.seek((parameter_block - 1) * BLOCK_SIZE)
+        parameters = _parse_parameters(f.read(parameter_header[2] * BLOCK_SIZE), endian)
+
+    words = np.frombuffer(header[:24], dtype=f"{endian}u2")
+    scale = np.frombuffer(header[12:16], dtype=f"{endian}f4").item()
+    frame_rate = np.frombuffer(header[20:24], dtype=f"{endian}f4").item()
+
+    n_points = int(words[1])
+    n_analogs_by_frame = int(words[2])
+    first_frame, last_frame = int(words[3]) - 1, int(words[4]) - 1
+    actual_end_field = parameters.get("TRIAL", {}).get("ACTUAL_END_FIELD")
+    if actual_end_field is not None and words[4] == np.iinfo(np.uint16).max:
+        # the number of frames does not fit in the header, it is stored as two 16-bits words
+        end_field = np.asarray(actual_end_field).astype(np.uint16)
+        last_frame = int(end_field[0]) + int(end_field[1]) * 2**16 - 1
+
+    analog_by_frame = int(words[9])
+    n_analog_channels = n_analogs_by_frame // analog_by_frame if analog_by_frame else 0
+
+    dtype = np.dtype(f"{endian}f4") if scale < 0 else np.dtype(f"{endian}i2")
+    words_by_frame = n_points * 4 + n_analogs_by_frame
+
+    analog = parameters.get("ANALOG", {})
+    return {
+        "parameters": parameters,
+        "endian": endian,
+        "dtype": dtype,
+        "data_offset": (int(words[8]) - 1) * BLOCK_SIZE,
+        "words_by_frame": words_by_frame,
+        "frame_size": words_by_frame * dtype.itemsize,
+        "n_frames": last_frame - first_frame + 1,
+        "first_frame": first_frame,
+        "last_frame": last_frame,
+        "rate": frame_rate,
+        "point_scale": abs(scale) if scale >= 0 else 1.0,
+        "n_points": n_points,
+        "n_analog_channels": n_analog_channels,
+        "analog_by_frame": analog_by_frame,
+        "analog_offset": _broadcast_parameter(
+            analog.get("OFFSET", 0), n_analog_channels
+        ),
+        "analog_scale": _broadcast_parameter(analog.get("SCALE", 1), n_analog_channels)
+        * np.asarray(analog.get("GEN_SCALE", 1), dtype=float).ravel()[0],
+        "analog_unsigned": dtype.kind == "i" and analog.get("FORMAT") == "UNSIGNED",
+    }
+
+
+def read_c3d_frames(
+    filename: Union[str, Path],
+    layout: dict,
+    group: str,
+    idx: Optional[List[int]] = None,
+    first: int = 0,
+    last: Optional[int] = None,
+) -> np.array:
+    """
+    Read the requested channels (`idx`) between the frames `first` and `last` (excluded) of a c3d file.
+    The data section is read by blocks of frames so that only the selected values are kept in memory.
+    Returns a (4 x channels x frames) array for the `POINT` group and a (channels x frames) array for `ANALOG`.
+    """
+    last = layout["n_frames"] if last is None else last
+    n_frames = max(last - first, 0)
+
+    idx, columns = _group_columns(layout, group, idx)
+    data = _empty_group_array(layout, group, idx.size, n_frames)
+    by_frame = 1 if group == "POINT" else layout["analog_by_frame"]
+
+    frames_by_block = max(BYTES_BY_BLOCK_TO_READ // max(layout["frame_size"], 1), 1)
+    with open(filename, "rb") as f:
+        f.seek(layout["data_offset"] + first * layout["frame_size"])
+        for block_first in range(0, n_frames, frames_by_block):
+            block_last = min(block_first + frames_by_block, n_frames)
+            n_block = block_last - block_first
+            block = np.fromfile(
+                f, dtype=layout["dtype"], count=n_block * layout["words_by_frame"]
+            ).reshape(n_block, layout["words_by_frame"])
+            _fill_group(
+                data[..., block_first * by_frame : block_last * by_frame],
+                block[:, columns],
+                group,
+                idx,
+                layout,
+            )
+    return data
+
+
+class C3DMemmapArray(BackendArray):
+    """
+    Lazy (channels x frames) view of a c3d data section backed by a `numpy.memmap`.
+    Only the frames covered by an indexing operation are read from the file and scaled.
+    """
+
+    def __init__(
+        self,
+        filename: Union[str, Path],
+        layout: dict,
+        group: str,
+        idx: Optional[List[int]] = None,
+    ):
+        self.layout = layout
+        self.group = group
+        self.idx, _ = _group_columns(layout, group, idx)
+        self.by_frame = 1 if group == "POINT" else layout["analog_by_frame"]
+        self.memmap = np.memmap(
+            filename,
+            dtype=layout["dtype"],
+            mode="r",
+            offset=layout["data_offset"],
+            shape=(layout["n_frames"], layout["words_by_frame"]),
+        )
+        n_samples = layout["n_frames"] * self.by_frame
+        self.shape = (
+            (4, self.idx.size, n_samples)
+            if group == "POINT"
+            else (self.idx.size, n_samples)
+        )
+        self.dtype = np.dtype(float)
+
+    def __getitem__(self, key: indexing.ExplicitIndexer) -> np.array:
+        return indexing.explicit_indexing_adapter(
+            key, self.shape, indexing.IndexingSupport.BASIC, self._getitem
+        )
+
+    def _getitem(self, key: tuple) -> np.array:
+        channel_key, time_key = key[-2:]
+        idx = np.atleast_1d(self.idx[channel_key])
+        samples = np.atleast_1d(range(self.shape[-1])[time_key])
+        _, columns = _group_columns(self.layout, self.group, idx)
+
+        first = samples.min() // self.by_frame if samples.size else 0
+        last = samples.max() // self.by_frame + 1 if samples.size else 0
+        data = _empty_group_array(self.layout, self.group, idx.size, last - first)
+        # only the pages of the requested frames are read from the file
+        _fill_group(
+            data, self.memmap[first:last, columns], self.group, idx, self.layout
+        )
+        data = data[..., samples - first * self.by_frame]
+
+        if self.group == "POINT":
+            data = data[key[0]]
+        return data[
+            (...,) + tuple(0 if isinstance(k, int) else slice(None) for k in key[-2:])
+        ]
+
+
+def _group_columns(
+    layout: dict, group: str, idx: Optional[List[int]] = None
+) -> Tuple[np.array, np.array]:
+    if group == "POINT":
+        idx = np.arange(layout["n_points"]) if idx is None else np.asarray(idx)
+        columns = (idx[:, np.newaxis] * 4 + np.arange(4)).ravel()
+    else:
+        idx = np.arange(layout["n_analog_channels"]) if idx is None else np.asarray(idx)
+        columns = (
+            layout["n_points"] * 4
+            + np.arange(layout["analog_by_frame"])[:, np.newaxis]
+            * layout["n_analog_channels"]
+            + idx
+        ).ravel()
+    return idx, columns
+
+
+def _empty_group_array(layout: dict, group: str, n_idx: int, n_frames: int) -> np.array:
+    if group == "POINT":
+        return np.ones((4, n_idx, n_frames))
+    return np.empty((n_idx, n_frames * layout["analog_by_frame"]))
+
+
+def _fill_group(
+    out: np.array, block: np.array, group: str, idx: np.array, layout: dict
+):
+    if group == "POINT":
+        _fill_points(out, block, layout)
+    else:
+        _fill_analogs(out, block, idx, layout)
+
+
+def _fill_points(out: np.array, block: np.array, layout: dict):
+    block = block.reshape(block.shape[0], -1, 4).astype(float)
+    residuals = block[..., 3]
+    out[:3] = block[..., :3].transpose(2, 1, 0) * layout["point_scale"]
+    # a negative residual flags an invalid point
+    out[:3, residuals.T < 0] = np.nan
+
+
+def _fill_analogs(out: np.array, block: np.array, idx: np.array, layout: dict):
+    if layout["analog_unsigned"]:
+        block = block.view(block.dtype.str.replace("i", "u"))
+    block = block.reshape(-1, idx.size).T.astype(float)
+    out[:] = (block - layout["analog_offset"][idx, np.newaxis]) * layout[
+        "analog_scale"
+    ][idx, np.newaxis]
+
+
+def _broadcast_parameter(value, size: int) -> np.array:
+    value = np.asarray(value, dtype=float).ravel()
+    if value.size == 0:
+        return np.ones(size)
+    if value.size < size:
+        value = np.resize(value, size)
+    return value[:size]
+
+
+def _parse_parameters(section: bytes, endian: str) -> dict:
+    groups, parameters = {}, []
+    position = 4
+    while position < len(section):
+        n_char, group_id = np.frombuffer(section[position : position + 2], dtype="i1")
+        n_char = abs(int(n_char))
+        if n_char == 0 or group_id == 0:
+            break
+        name = section[position + 2 : position + 2 + n_char].decode("latin-1").upper()
+        offset_position = position + 2 + n_char
+        offset = np.frombuffer(
+            section[offset_position : offset_position + 2], dtype=f"{endian}i2"
+        ).item()
+        if group_id < 0:
+            groups[-group_id] = name
+        else:
+            parameters.append(
+                (group_id, name, _parse_parameter(section, offset_position + 2, endian))
+            )
+        if offset == 0:
+            break
+        position = offset_position + offset
+
+    parsed = {name: {} for name in groups.values()}
+    for group_id, name, value in parameters:
+        parsed.setdefault(groups.get(group_id, f"{group_id}"), {})[name] = value
+    return parsed
+
+
+def _parse_parameter(section: bytes, position: int, endian: str):
+    data_type = np.frombuffer(section[position : position + 1], dtype="i1").item()
+    n_dims = section[position + 1]
+    dims = list(section[position + 2 : position + 2 + n_dims])
+    position += 2 + n_dims
+    n_values = int(np.prod(dims)) if dims else 1
+    raw = section[position : position + n_values * abs(data_type)]
+
+    if data_type == -1:
+        if len(dims) <= 1:
+            return raw.decode("latin-1").strip()
+        length = dims[0]
+        if length == 0:
+            # array of empty strings
+            return [""] * int(np.prod(dims[1:]))
+        return [
+            raw[i : i + length].decode("latin-1").strip()
+            for i in range(0, len(raw), length)
+        ]
+    dtype = {1: "i1", 2: f"{endian}i2", 4: f"{endian}f4"}[data_type]
+    values = np.frombuffer(raw, dtype=dtype)
+    return values.reshape(dims, order="F") if len(dims) > 1 else values
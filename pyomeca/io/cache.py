@@ -0,0 +1,173 @@
+import functools
+import hashlib
+import inspect
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Union, Callable
+
+import numpy as np
+import xarray as xr
+
+_settings = {"directory": None, "max_size": 2**30, "depth": 0}
+
+
+def enable(directory: Union[str, Path], max_size: int = 2**30):
+    """
+    Cache the DataArrays read from files in `directory` (netCDF files).
+    A file read again with the same arguments is loaded from the cache as long as it was not modified
+    (same path, modification time and size). The least recently used entries are removed
+    when the cache is larger than `max_size` bytes.
+
+    ```python
+    from pyomeca import Markers
+    from pyomeca.io import cache
+
+    cache.enable("~/.cache/pyomeca", max_size=2 ** 30)
+    markers = Markers.from_c3d("trial.c3d")  # parsed and stored
+    markers = Markers.from_c3d("trial.c3d")  # loaded from the cache
+    ```
+    """
+    directory = Path(directory).expanduser()
+    directory.mkdir(parents=True, exist_ok=True)
+    _settings.update(directory=directory, max_size=max_size)
+
+
+def disable():
+    """Stop reading from and writing to the cache (the cached files are kept)."""
+    _settings["directory"] = None
+
+
+def clear():
+    """Remove all the cached files."""
+    directory = _settings["directory"]
+    if directory is not None and directory.exists():
+        shutil.rmtree(directory)
+        directory.mkdir(parents=True)
+
+
+def cached(read_function: Callable) -> Callable:
+    """Cache the result of a `read_*` function of `pyomeca.io.read` taking a `filename` argument."""
+    signature = inspect.signature(read_function)
+
+    @functools.wraps(read_function)
+    def wrapper(caller, *args, **kwargs):
+        directory = _settings["directory"]
+        arguments = signature.bind(caller, *args, **kwargs)
+        arguments.apply_defaults()
+        arguments = dict(arguments.arguments)
+        # readers calling other readers (e.g., sto -> csv) are only cached at the outermost call,
+        # and the lazy memmap arrays are not loaded to be cached
+        if (
+            directory is None
+            or _settings["depth"]
+            or arguments.get("engine") == "memmap"
+        ):
+            return _call(read_function, caller, *args, **kwargs)
+
+        entry = directory / f"{_key(read_function, arguments)}.nc"
+        if entry.exists():
+            try:
+                # the modification time is used as the last access time of the LRU eviction
+                os.utime(entry)
+                return _load(entry)
+            except OSError:
+                # evicted by another process in the meantime: the file is parsed again
+                pass
+
+        data = _call(read_function, caller, *args, **kwargs)
+        _store(data, entry)
+        return data
+
+    return wrapper
+
+
+def _call(read_function: Callable, caller, *args, **kwargs):
+    _settings["depth"] += 1
+    try:
+        return read_function(caller, *args, **kwargs)
+    finally:
+        _settings["depth"] -= 1
+
+
+def _key(read_function: Callable, arguments: dict) -> str:
+    filename = Path(arguments.pop("filename"))
+    stat = filename.stat()
+    arguments["caller"] = arguments["caller"].__name__
+    description = repr(
+        (
+            read_function.__name__,
+            f"{filename.resolve()}",
+            stat.st_mtime_ns,
+            stat.st_size,
+            sorted((name, _canonical(value)) for name, value in arguments.items()),
+        )
+    )
+    return hashlib.sha1(description.encode()).hexdigest()
+
+
+def _canonical(value):
+    """Value whose repr describes all the elements of the arrays (numpy abbreviates the repr of large arrays)."""
+    if isinstance(value, np.ndarray):
+        digest = hashlib.sha1(np.ascontiguousarray(value).tobytes()).hexdigest()
+        return "ndarray", f"{value.dtype}", value.shape, digest
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, [_canonical(item) for item in value]
+    if isinstance(value, dict):
+        return "dict", sorted(
+            (f"{key}", _canonical(item)) for key, item in value.items()
+        )
+    return value
+
+
+def _load(entry: Path) -> xr.DataArray:
+    data = xr.load_dataarray(entry)
+    # netCDF stores the strings coordinates as objects
+    for name, coord in data.coords.items():
+        if coord.dtype == object:
+            data[name] = coord.astype(str)
+    return data
+
+
+def _store(data: xr.DataArray, entry: Path):
+    # the cache is only an optimization: failing to write or evict an entry does not fail the read
+    descriptor, temporary = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+    os.close(descriptor)
+    temporary = Path(temporary)
+    try:
+        data.to_netcdf(temporary)
+        # atomic: processes storing the same entry at the same time all write the same data
+        temporary.replace(entry)
+    except (OSError, TypeError, ValueError):
+        # e.g., attrs that netCDF cannot serialize (None): the result is not cached
+        _remove(temporary)
+        return
+    try:
+        _evict(entry.parent, _settings["max_size"])
+    except OSError:
+        pass
+
+
+def _evict(directory: Path, max_size: int):
+    entries = []
+    for entry in directory.glob("*.nc"):
+        try:
+            entries.append((entry.stat(), entry))
+        except FileNotFoundError:
+            # evicted by another process
+            pass
+    entries.sort(key=lambda stat_entry: stat_entry[0].st_mtime)
+    size = sum(stat.st_size for stat, _ in entries)
+    for stat, entry in entries:
+        if size <= max_size:
+            break
+        size -= stat.st_size
+        _remove(entry)
+
+
+def _remove(path: Path):
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
@@ -1,14 +1,24 @@
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Union, Optional, List, Callable
+from typing import Union, Optional, List, Callable, Tuple, Iterator
 
 import ezc3d
 import numpy as np
 import pandas as pd
 import xarray as xr
+from xarray.core import indexing
 
-from pyomeca.io.utils import col_spliter, find_end_header_in_opensim_file
+from pyomeca.io import c3d
+from pyomeca.io.cache import cached
+from pyomeca.io.utils import (
+    col_spliter,
+    find_end_header_in_opensim_file,
+    frame_index,
+)
 
 
+@cached
 def read_c3d(
     caller: Callable,
     filename: Union[str, Path],
@@ -16,54 +26,336 @@ def read_c3d(
     prefix_delimiter: Optional[str] = None,
     suffix_delimiter: Optional[str] = None,
     attrs: Optional[dict] = None,
+    engine: str = "ezc3d",
+    start: Optional[Union[int, float]] = None,
+    stop: Optional[Union[int, float]] = None,
 ) -> xr.DataArray:
     group = "ANALOG" if caller.__name__ == "Analogs" else "POINT"
+    if engine == "ezc3d":
+        reader = ezc3d.c3d(f"{filename}")
+        return _c3d_group_to_dataarray(
+            caller,
+            reader,
+            group,
+            usecols,
+            prefix_delimiter,
+            suffix_delimiter,
+            attrs,
+            start,
+            stop,
+        )
+    if engine in ("native", "memmap"):
+        return _read_c3d_native(
+            caller,
+            filename,
+            group,
+            usecols,
+            prefix_delimiter,
+            suffix_delimiter,
+            attrs,
+            start,
+            stop,
+            memmap=engine == "memmap",
+        )
+    raise ValueError(
+        f"engine should be 'ezc3d', 'native' or 'memmap'. You provided {engine}"
+    )
+
+
+def read_c3d_trial(
+    markers_caller: Callable,
+    analogs_caller: Callable,
+    filename: Union[str, Path],
+    markers_kwargs: Optional[dict] = None,
+    analogs_kwargs: Optional[dict] = None,
+) -> Tuple[xr.DataArray, xr.DataArray, dict]:
+    """
+    Read the markers, the analogs and the metadata of a c3d file with only one parse of the file.
+    `markers_kwargs` and `analogs_kwargs` accept the keyword arguments of `read_c3d`
+    (`usecols`, `prefix_delimiter`, `suffix_delimiter`, `attrs`, `start` and `stop`).
+    """
+    reader = ezc3d.c3d(f"{filename}")
+    markers = _c3d_group_to_dataarray(
+        markers_caller, reader, "POINT", **(markers_kwargs if markers_kwargs else {})
+    )
+    analogs = _c3d_group_to_dataarray(
+        analogs_caller, reader, "ANALOG", **(analogs_kwargs if analogs_kwargs else {})
+    )
+    return markers, analogs, _c3d_metadata(reader)
+
+
+def read_c3d_force_platforms(filename: Union[str, Path]) -> dict:
+    """
+    Read the FORCE_PLATFORM parameters of a c3d file for the `n` platforms in use.
+    The analog channels of each platform (`CHANNEL`, one-based indices) are returned as the labels of
+    the analogs read with `Analogs.from_c3d` (default delimiters).
+    """
+    try:
+        # only the parameter section is parsed, the data section is not read
+        parameters = c3d.read_c3d_layout(filename)["parameters"]
+    except NotImplementedError:
+        parameters = _c3d_metadata(ezc3d.c3d(f"{filename}"))["parameters"]
+    if "FORCE_PLATFORM" not in parameters:
+        raise ValueError(f"{filename} has no FORCE_PLATFORM parameters")
+    platforms = parameters["FORCE_PLATFORM"]
+    n = int(np.asarray(platforms["USED"]).ravel()[0])
+    if n == 0:
+        raise ValueError(f"{filename} has no force platform in use")
+    labels = np.asarray(parameters["ANALOG"]["LABELS"])
+
+    def value(name: str, shape: tuple) -> np.array:
+        return np.asarray(platforms[name], dtype=float).reshape(shape, order="F")
+
+    channels = value("CHANNEL", (-1, n)).astype(int)
+    return {
+        "types": value("TYPE", (-1,))[:n].astype(int),
+        "corners": value("CORNERS", (3, 4, n)),
+        "origins": value("ORIGIN", (3, n)),
+        "channels": labels[channels[:6] - 1],
+        "calibration_matrices": value("CAL_MATRIX", (6, 6, n))
+        if np.size(platforms.get("CAL_MATRIX", []))
+        else None,
+    }
+
+
+def read_many(
+    reader: Callable,
+    filenames: List[Union[str, Path]],
+    n_jobs: Optional[int] = None,
+    concat: bool = False,
+    **kwargs,
+) -> Union[List[Optional[xr.DataArray]], xr.DataArray]:
+    """
+    Read several files with `reader` (e.g., `Markers.from_c3d`) in a pool of `n_jobs` processes.
+    A file that cannot be read raises a warning and does not stop the batch:
+    it is `None` in the returned list and it is skipped when `concat=True`.
+    """
+    filenames = list(filenames)
+    if n_jobs == 1:
+        results = [_read_one(reader, filename, kwargs) for filename in filenames]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(
+                executor.map(
+                    _read_one,
+                    [reader] * len(filenames),
+                    filenames,
+                    [kwargs] * len(filenames),
+                )
+            )
 
-    reader = ezc3d.c3d(f"{filename}").c3d_swig
+    data = []
+    for filename, (array, error) in zip(filenames, results):
+        if error is not None:
+            warnings.warn(f"{filename} could not be read and was skipped: {error}")
+        data.append(array)
+
+    if not concat:
+        return data
+    trials = [
+        (f"{filename}", array)
+        for filename, array in zip(filenames, data)
+        if array is not None
+    ]
+    if not trials:
+        raise ValueError("None of the files could be read")
+    names, arrays = zip(*trials)
+    return xr.concat(arrays, dim=pd.Index(names, name="trial"), join="outer")
+
+
+def _read_one(
+    reader: Callable, filename: Union[str, Path], kwargs: dict
+) -> Tuple[Optional[xr.DataArray], Optional[str]]:
+    try:
+        return reader(filename, **kwargs).load(), None
+    except Exception as error:
+        return None, f"{type(error).__name__}: {error}"
+
+
+def _c3d_group_to_dataarray(
+    caller: Callable,
+    reader: ezc3d.c3d,
+    group: str,
+    usecols: Optional[List[Union[str, int]]] = None,
+    prefix_delimiter: Optional[str] = None,
+    suffix_delimiter: Optional[str] = None,
+    attrs: Optional[dict] = None,
+    start: Optional[Union[int, float]] = None,
+    stop: Optional[Union[int, float]] = None,
+) -> xr.DataArray:
+    parameters = reader["parameters"][group]
     columns = [
         col_spliter(label, prefix_delimiter, suffix_delimiter)
-        for label in reader.parameters()
-        .group(group)
-        .parameter("LABELS")
-        .valuesAsString()
+        for label in parameters["LABELS"]["value"]
     ]
 
-    get_data_function = getattr(reader, f"get_{group.lower()}s")
+    # ezc3d already extracted the data when parsing the file, we reuse it instead of extracting it again
+    data = reader["data"][f"{group.lower()}s"]
 
-    if usecols:
-        if isinstance(usecols[0], str):
-            idx = [columns.index(channel) for channel in usecols]
-        elif isinstance(usecols[0], int):
-            idx = usecols
-        else:
-            raise ValueError(
-                "usecols should be None, list of string or list of int."
-                f"You provided {type(usecols)}"
-            )
-        data = get_data_function()[:, idx, :]
+    idx = _channels_index(columns, usecols)
+    if idx is not None:
+        data = data[:, idx, :]
         channels = [columns[i] for i in idx]
     else:
-        data = get_data_function()
         channels = columns
 
-    data_by_frame = 1 if group == "POINT" else reader.header().nbAnalogByFrame()
+    points_header = reader["header"]["points"]
+    frame_rate = points_header["frame_rate"]
+    data_by_frame = 1
+    if group == "ANALOG":
+        analogs_rate = reader["header"]["analogs"]["frame_rate"]
+        if frame_rate:
+            data_by_frame = int(round(analogs_rate / frame_rate))
+        else:
+            # files without points have no point rate, the analogs keep their own rate
+            frame_rate = analogs_rate
 
-    attrs = attrs if attrs else {}
-    attrs["first_frame"] = reader.header().firstFrame() * data_by_frame
-    attrs["last_frame"] = reader.header().lastFrame() * data_by_frame
-    attrs["rate"] = reader.header().frameRate() * data_by_frame
-    attrs["units"] = (
-        reader.parameters().group(group).parameter("UNITS").valuesAsString()[0]
+    data = data[0, ...] if group == "ANALOG" else data
+    first, last = _c3d_window(start, stop, frame_rate * data_by_frame, data.shape[-1])
+    return _c3d_to_dataarray(
+        caller,
+        data[..., first:last],
+        channels,
+        points_header["first_frame"],
+        points_header["last_frame"],
+        frame_rate,
+        data_by_frame,
+        parameters["UNITS"]["value"][0],
+        attrs,
+        first,
     )
 
-    time = np.arange(
-        start=0, stop=data.shape[-1] / attrs["rate"], step=1 / attrs["rate"]
+
+def _read_c3d_native(
+    caller: Callable,
+    filename: Union[str, Path],
+    group: str,
+    usecols: Optional[List[Union[str, int]]] = None,
+    prefix_delimiter: Optional[str] = None,
+    suffix_delimiter: Optional[str] = None,
+    attrs: Optional[dict] = None,
+    start: Optional[Union[int, float]] = None,
+    stop: Optional[Union[int, float]] = None,
+    memmap: bool = False,
+) -> xr.DataArray:
+    layout = c3d.read_c3d_layout(filename)
+    parameters = layout["parameters"][group]
+    labels = parameters["LABELS"]
+    columns = [
+        col_spliter(label, prefix_delimiter, suffix_delimiter)
+        for label in ([labels] if isinstance(labels, str) else labels)
+    ]
+
+    idx = _channels_index(columns, usecols)
+    by_frame = 1 if group == "POINT" else layout["analog_by_frame"]
+    first, last = _c3d_window(
+        start, stop, layout["rate"] * by_frame, layout["n_frames"] * by_frame
     )
-    return caller(
-        data[0, ...] if group == "ANALOG" else data, channels, time, attrs=attrs
+    if memmap:
+        data = indexing.LazilyIndexedArray(
+            c3d.C3DMemmapArray(filename, layout, group, idx)
+        )
+        data = data[
+            indexing.BasicIndexer(
+                (slice(None),) * (data.ndim - 1) + (slice(first, last),)
+            )
+        ]
+    else:
+        # only the c3d frames containing the requested window are read
+        first_frame = first // by_frame
+        data = c3d.read_c3d_frames(
+            filename, layout, group, idx, first_frame, -(-last // by_frame)
+        )[..., first - first_frame * by_frame : last - first_frame * by_frame]
+    channels = [columns[i] for i in idx] if idx is not None else columns
+
+    units = parameters["UNITS"]
+    return _c3d_to_dataarray(
+        caller,
+        data,
+        channels,
+        layout["first_frame"],
+        layout["last_frame"],
+        layout["rate"],
+        by_frame,
+        units if isinstance(units, str) else units[0],
+        attrs,
+        first,
     )
 
 
+def _channels_index(
+    columns: List[str], usecols: Optional[List[Union[str, int]]] = None
+) -> Optional[List[int]]:
+    if not usecols:
+        return None
+    if isinstance(usecols[0], str):
+        return [columns.index(channel) for channel in usecols]
+    if isinstance(usecols[0], int):
+        return usecols
+    raise ValueError(
+        "usecols should be None, list of string or list of int."
+        f"You provided {type(usecols)}"
+    )
+
+
+def _c3d_to_dataarray(
+    caller: Callable,
+    data: np.array,
+    channels: List[str],
+    first_frame: int,
+    last_frame: int,
+    frame_rate: float,
+    data_by_frame: int,
+    units: str,
+    attrs: Optional[dict] = None,
+    first: int = 0,
+) -> xr.DataArray:
+    attrs = attrs if attrs else {}
+    attrs["first_frame"] = first_frame * data_by_frame
+    attrs["last_frame"] = last_frame * data_by_frame
+    attrs["rate"] = frame_rate * data_by_frame
+    attrs["units"] = units
+
+    time = _time_vector(data.shape[-1], attrs["rate"], first)
+    return caller(data, channels, time, attrs=attrs)
+
+
+def _c3d_window(
+    start: Optional[Union[int, float]],
+    stop: Optional[Union[int, float]],
+    rate: float,
+    n_samples: int,
+) -> Tuple[int, int]:
+    first, last, _ = slice(frame_index(start, rate), frame_index(stop, rate)).indices(
+        n_samples
+    )
+    return first, max(first, last)
+
+
+def _time_vector(n_frames: int, rate: float, first: int = 0) -> np.array:
+    # the time vector of a window is a slice of the whole recording's time vector
+    return np.arange(first, first + n_frames) * (1 / rate)
+
+
+def _c3d_metadata(reader: ezc3d.c3d) -> dict:
+    return {
+        "header": {
+            key: dict(value)
+            for key, value in reader["header"].items()
+            if isinstance(value, dict)
+        },
+        "parameters": {
+            group_name: {
+                parameter_name: parameter["value"]
+                for parameter_name, parameter in group.items()
+                if parameter_name != "__METADATA__"
+            }
+            for group_name, group in reader["parameters"].items()
+        },
+    }
+
+
+@cached
 def read_csv_or_excel(
     caller: Callable,
     extension: str,
@@ -80,12 +372,15 @@ def read_csv_or_excel(
     pandas_kwargs: Optional[dict] = None,
     attrs: Optional[dict] = None,
     sheet_name: Union[int, str] = 0,
+    start: Optional[Union[int, float]] = None,
+    stop: Optional[Union[int, float]] = None,
 ):
-    if skiprows is None:
-        skiprows = np.arange(header + 1, first_row) if header else np.arange(first_row)
-
-    if pandas_kwargs is None:
-        pandas_kwargs = {}
+    attrs = attrs if attrs else {}
+    start = frame_index(start, attrs.get("rate"))
+    stop = frame_index(stop, attrs.get("rate"))
+    skiprows, pandas_kwargs = _pandas_window_kwargs(
+        header, first_row, skiprows, pandas_kwargs, start, stop
+    )
 
     if extension == "csv":
         data = pd.read_csv(filename, header=header, skiprows=skiprows, **pandas_kwargs)
@@ -98,6 +393,117 @@ def read_csv_or_excel(
             **pandas_kwargs,
         )
 
+    return _dataframe_to_dataarray(
+        caller,
+        data,
+        usecols,
+        header,
+        first_column,
+        time_column,
+        last_column_to_remove,
+        prefix_delimiter,
+        suffix_delimiter,
+        attrs,
+        first=start if start else 0,
+    )
+
+
+def read_csv_chunks(
+    caller: Callable,
+    filename: Union[str, Path],
+    chunksize: int,
+    usecols: Optional[List[Union[str, int]]] = None,
+    header: Optional[int] = None,
+    first_row: int = 0,
+    first_column: Optional[Union[str, int]] = None,
+    time_column: Optional[Union[str, int]] = None,
+    last_column_to_remove: Optional[Union[str, int]] = None,
+    prefix_delimiter: Optional[str] = None,
+    suffix_delimiter: Optional[str] = None,
+    skiprows: Optional[List[int]] = None,
+    pandas_kwargs: Optional[dict] = None,
+    attrs: Optional[dict] = None,
+    start: Optional[Union[int, float]] = None,
+    stop: Optional[Union[int, float]] = None,
+) -> Iterator[xr.DataArray]:
+    """
+    Same as `read_csv_or_excel` but the csv file is parsed by blocks of `chunksize` frames.
+    Each block is yielded as soon as it is parsed, so that only one block is held in memory.
+    """
+    attrs = attrs if attrs else {}
+    start = frame_index(start, attrs.get("rate"))
+    stop = frame_index(stop, attrs.get("rate"))
+    skiprows, pandas_kwargs = _pandas_window_kwargs(
+        header, first_row, skiprows, pandas_kwargs, start, stop
+    )
+
+    first = start if start else 0
+    reader = pd.read_csv(
+        filename, header=header, skiprows=skiprows, chunksize=chunksize, **pandas_kwargs
+    )
+    # the reader is closed explicitly: it is only a context manager from pandas 1.2
+    try:
+        for data in reader:
+            yield _dataframe_to_dataarray(
+                caller,
+                data,
+                usecols,
+                header,
+                first_column,
+                time_column,
+                last_column_to_remove,
+                prefix_delimiter,
+                suffix_delimiter,
+                {**attrs},
+                first=first,
+            )
+            first += data.shape[0]
+    finally:
+        reader.close()
+
+
+def _pandas_window_kwargs(
+    header: Optional[int],
+    first_row: int,
+    skiprows: Optional[List[int]],
+    pandas_kwargs: Optional[dict],
+    start: Optional[int],
+    stop: Optional[int],
+) -> Tuple[np.array, dict]:
+    if skiprows is None:
+        skiprows = np.arange(header + 1, first_row) if header else np.arange(first_row)
+
+    if pandas_kwargs is None:
+        pandas_kwargs = {}
+
+    if start:
+        # skip the rows before the window instead of parsing them
+        skiprows = np.asarray(skiprows, dtype=int)
+        first_data_row = max(
+            skiprows.max() + 1 if skiprows.size else 0,
+            header + 1 if header is not None else 0,
+        )
+        skiprows = np.concatenate(
+            [skiprows, np.arange(first_data_row, first_data_row + start)]
+        )
+    if stop is not None:
+        pandas_kwargs = {**pandas_kwargs, "nrows": max(stop - (start or 0), 0)}
+    return skiprows, pandas_kwargs
+
+
+def _dataframe_to_dataarray(
+    caller: Callable,
+    data: pd.DataFrame,
+    usecols: Optional[List[Union[str, int]]],
+    header: Optional[int],
+    first_column: Optional[Union[str, int]],
+    time_column: Optional[Union[str, int]],
+    last_column_to_remove: Optional[Union[str, int]],
+    prefix_delimiter: Optional[str],
+    suffix_delimiter: Optional[str],
+    attrs: dict,
+    first: int = 0,
+) -> xr.DataArray:
     if time_column is not None:
         if isinstance(time_column, int):
             time = data.iloc[:, time_column]
@@ -123,33 +529,120 @@ def read_csv_or_excel(
     )
     data = caller._reshape_flat_array(data.values[:, idx] if idx else data.values)
 
-    attrs = attrs if attrs else {}
     if "rate" in attrs and time is None:
-        time = np.arange(
-            start=0, stop=data.shape[-1] / attrs["rate"], step=1 / attrs["rate"]
-        )
+        time = _time_vector(data.shape[-1], attrs["rate"], first)
     return caller(data, channels, time, attrs=attrs)
 
 
+@cached
 def read_sto_or_mot(
     caller: Callable,
     filename: Union[str, Path],
     end_header: Optional[int] = None,
+    start: Optional[Union[int, float]] = None,
+    stop: Optional[Union[int, float]] = None,
     **kwargs,
 ):
     if end_header is None:
         end_header = find_end_header_in_opensim_file(filename)
 
+    start, stop, rate = _window_from_time_column(
+        filename, start, stop, first_row=end_header + 2, time_column=0
+    )
     data = caller.from_csv(
-        filename, header=end_header + 1, first_column=0, time_column=0, **kwargs,
+        filename,
+        header=end_header + 1,
+        first_column=0,
+        time_column=0,
+        start=start,
+        stop=stop,
+        **kwargs,
     )
-    data.attrs["rate"] = (1 / (data.time[1] - data.time[0])).round().item()
+    data.attrs["rate"] = rate
     return data
 
 
-def read_trc(caller: Callable, filename: Union[str, Path], **kwargs):
-    data = caller.from_csv(
-        filename, header=3, first_row=6, first_column=1, time_column=1, **kwargs,
+@cached
+def read_trc(
+    caller: Callable,
+    filename: Union[str, Path],
+    start: Optional[Union[int, float]] = None,
+    stop: Optional[Union[int, float]] = None,
+    usecols: Optional[List[Union[str, int]]] = None,
+    prefix_delimiter: Optional[str] = None,
+    suffix_delimiter: Optional[str] = None,
+    skiprows: Optional[List[int]] = None,
+    pandas_kwargs: Optional[dict] = None,
+    attrs: Optional[dict] = None,
+):
+    # only the header is read line by line, the numeric block is parsed in one pass below
+    with open(filename, "rt") as f:
+        lines = [f.readline().rstrip("\r\n") for _ in range(6)]
+    delimiter = "\t" if "\t" in lines[0] else ","
+
+    header = {
+        key.strip(): value.strip()
+        for key, value in zip(lines[1].split(delimiter), lines[2].split(delimiter))
+    }
+    rate = float(header["DataRate"])
+    n_frames = int(header["NumFrames"])
+    n_markers = int(header["NumMarkers"])
+    columns = [
+        col_spliter(name.strip(), prefix_delimiter, suffix_delimiter)
+        for name in lines[3].split(delimiter)[2::3][:n_markers]
+    ]
+
+    idx = _channels_index(columns, usecols)
+    if idx is None:
+        idx = list(range(len(columns)))
+    channels = [columns[i] for i in idx]
+
+    # the X/Y/Z row is followed by an optional blank row before the data
+    first_row = 5 if lines[5].strip(f" {delimiter}") else 6
+    first, last, _ = slice(frame_index(start, rate), frame_index(stop, rate)).indices(
+        n_frames
     )
-    data.attrs["rate"] = (1 / (data.time[1] - data.time[0])).round().item()
-    return data
+    data_columns = [1, *(2 + 3 * np.repeat(idx, 3) + np.tile(range(3), len(idx)))]
+    # missing markers are exported as empty fields, which are parsed as nan
+    data = pd.read_csv(
+        filename,
+        **{
+            "sep": delimiter,
+            "dtype": np.float64,
+            "engine": "c",
+            **(pandas_kwargs if pandas_kwargs else {}),
+            "header": None,
+            "skiprows": first_row + first
+            if skiprows is None
+            else np.union1d(np.arange(first_row + first), np.asarray(skiprows, int)),
+            "nrows": max(last - first, 0),
+            "usecols": sorted(set(data_columns)),
+        },
+    )
+    if list(data.columns) != data_columns:
+        # pandas returns the columns in the order of the file
+        data = data[data_columns]
+    data = data.to_numpy()
+
+    return caller(
+        caller._reshape_flat_array(data[:, 1:]),
+        channels,
+        data[:, 0],
+        attrs={**(attrs if attrs else {}), "rate": rate},
+    )
+
+
+def _window_from_time_column(
+    filename: Union[str, Path],
+    start: Optional[Union[int, float]],
+    stop: Optional[Union[int, float]],
+    first_row: int,
+    time_column: int,
+) -> Tuple[Optional[int], Optional[int], float]:
+    # only the first two time samples of the file are parsed to get the rate,
+    # which does not depend on the size of the window
+    time = pd.read_csv(
+        filename, header=None, skiprows=first_row, nrows=2, usecols=[time_column]
+    ).iloc[:, 0]
+    rate = np.round(1 / (time[1] - time[0])).item()
+    return frame_index(start, rate), frame_index(stop, rate), rate
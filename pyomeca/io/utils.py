@@ -1,5 +1,7 @@
 import csv
-from typing import Optional
+from typing import Optional, Union
+
+import numpy as np
 
 
 def col_spliter(x, p, s):
@@ -24,3 +26,22 @@ def find_end_header_in_opensim_file(filename: str, end_header: Optional[int] = N
             "endheader not detected in your file. Try to specify the `end_header` parameter"
         )
     return end_header
+
+
+def frame_index(
+    value: Optional[Union[int, float]], rate: Optional[float] = None
+) -> Optional[int]:
+    """Integers are frame indexes, floats are seconds from the beginning of the recording."""
+    if value is None or isinstance(value, (int, np.integer)):
+        return value
+    if not rate:
+        raise ValueError(
+            "start and stop in seconds (float) require the sampling rate. "
+            "Provide attrs={'rate': ...} or specify start and stop in frames (int)."
+        )
+    return int(round(value * rate))
+
+
+def chunk(array, chunks: Optional[Union[int, tuple, dict]] = None):
+    """Back `array` by a dask array if `chunks` is specified (requires dask)."""
+    return array if chunks is None else array.chunk(chunks)
@@ -0,0 +1,226 @@
+from typing import Optional
+
+import numpy as np
+import xarray as xr
+
+from pyomeca.angles import Angles
+from pyomeca.processing import rototrans
+
+
+class KinematicChain:
+    def __init__(self, segments: dict, angle_sequence: str):
+        """
+        Tree of segments defined from markers, used to compute the kinematics of all the segments and joints at once.
+
+        Arguments:
+            segments: Mapping of segment names to their definition, i.e. the arguments of `Rototrans.from_markers`
+                given as marker names (`origin`, `axis_1`, `axis_2`, `axes_name` and `axis_to_recalculate`)
+                and the name of the `parent` segment (`None` or missing for a segment expressed in the global reference frame)
+            angle_sequence: Euler sequence of the joint angles (see `Angles.from_rototrans`)
+
+        !!! example
+            To define the thorax, clavicle and humerus segments of [this c3d file](https://github.com/romainmartinez/pyomeca/blob/master/tests/data/markers_analogs.c3d):
+
+            ```python
+            from pyomeca import KinematicChain
+
+            chain = KinematicChain(
+                segments={
+                    "thorax": {
+                        "origin": "STER",
+                        "axis_1": ("T1", "STER"),
+                        "axis_2": ("XIPH", "STER"),
+                        "axes_name": "xy",
+                        "axis_to_recalculate": "x",
+                    },
+                    "clavicle": {
+                        "origin": "CLAV_SC",
+                        "axis_1": ("CLAV_SC", "CLAV_AC"),
+                        "axis_2": ("XIPH", "STER"),
+                        "axes_name": "zy",
+                        "axis_to_recalculate": "y",
+                        "parent": "thorax",
+                    },
+                    "humerus": {
+                        "origin": "ACRO_tip",
+                        "axis_1": ("EPICl", "ACRO_tip"),
+                        "axis_2": ("EPICm", "EPICl"),
+                        "axes_name": "yz",
+                        "axis_to_recalculate": "z",
+                        "parent": "thorax",
+                    },
+                },
+                angle_sequence="yxy",
+            )
+            ```
+        """
+        keys = {"origin", "axis_1", "axis_2", "axes_name", "axis_to_recalculate"}
+        for name, definition in segments.items():
+            missing = keys - set(definition)
+            if missing:
+                raise ValueError(f"Segment `{name}` is missing {sorted(missing)}")
+            parent = definition.get("parent")
+            if parent is not None and parent not in segments:
+                raise ValueError(
+                    f"The parent of `{name}` (`{parent}`) is not a segment of the chain"
+                )
+        self.segments = segments
+        self.angle_sequence = angle_sequence
+
+    @property
+    def parents(self) -> dict:
+        return {
+            name: definition.get("parent") for name, definition in self.segments.items()
+        }
+
+    def rototrans(self, markers: xr.DataArray) -> xr.DataArray:
+        """
+        Rototrans of all the segments in the global reference frame.
+
+        The axes of all the segments are computed in one pass (one set of vectorized cross products).
+
+        Arguments:
+            markers: Markers containing the markers used in the segments definition
+
+        Returns:
+            Rototrans `xarray.DataArray` with the `row`, `col`, `segment` and `time` dimensions
+
+        !!! example
+            ```python
+            from pyomeca import KinematicChain, Markers
+
+            data_path = "./tests/data/markers_analogs.c3d"
+            markers = Markers.from_c3d(data_path, prefix_delimiter=":")
+
+            chain = KinematicChain(
+                segments={
+                    "thorax": {
+                        "origin": "STER",
+                        "axis_1": ("T1", "STER"),
+                        "axis_2": ("XIPH", "STER"),
+                        "axes_name": "xy",
+                        "axis_to_recalculate": "x",
+                    },
+                },
+                angle_sequence="zxy",
+            )
+            rt = chain.rototrans(markers)
+            ```
+        """
+        return rototrans.rototrans_from_segments(markers, self.segments)
+
+    def joint_rototrans(
+        self, markers: xr.DataArray, rt: Optional[xr.DataArray] = None
+    ) -> xr.DataArray:
+        """
+        Rototrans of all the segments expressed in the reference frame of their parent segment.
+
+        Segments without parent are expressed in the global reference frame.
+
+        Arguments:
+            markers: Markers containing the markers used in the segments definition
+            rt: Rototrans of the segments in the global reference frame, if already computed with `rototrans`
+
+        Returns:
+            Rototrans `xarray.DataArray` with the `row`, `col`, `joint` and `time` dimensions,
+                the joints being named after their child segment
+
+        !!! example
+            ```python
+            from pyomeca import KinematicChain, Markers
+
+            data_path = "./tests/data/markers_analogs.c3d"
+            markers = Markers.from_c3d(data_path, prefix_delimiter=":")
+
+            chain = KinematicChain(
+                segments={
+                    "thorax": {
+                        "origin": "STER",
+                        "axis_1": ("T1", "STER"),
+                        "axis_2": ("XIPH", "STER"),
+                        "axes_name": "xy",
+                        "axis_to_recalculate": "x",
+                    },
+                    "humerus": {
+                        "origin": "ACRO_tip",
+                        "axis_1": ("EPICl", "ACRO_tip"),
+                        "axis_2": ("EPICm", "EPICl"),
+                        "axes_name": "yz",
+                        "axis_to_recalculate": "z",
+                        "parent": "thorax",
+                    },
+                },
+                angle_sequence="yxy",
+            )
+            joint_rt = chain.joint_rototrans(markers)
+            ```
+        """
+        if rt is None:
+            rt = self.rototrans(markers)
+        names = list(self.segments)
+        # the segments without parent are composed with the identity, appended after the last segment
+        identity = rt.isel(segment=[0]).copy(
+            data=np.broadcast_to(
+                np.eye(4)[..., np.newaxis, np.newaxis], (4, 4, 1, rt.time.size)
+            )
+        )
+        inverted = xr.concat([rototrans.inverse(rt), identity], dim="segment")
+        parents = inverted.isel(
+            segment=[
+                len(names) if parent is None else names.index(parent)
+                for parent in self.parents.values()
+            ]
+        )
+        return rototrans.compose(
+            parents.rename(segment="joint").assign_coords(joint=names),
+            rt.rename(segment="joint"),
+        )
+
+    def joint_angles(
+        self, markers: xr.DataArray, rt: Optional[xr.DataArray] = None
+    ) -> xr.DataArray:
+        """
+        Joint angles of all the segments relative to their parent segment.
+
+        Arguments:
+            markers: Markers containing the markers used in the segments definition
+            rt: Rototrans of the segments in the global reference frame, if already computed with `rototrans`
+
+        Returns:
+            Angles `xarray.DataArray` with the `axis`, `joint` and `time` dimensions,
+                the joints being named after their child segment
+
+        !!! example
+            ```python
+            from pyomeca import KinematicChain, Markers
+
+            data_path = "./tests/data/markers_analogs.c3d"
+            markers = Markers.from_c3d(data_path, prefix_delimiter=":")
+
+            chain = KinematicChain(
+                segments={
+                    "thorax": {
+                        "origin": "STER",
+                        "axis_1": ("T1", "STER"),
+                        "axis_2": ("XIPH", "STER"),
+                        "axes_name": "xy",
+                        "axis_to_recalculate": "x",
+                    },
+                    "humerus": {
+                        "origin": "ACRO_tip",
+                        "axis_1": ("EPICl", "ACRO_tip"),
+                        "axis_2": ("EPICm", "EPICl"),
+                        "axes_name": "yz",
+                        "axis_to_recalculate": "z",
+                        "parent": "thorax",
+                    },
+                },
+                angle_sequence="yxy",
+            )
+            angles = chain.joint_angles(markers)
+            angles.sel(joint="humerus").plot.line(x="time")
+            ```
+        """
+        return Angles.from_rototrans(
+            self.joint_rototrans(markers, rt), self.angle_sequence
+        )
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Union, Optional, List, Tuple
+from typing import Union, Optional, List, Tuple, Iterator
 
 import numpy as np
 import pandas as pd
@@ -15,6 +15,7 @@ class Markers:
         channels: Optional[list] = None,
         time: Optional[Union[np.array, list, pd.Series]] = None,
         *args,
+        chunks: Optional[Union[int, tuple, dict]] = None,
         **kwargs,
     ) -> xr.DataArray:
         """
@@ -27,6 +28,7 @@ class Markers:
             time: Time vector in seconds associated with the `data` parameter
             args: Positional argument(s) to be passed to xarray.DataArray
             kwargs: Keyword argument(s) to be passed to xarray.DataArray
+            chunks: If specified, the data is backed by a dask array with these chunk sizes (see `xarray.DataArray.chunk`)
 
         Returns:
             Markers `xarray.DataArray` with the specified data and coordinates
@@ -74,13 +76,16 @@ class Markers:
             coords["channel"] = channels
         if time is not None:
             coords["time"] = time
-        return xr.DataArray(
-            data=data,
-            dims=("axis", "channel", "time"),
-            coords=coords,
-            name="markers",
-            *args,
-            **kwargs,
+        return utils.chunk(
+            xr.DataArray(
+                data=data,
+                dims=("axis", "channel", "time"),
+                coords=coords,
+                name="markers",
+                *args,
+                **kwargs,
+            ),
+            chunks,
         )
 
     @classmethod
@@ -139,6 +144,9 @@ class Markers:
         skiprows: Optional[List[int]] = None,
         pandas_kwargs: Optional[dict] = None,
         attrs: Optional[dict] = None,
+        start: Optional[Union[int, float]] = None,
+        stop: Optional[Union[int, float]] = None,
+        chunks: Optional[Union[int, tuple, dict]] = None,
     ) -> xr.DataArray:
         """
         Markers DataArray from a csv file.
@@ -157,6 +165,11 @@ class Markers:
             skiprows: Line numbers to skip (0-indexed)
             pandas_kwargs: Keyword arguments to be passed to `pandas.read_csv`
             attrs: attrs to be passed to `xr.DataArray`. If attrs['rate'] is provided, compute the time accordingly
+            start: First frame (int) or time in seconds from the first frame (float, requires attrs['rate'])
+                of the time window to read. The rows before the window are skipped without being parsed
+            stop: Last frame (int, excluded) or time in seconds from the first frame (float, requires attrs['rate'])
+                of the time window to read. The rows after the window are not read
+            chunks: If specified, the data is backed by a dask array with these chunk sizes (see `xarray.DataArray.chunk`)
 
         Returns:
             Markers `xarray.DataArray` with the specified data and coordinates
@@ -215,10 +228,103 @@ class Markers:
             )
             ```
         """
-        return read.read_csv_or_excel(
+        return utils.chunk(
+            read.read_csv_or_excel(
+                cls,
+                "csv",
+                filename,
+                usecols,
+                header,
+                first_row,
+                first_column,
+                time_column,
+                last_column_to_remove,
+                prefix_delimiter,
+                suffix_delimiter,
+                skiprows,
+                pandas_kwargs,
+                attrs,
+                start=start,
+                stop=stop,
+            ),
+            chunks,
+        )
+
+    @classmethod
+    def from_csv_chunks(
+        cls,
+        filename: Union[str, Path],
+        chunksize: int,
+        usecols: Optional[List[Union[str, int]]] = None,
+        header: Optional[int] = None,
+        first_row: int = 0,
+        first_column: Optional[Union[str, int]] = None,
+        time_column: Optional[Union[str, int]] = None,
+        last_column_to_remove: Optional[Union[str, int]] = None,
+        prefix_delimiter: Optional[str] = None,
+        suffix_delimiter: Optional[str] = None,
+        skiprows: Optional[List[int]] = None,
+        pandas_kwargs: Optional[dict] = None,
+        attrs: Optional[dict] = None,
+        start: Optional[Union[int, float]] = None,
+        stop: Optional[Union[int, float]] = None,
+    ) -> Iterator[xr.DataArray]:
+        """
+        Iterate over a csv file by blocks of `chunksize` frames, each block being a Markers DataArray.
+
+        Only one block is parsed and held in memory at a time, which allows to process csv files larger than the memory.
+        The arguments are the same as `Markers.from_csv`.
+
+        Arguments:
+            filename: Any valid string path
+            chunksize: Number of frames of each block
+            usecols: All elements must either be positional or strings that correspond to column names.
+                For example, a valid list-like usecols parameter would be [0, 1, 2] or ['foo', 'bar', 'baz'].
+            header: Row of the header (0-indexed)
+            first_row: First row of the data (0-indexed)
+            first_column: First column of the data (0-indexed)
+            time_column: Column of the time column. If None, we associate the index
+            last_column_to_remove: If for some reason the csv reads extra columns, how many should be ignored
+            prefix_delimiter: Delimiter that split each column name by its prefix (we keep only the column name)
+            suffix_delimiter: Delimiter that split each column name by its suffix (we keep only the column name)
+            skiprows: Line numbers to skip (0-indexed)
+            pandas_kwargs: Keyword arguments to be passed to `pandas.read_csv`
+            attrs: attrs to be passed to `xr.DataArray`. If attrs['rate'] is provided, compute the time accordingly
+            start: First frame (int) or time in seconds from the first frame (float, requires attrs['rate'])
+                of the time window to read
+            stop: Last frame (int, excluded) or time in seconds from the first frame (float, requires attrs['rate'])
+                of the time window to read
+
+        Returns:
+            Iterator of Markers `xarray.DataArray`, each one covering at most `chunksize` frames
+
+        !!! example
+            ```python
+            from pyomeca import Markers
+
+            data_path = "./tests/data/markers.csv"
+            csv_kwargs = dict(header=2, first_row=5, first_column=2)
+
+            for chunk in Markers.from_csv_chunks(data_path, chunksize=100, **csv_kwargs):
+                print(chunk.time[0].item(), chunk.time[-1].item())
+            ```
+
+            The blocks can be summarized one after the other so that the whole file is never in memory:
+
+            ```python
+            import xarray as xr
+
+            channels = ["Daphnee:ASISr", "Daphnee:ASISl"]
+            chunks = Markers.from_csv_chunks(
+                data_path, chunksize=100, usecols=channels, **csv_kwargs
+            )
+            maximum = xr.concat([chunk.max("time") for chunk in chunks], "time").max("time")
+            ```
+        """
+        return read.read_csv_chunks(
             cls,
-            "csv",
             filename,
+            chunksize,
             usecols,
             header,
             first_row,
@@ -230,6 +336,8 @@ class Markers:
             skiprows,
             pandas_kwargs,
             attrs,
+            start,
+            stop,
         )
 
     @classmethod
@@ -248,6 +356,9 @@ class Markers:
         skiprows: Optional[List[int]] = None,
         pandas_kwargs: Optional[dict] = None,
         attrs: Optional[dict] = None,
+        start: Optional[Union[int, float]] = None,
+        stop: Optional[Union[int, float]] = None,
+        chunks: Optional[Union[int, tuple, dict]] = None,
     ) -> xr.DataArray:
         """
         Markers DataArray from an Excel file.
@@ -267,6 +378,11 @@ class Markers:
             skiprows: Line numbers to skip (0-indexed)
             pandas_kwargs: Keyword arguments to be passed to `pandas.read_excel`
             attrs: attrs to be passed to `xr.DataArray`. If attrs['rate'] is provided, compute the time accordingly
+            start: First frame (int) or time in seconds from the first frame (float, requires attrs['rate'])
+                of the time window to read. The rows before the window are skipped without being parsed
+            stop: Last frame (int, excluded) or time in seconds from the first frame (float, requires attrs['rate'])
+                of the time window to read. The rows after the window are not read
+            chunks: If specified, the data is backed by a dask array with these chunk sizes (see `xarray.DataArray.chunk`)
 
         Returns:
             Markers `xarray.DataArray` with the specified data and coordinates
@@ -325,22 +441,27 @@ class Markers:
             )
             ```
         """
-        return read.read_csv_or_excel(
-            cls,
-            "excel",
-            filename,
-            usecols,
-            header,
-            first_row,
-            first_column,
-            time_column,
-            last_column_to_remove,
-            prefix_delimiter,
-            suffix_delimiter,
-            skiprows,
-            pandas_kwargs,
-            attrs,
-            sheet_name,
+        return utils.chunk(
+            read.read_csv_or_excel(
+                cls,
+                "excel",
+                filename,
+                usecols,
+                header,
+                first_row,
+                first_column,
+                time_column,
+                last_column_to_remove,
+                prefix_delimiter,
+                suffix_delimiter,
+                skiprows,
+                pandas_kwargs,
+                attrs,
+                sheet_name,
+                start,
+                stop,
+            ),
+            chunks,
         )
 
     @classmethod
@@ -351,6 +472,10 @@ class Markers:
         prefix_delimiter: Optional[str] = None,
         suffix_delimiter: Optional[str] = None,
         attrs: Optional[dict] = None,
+        engine: str = "ezc3d",
+        start: Optional[Union[int, float]] = None,
+        stop: Optional[Union[int, float]] = None,
+        chunks: Optional[Union[int, tuple, dict]] = None,
     ) -> xr.DataArray:
         """
         Markers DataArray from a c3d file.
@@ -362,6 +487,15 @@ class Markers:
             prefix_delimiter: Delimiter that split each column name by its prefix (we keep only the column name)
             suffix_delimiter: Delimiter that split each column name by its suffix (we keep only the column name)
             attrs: attrs to be passed to xr.DataArray
+            engine: Parser used to read the file. `"ezc3d"` (default) reads the whole file with ezc3d.
+                `"native"` reads only the requested channels directly from the c3d data section,
+                so that the memory used scales with the selection and not with the file.
+                `"memmap"` maps the c3d data section in memory without reading it:
+                the values are read from the file only when they are accessed (e.g., after slicing a time window)
+            start: First frame (int) or time in seconds from the first frame (float) of the time window to read.
+                With the `"native"` and `"memmap"` engines, only the frames of the window are read from the file
+            stop: Last frame (int, excluded) or time in seconds from the first frame (float) of the time window to read
+            chunks: If specified, the data is backed by a dask array with these chunk sizes (see `xarray.DataArray.chunk`)
 
         Returns:
             Markers `xarray.DataArray` with the specified data and coordinates
@@ -393,19 +527,110 @@ class Markers:
             channels = ["ASISl", "PSISr", "PSISl"]
             markers = Markers.from_c3d(data_path, prefix_delimiter=":")
             ```
+
+            The `"native"` engine reads only the requested channels from the file,
+            which is much lighter on memory when selecting a few channels in a large file:
+
+            ```python
+            markers = Markers.from_c3d(
+                data_path, usecols=channels, prefix_delimiter=":", engine="native"
+            )
+            ```
+
+            For very long captures, the `"memmap"` engine does not read any data until it is needed.
+            Selecting a time window then only reads the corresponding part of the file:
+
+            ```python
+            markers = Markers.from_c3d(data_path, engine="memmap")
+            first_second = markers.sel(time=slice(0, 1)).load()
+            ```
+
+            To read only a time window, specify the first and last frames (int) or times in seconds (float):
+
+            ```python
+            markers = Markers.from_c3d(data_path, engine="native", start=1.0, stop=2.0)
+            ```
         """
-        return read.read_c3d(
-            cls, filename, usecols, prefix_delimiter, suffix_delimiter, attrs
+        return utils.chunk(
+            read.read_c3d(
+                cls,
+                filename,
+                usecols,
+                prefix_delimiter,
+                suffix_delimiter,
+                attrs,
+                engine,
+                start,
+                stop,
+            ),
+            chunks,
         )
 
     @classmethod
-    def from_trc(cls, filename: Union[str, Path], **kwargs) -> xr.DataArray:
+    def from_c3d_many(
+        cls,
+        filenames: List[Union[str, Path]],
+        n_jobs: Optional[int] = None,
+        concat: bool = False,
+        **kwargs,
+    ) -> Union[List[Optional[xr.DataArray]], xr.DataArray]:
+        """
+        Markers DataArrays from several c3d files read in parallel.
+
+        Arguments:
+            filenames: List of valid string paths
+            n_jobs: Number of processes used to read the files (defaults to the number of processors).
+                With `n_jobs=1`, the files are read one after the other in the current process
+            concat: If True, the files are concatenated along a new `trial` dimension
+                (the time and channel coordinates are aligned with an outer join)
+            kwargs: Keyword arguments passed to `Markers.from_c3d`
+
+        Returns:
+            List of Markers `xarray.DataArray` (`None` for the files that could not be read),
+                or a single Markers `xarray.DataArray` with a `trial` dimension if `concat=True`
+
+        !!! note
+            A file that cannot be read does not stop the batch: a warning is raised with the error
+            and the file is skipped.
+
+        !!! example
+            ```python
+            from pyomeca import Markers
+
+            data_paths = ["./tests/data/markers_analogs.c3d"] * 4
+            markers = Markers.from_c3d_many(data_paths, n_jobs=2)
+            ```
+
+            To get a single DataArray with a `trial` dimension:
+
+            ```python
+            markers = Markers.from_c3d_many(data_paths, n_jobs=2, concat=True, engine="native")
+            ```
+        """
+        return read.read_many(cls.from_c3d, filenames, n_jobs, concat, **kwargs)
+
+    @classmethod
+    def from_trc(
+        cls,
+        filename: Union[str, Path],
+        start: Optional[Union[int, float]] = None,
+        stop: Optional[Union[int, float]] = None,
+        chunks: Optional[Union[int, tuple, dict]] = None,
+        **kwargs,
+    ) -> xr.DataArray:
         """
         Markers DataArray from a trc file.
 
+        The header (`DataRate`, `NumMarkers` and `Units`) and the numeric block of the file are parsed directly,
+        without the generic csv reader.
+
         Arguments:
             filename: Any valid string path
-            kwargs: Keyword arguments to be passed to `from_csv`
+            start: First frame (int) or time in seconds from the first frame (float) of the time window to read
+            stop: Last frame (int, excluded) or time in seconds from the first frame (float) of the time window to read
+            kwargs: `usecols`, `prefix_delimiter`, `suffix_delimiter`, `skiprows`, `pandas_kwargs` and `attrs`
+                as in `from_csv`
+            chunks: If specified, the data is backed by a dask array with these chunk sizes (see `xarray.DataArray.chunk`)
 
         Returns:
             Markers `xarray.DataArray` with the specified data and coordinates
@@ -434,8 +659,14 @@ class Markers:
             channels = [3, 4]
             markers = Markers.from_trc(data_path, usecols=channels)
             ```
+
+            To read only a time window, specify the first and last frames (int) or times in seconds (float):
+
+            ```python
+            markers = Markers.from_trc(data_path, start=0.2, stop=0.6)
+            ```
         """
-        return read.read_trc(cls, filename, **kwargs)
+        return utils.chunk(read.read_trc(cls, filename, start, stop, **kwargs), chunks)
 
     @staticmethod
     def _reshape_flat_array(array: Union[np.array, np.ndarray]) -> xr.DataArray:
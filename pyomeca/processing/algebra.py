@@ -24,6 +24,9 @@ def norm(array: xr.DataArray, dim: Union[str, list], ord: int = None) -> xr.Data
         else array,
         input_core_dims=[[dim]] if isinstance(dim, str) else dim,
         kwargs={"ord": ord, "axis": -1},
+        dask="parallelized",
+        output_dtypes=[float],
+        dask_gufunc_kwargs={"allow_rechunk": True},
     )
 
 
@@ -35,6 +38,45 @@ def rms(array: xr.DataArray) -> xr.DataArray:
     return array.meca.square().mean().meca.sqrt()
 
 
+def moving_average(array: xr.DataArray, window: int, step: int = 1) -> xr.DataArray:
+    n_frames = array.time.size
+    if not 0 < window <= n_frames:
+        raise ValueError(
+            f"window must be between 1 and the number of frames ({n_frames}). You provided {window}"
+        )
+    if step < 1:
+        raise ValueError(f"step must be at least 1. You provided {step}")
+    axis = array.get_axis_num("time")
+    data = array.data
+    missing = np.isnan(data)
+
+    # the sum of each window is the difference of two cumulative sums: one pass whatever the window length
+    def moving_sum(values):
+        cumsum = np.cumsum(values, axis=axis, dtype=float)
+        padding = [(0, 0)] * array.ndim
+        padding[axis] = (1, 0)
+        cumsum = np.pad(cumsum, padding)
+        end = np.take(cumsum, np.arange(window, n_frames + 1, step), axis=axis)
+        start = np.take(cumsum, np.arange(0, n_frames + 1 - window, step), axis=axis)
+        return end - start
+
+    averaged = moving_sum(np.where(missing, 0, data)) / window
+    # windows containing missing values are missing
+    averaged = np.where(moving_sum(missing) > 0, np.nan, averaged)
+
+    first = np.arange(0, n_frames + 1 - window, step)
+    time = array.time.values
+    return (
+        array.isel(time=first)
+        .copy(data=averaged)
+        .assign_coords(time=(time[first] + time[first + window - 1]) / 2)
+    )
+
+
+def moving_rms(array: xr.DataArray, window: int, step: int = 1) -> xr.DataArray:
+    return np.sqrt(moving_average(np.square(array), window, step))
+
+
 def center(
     array: xr.DataArray, mu: Union[xr.DataArray, np.array, float, int] = None
 ) -> xr.DataArray:
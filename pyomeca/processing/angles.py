@@ -3,66 +3,114 @@ from typing import Callable
 import numpy as np
 import xarray as xr
 
+# For each angle of a sequence: the numpy function and the signed (sign, row, col) elements of the rotation matrix
+EULER_SEQUENCES = {
+    "x": (("arcsin", (1, 2, 1)),),
+    "y": (("arcsin", (1, 0, 2)),),
+    "z": (("arcsin", (1, 1, 0)),),
+    "xy": (("arcsin", (1, 2, 1)), ("arcsin", (1, 0, 2))),
+    "xz": (("arcsin", (-1, 1, 2)), ("arcsin", (-1, 0, 1))),
+    "yx": (("arcsin", (-1, 2, 0)), ("arcsin", (-1, 1, 2))),
+    "yz": (("arcsin", (1, 0, 2)), ("arcsin", (1, 1, 0))),
+    "zx": (("arcsin", (1, 1, 0)), ("arcsin", (1, 2, 1))),
+    "zy": (("arcsin", (-1, 0, 1)), ("arcsin", (-1, 2, 0))),
+    "xyz": (
+        ("arctan2", (-1, 1, 2), (1, 2, 2)),
+        ("arcsin", (1, 0, 2)),
+        ("arctan2", (-1, 0, 1), (1, 0, 0)),
+    ),
+    "xzy": (
+        ("arctan2", (1, 2, 1), (1, 1, 1)),
+        ("arcsin", (-1, 0, 1)),
+        ("arctan2", (1, 0, 2), (1, 0, 0)),
+    ),
+    "yxz": (
+        ("arctan2", (1, 0, 2), (1, 2, 2)),
+        ("arcsin", (-1, 1, 2)),
+        ("arctan2", (1, 1, 0), (1, 1, 1)),
+    ),
+    "yzx": (
+        ("arctan2", (-1, 2, 0), (1, 0, 0)),
+        ("arcsin", (1, 1, 0)),
+        ("arctan2", (-1, 1, 2), (1, 1, 1)),
+    ),
+    "zxy": (
+        ("arctan2", (-1, 0, 1), (1, 1, 1)),
+        ("arcsin", (1, 2, 1)),
+        ("arctan2", (-1, 2, 0), (1, 2, 2)),
+    ),
+    "zyx": (
+        ("arctan2", (1, 1, 0), (1, 0, 0)),
+        ("arcsin", (-1, 2, 0)),
+        ("arctan2", (1, 2, 1), (1, 2, 2)),
+    ),
+    "xyx": (
+        ("arctan2", (1, 1, 0), (-1, 2, 0)),
+        ("arccos", (1, 0, 0)),
+        ("arctan2", (1, 0, 1), (1, 0, 2)),
+    ),
+    "xzx": (
+        ("arctan2", (1, 2, 0), (1, 1, 0)),
+        ("arccos", (1, 0, 0)),
+        ("arctan2", (1, 0, 2), (-1, 0, 1)),
+    ),
+    "yxy": (
+        ("arctan2", (1, 0, 1), (1, 2, 1)),
+        ("arccos", (1, 1, 1)),
+        ("arctan2", (1, 1, 0), (-1, 1, 2)),
+    ),
+    "yzy": (
+        ("arctan2", (1, 2, 1), (-1, 0, 1)),
+        ("arccos", (1, 1, 1)),
+        ("arctan2", (1, 1, 2), (1, 1, 0)),
+    ),
+    "zxz": (
+        ("arctan2", (1, 0, 2), (-1, 1, 2)),
+        ("arccos", (1, 2, 2)),
+        ("arctan2", (1, 2, 0), (1, 2, 1)),
+    ),
+    "zyz": (
+        ("arctan2", (1, 1, 2), (1, 0, 2)),
+        ("arccos", (1, 2, 2)),
+        ("arctan2", (1, 2, 1), (-1, 2, 0)),
+    ),
+}
+EULER_SEQUENCES["zyzz"] = EULER_SEQUENCES["zyz"]
+
+
+def euler_angles(matrices: np.array, angle_sequence: str) -> np.array:
+    """
+    Euler angles of rotation matrices of shape (3 or 4, 3 or 4, ...) in a (n_angles, ...) array.
+    Any number of trailing batch dimensions (e.g., segments and frames) is handled at once.
+    """
+    if angle_sequence not in EULER_SEQUENCES:
+        raise ValueError(
+            f"angle_sequence should be one of {list(EULER_SEQUENCES)}. You provided {angle_sequence}"
+        )
+    sequence = EULER_SEQUENCES[angle_sequence]
+    angles = np.empty((len(sequence),) + matrices.shape[2:])
+    for i, (function, *elements) in enumerate(sequence):
+        getattr(np, function)(
+            *(sign * matrices[row, col] for sign, row, col in elements), out=angles[i]
+        )
+    return angles
+
 
 def angles_from_rototrans(
     caller: Callable, rototrans: xr.DataArray, angle_sequence: str
 ) -> xr.DataArray:
-    if angle_sequence == "zyzz":
-        angles = caller(np.ndarray(shape=(3, 1, rototrans.time.size)))
-    else:
-        angles = caller(np.ndarray(shape=(len(angle_sequence), 1, rototrans.time.size)))
-
-    if angle_sequence == "x":
-        angles[0, :, :] = np.arcsin(rototrans[2, 1, :])
-    elif angle_sequence == "y":
-        angles[0, :, :] = np.arcsin(rototrans[0, 2, :])
-    elif angle_sequence == "z":
-        angles[0, :, :] = np.arcsin(rototrans[1, 0, :])
-    elif angle_sequence == "xy":
-        angles[0, :, :] = np.arcsin(rototrans[2, 1, :])
-        angles[1, :, :] = np.arcsin(rototrans[0, 2, :])
-    elif angle_sequence == "xz":
-        angles[0, :, :] = -np.arcsin(rototrans[1, 2, :])
-        angles[1, :, :] = -np.arcsin(rototrans[0, 1, :])
-    elif angle_sequence == "yx":
-        angles[0, :, :] = -np.arcsin(rototrans[2, 0, :])
-        angles[1, :, :] = -np.arcsin(rototrans[1, 2, :])
-    elif angle_sequence == "yz":
-        angles[0, :, :] = np.arcsin(rototrans[0, 2, :])
-        angles[1, :, :] = np.arcsin(rototrans[1, 0, :])
-    elif angle_sequence == "zx":
-        angles[0, :, :] = np.arcsin(rototrans[1, 0, :])
-        angles[1, :, :] = np.arcsin(rototrans[2, 1, :])
-    elif angle_sequence == "zy":
-        angles[0, :, :] = -np.arcsin(rototrans[0, 1, :])
-        angles[1, :, :] = -np.arcsin(rototrans[2, 0, :])
-    elif angle_sequence == "xyz":
-        angles[0, :, :] = np.arctan2(-rototrans[1, 2, :], rototrans[2, 2, :])
-        angles[1, :, :] = np.arcsin(rototrans[0, 2, :])
-        angles[2, :, :] = np.arctan2(-rototrans[0, 1, :], rototrans[0, 0, :])
-    elif angle_sequence == "xzy":
-        angles[0, :, :] = np.arctan2(rototrans[2, 1, :], rototrans[1, 1, :])
-        angles[2, :, :] = np.arctan2(rototrans[0, 2, :], rototrans[0, 0, :])
-        angles[1, :, :] = np.arcsin(-rototrans[0, 1, :])
-    elif angle_sequence == "yzx":
-        angles[2, :, :] = np.arctan2(-rototrans[1, 2, :], rototrans[1, 1, :])
-        angles[0, :, :] = np.arctan2(-rototrans[2, 0, :], rototrans[0, 0, :])
-        angles[1, :, :] = np.arcsin(rototrans[1, 0, :])
-    elif angle_sequence == "zxy":
-        angles[1, :, :] = np.arcsin(rototrans[2, 1, :])
-        angles[2, :, :] = np.arctan2(-rototrans[2, 0, :], rototrans[2, 2, :])
-        angles[0, :, :] = np.arctan2(-rototrans[0, 1, :], rototrans[1, 1, :])
-    elif angle_sequence in ["zyz", "zyzz"]:
-        angles[0, :, :] = np.arctan2(rototrans[1, 2, :], rototrans[0, 2, :])
-        angles[1, :, :] = np.arccos(rototrans[2, 2, :])
-        angles[2, :, :] = np.arctan2(rototrans[2, 1, :], -rototrans[2, 0, :])
-    elif angle_sequence == "zyx":
-        angles[2, :, :] = np.arctan2(rototrans[2, 1, :], rototrans[2, 2, :])
-        angles[1, :, :] = np.arcsin(-rototrans[2, 0, :])
-        angles[0, :, :] = np.arctan2(rototrans[1, 0, :], rototrans[0, 0, :])
-    elif angle_sequence == "zxz":
-        angles[0, :, :] = np.arctan2(rototrans[0, 2, :], -rototrans[1, 2, :])
-        angles[1, :, :] = np.arccos(rototrans[2, 2, :])
-        angles[2, :, :] = np.arctan2(rototrans[2, 0, :], rototrans[2, 1, :])
+    rototrans = rototrans.transpose("row", "col", ..., "time")
+    extra_dims = list(rototrans.dims[2:-1])
+    data = euler_angles(rototrans.values, angle_sequence)
+    coords = {
+        name: coord
+        for name, coord in rototrans.coords.items()
+        if set(coord.dims) <= set(extra_dims + ["time"])
+    }
 
-    return angles
+    if not extra_dims:
+        angles = caller(data[:, np.newaxis, :])
+        return angles.assign_coords(coords)
+    return xr.DataArray(
+        data, dims=("axis", *extra_dims, "time"), coords=coords, name="angles"
+    )
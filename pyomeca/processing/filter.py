@@ -1,8 +1,25 @@
-from typing import Union
+import functools
+from typing import Callable, Optional, Union
 
 import numpy as np
 import xarray as xr
-from scipy.signal import butter, filtfilt
+from scipy.signal import butter, sosfilt, sosfilt_zi, sosfiltfilt
+
+
+@functools.lru_cache(maxsize=128)
+def butterworth_sos(freq: float, order: int, cutoff: tuple, btype: str) -> np.array:
+    """
+    Second-order sections of a Butterworth filter.
+    The design is cached: filtering many arrays with the same settings designs the filter only once.
+    """
+    nyquist = freq / 2
+    corrected_freq = np.array(cutoff) / nyquist
+    return butter(
+        N=order,
+        Wn=corrected_freq[0] if corrected_freq.size == 1 else corrected_freq,
+        btype=btype,
+        output="sos",
+    )
 
 
 def _base_filter(
@@ -12,10 +29,49 @@ def _base_filter(
     cutoff: Union[list, tuple, np.array],
     btype: str,
 ) -> xr.DataArray:
-    nyquist = freq / 2
-    corrected_freq = np.array(cutoff) / nyquist
-    b, a = butter(N=order, Wn=corrected_freq, btype=btype)
-    return xr.apply_ufunc(filtfilt, b, a, array)
+    sos = _sos(freq, order, cutoff, btype)
+    axis = _time_axis(array)
+    # sosfiltfilt pads the signal and returns a new array, so the data is not filtered in place:
+    # the input is neither transposed nor copied before, and the output buffer is used as is
+    return _apply_along_time(
+        array, functools.partial(sosfiltfilt, sos, axis=axis), _settling_samples(sos)
+    )
+
+
+def _sos(
+    freq: Union[int, float],
+    order: int,
+    cutoff: Union[list, tuple, np.array],
+    btype: str,
+) -> np.array:
+    cutoff = tuple(np.atleast_1d(cutoff).astype(float).tolist())
+    return butterworth_sos(float(freq), int(order), cutoff, btype)
+
+
+def _time_axis(array: xr.DataArray) -> int:
+    # the filters run along the time dimension wherever it is, without transposing the data
+    return array.get_axis_num("time" if "time" in array.dims else array.dims[-1])
+
+
+def _apply_along_time(
+    array: xr.DataArray, function: Callable, depth: int
+) -> xr.DataArray:
+    if array.chunks is None:
+        return array.copy(data=function(array.data))
+    # each dask chunk is filtered with enough neighbouring samples for the filter to settle
+    axis = _time_axis(array)
+    depth = min(depth, array.shape[axis] - 1)
+    return array.copy(
+        data=array.data.map_overlap(
+            function, depth={axis: depth}, boundary="none", dtype=float
+        )
+    )
+
+
+def _settling_samples(sos: np.array, tolerance: float = 1e-10) -> int:
+    """Number of samples after which the impulse response of the filter is below `tolerance`."""
+    radius = max(np.abs(np.roots(section[3:])).max() for section in sos)
+    return int(np.ceil(np.log(tolerance) / np.log(radius))) if radius > 0 else 1
 
 
 def low_pass(
@@ -52,3 +108,117 @@ def band_stop(
     cutoff: Union[list, tuple, np.array],
 ) -> xr.DataArray:
     return _base_filter(array, freq, order, cutoff, btype="bandstop")
+
+
+def envelope(
+    array: xr.DataArray,
+    freq: Union[int, float],
+    order: int,
+    cutoff: Union[int, float, np.array],
+    band_pass_cutoff: Optional[Union[list, tuple, np.array]] = None,
+    band_pass_order: Optional[int] = None,
+) -> xr.DataArray:
+    low_pass_sos = _sos(freq, order, cutoff, "low")
+    band_pass_sos = (
+        None
+        if band_pass_cutoff is None
+        else _sos(freq, band_pass_order or order, band_pass_cutoff, "bandpass")
+    )
+    axis = _time_axis(array)
+
+    def rectify_and_filter(data):
+        if band_pass_sos is not None:
+            data = sosfiltfilt(band_pass_sos, data, axis=axis)
+            # the band-passed signal is a new array: it is rectified in place
+            np.abs(data, out=data)
+        else:
+            data = np.abs(data)
+        return sosfiltfilt(low_pass_sos, data, axis=axis)
+
+    depth = _settling_samples(low_pass_sos)
+    if band_pass_sos is not None:
+        depth += _settling_samples(band_pass_sos)
+    return _apply_along_time(array, rectify_and_filter, depth)
+
+
+class StreamingFilter:
+    """
+    Causal Butterworth filter keeping its state between the chunks of a signal received one after the other
+    (e.g., during an acquisition), so that the filtered chunks are the same as the whole signal filtered at once.
+
+    Arguments:
+        freq: Sampling frequency
+        order: Order of the filter
+        cutoff: Cut-off frequency (a single value for `"low"` and `"high"`, (lower, upper) for `"bandpass"` and `"bandstop"`)
+        btype: Type of filter: `"low"`, `"high"`, `"bandpass"` or `"bandstop"`
+
+    !!! example
+        ```python
+        from pyomeca import Analogs, StreamingFilter
+
+        emg = Analogs.from_random_data(size=(16, 1000))
+        streaming_filter = StreamingFilter(
+            freq=1000, order=4, cutoff=[10, 400], btype="bandpass"
+        )
+        for first in range(0, 1000, 100):
+            filtered = streaming_filter(emg.isel(time=slice(first, first + 100)))
+        ```
+
+    Note:
+        Unlike `low_pass`, `high_pass`, `band_pass` and `band_stop`, the filter is applied forward only:
+        it introduces a phase lag but each chunk is filtered as soon as it arrives, in a time proportional to its length.
+    """
+
+    def __init__(
+        self,
+        freq: Union[int, float],
+        order: int,
+        cutoff: Union[int, float, list, tuple, np.array],
+        btype: str = "low",
+    ):
+        self.sos = _sos(freq, order, cutoff, btype)
+        self.zi = None
+
+    def __call__(self, chunk: xr.DataArray) -> xr.DataArray:
+        axis = _time_axis(chunk)
+        if self.zi is None:
+            self.zi = self._initial_state(chunk.values, axis)
+        elif self.zi.shape[1:] != self._state_shape(chunk.shape, axis):
+            raise ValueError(
+                "All the chunks should have the same dimensions except time. "
+                f"The filter state has the shape {self.zi.shape[1:]} "
+                f"and the chunk has the shape {chunk.shape}."
+            )
+        filtered, self.zi = sosfilt(self.sos, chunk.values, axis=axis, zi=self.zi)
+        return chunk.copy(data=filtered)
+
+    def reset(self):
+        """
+        Forget the state of the filter: the next chunk is filtered as the beginning of a new signal.
+
+        !!! example
+            To filter the trials of a session one after the other:
+
+            ```python
+            from pyomeca import Analogs, StreamingFilter
+
+            streaming_filter = StreamingFilter(freq=1000, order=2, cutoff=10)
+            for trial in range(3):
+                emg = Analogs.from_random_data(size=(16, 1000))
+                filtered = streaming_filter(emg)
+                streaming_filter.reset()
+            ```
+        """
+        self.zi = None
+
+    @staticmethod
+    def _state_shape(shape: tuple, axis: int) -> tuple:
+        return shape[:axis] + (2,) + shape[axis + 1 :]
+
+    def _initial_state(self, data: np.array, axis: int) -> np.array:
+        # steady state of a step with the first value, to avoid a transient at the beginning of the signal
+        first = np.take(data, [0], axis=axis)
+        zi = sosfilt_zi(self.sos).reshape(
+            (self.sos.shape[0],) + self._state_shape((1,) * data.ndim, axis)
+        )
+        return zi * first
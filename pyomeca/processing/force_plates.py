@@ -0,0 +1,109 @@
+from typing import Optional, Union
+
+import numpy as np
+import xarray as xr
+
+WRENCH_AXES = ["Fx", "Fy", "Fz", "Mx", "My", "Mz"]
+FORCE_PLATES_AXES = WRENCH_AXES + ["COPx", "COPy", "COPz", "Tz"]
+SUPPORTED_TYPES = (2, 4)
+
+
+def plates_frames(corners: np.array) -> tuple:
+    """
+    Rotation matrices (plate, 3, 3) from the plates to the global reference frame and centers (3, plate)
+    of the plates surfaces from the corners (3, 4, plate) of the plates, numbered in the (+x, +y), (-x, +y),
+    (-x, -y) and (+x, -y) quadrants.
+    """
+    x = corners[:, 0] - corners[:, 1]
+    y = corners[:, 0] - corners[:, 3]
+    z = np.cross(x, y, axis=0)
+    y = np.cross(z, x, axis=0)
+    axes = np.stack([x, y, z])
+    axes /= np.linalg.norm(axes, axis=1, keepdims=True)
+    # axes[k, :, p] is the k-th axis of the p-th plate: the k-th column of its rotation matrix
+    return axes.transpose(2, 1, 0), corners.mean(axis=1)
+
+
+def wrenches(
+    analogs: xr.DataArray,
+    channels: np.array,
+    calibration_matrices: Optional[np.array] = None,
+    types: Optional[np.array] = None,
+) -> xr.DataArray:
+    channels = np.asarray(channels)
+    n_plates = channels.shape[1]
+    types = np.full(n_plates, 2) if types is None else np.asarray(types)
+    unsupported = set(types.tolist()) - set(SUPPORTED_TYPES)
+    if unsupported:
+        raise ValueError(
+            f"Force platforms of type {sorted(unsupported)} are not supported. "
+            f"Supported types are {SUPPORTED_TYPES}"
+        )
+
+    # (6, plate, time) from one selection of the channels of all the plates
+    data = (
+        analogs.sel(channel=channels.ravel())
+        .transpose("channel", "time")
+        .values.reshape(6, n_plates, -1)
+    )
+    if calibration_matrices is None:
+        if (types == 4).any():
+            raise ValueError(
+                f"Force platforms {(np.flatnonzero(types == 4) + 1).tolist()} are of type 4 "
+                "and need a calibration matrix"
+            )
+        calibration_matrices = np.repeat(np.eye(6)[..., np.newaxis], n_plates, axis=2)
+    # the type 2 plates output forces and moments, they are not calibrated
+    calibration_matrices = np.where(
+        types == 4, calibration_matrices, np.eye(6)[..., np.newaxis]
+    )
+    return xr.DataArray(
+        np.einsum("ijp,jpt->ipt", calibration_matrices, data),
+        dims=("axis", "plate", "time"),
+        coords={
+            "axis": WRENCH_AXES,
+            "plate": np.arange(1, n_plates + 1),
+            "time": analogs.time,
+        },
+        name="force_plates",
+        attrs=analogs.attrs,
+    )
+
+
+def forces_moments_cop(
+    wrench: xr.DataArray,
+    corners: np.array,
+    origins: np.array,
+    threshold: Union[int, float] = 0,
+) -> xr.DataArray:
+    rotation, centers = plates_frames(corners)
+    forces, moments = wrench.values[:3], wrench.values[3:]
+    fx, fy, fz = forces
+    mx, my, mz = moments
+    origins = origins[..., np.newaxis]
+
+    # forces and moments are measured at the origin of the plate (ORIGIN is the vector from the center
+    # of the plate surface to the plate origin): the surface is at z = -ORIGIN_z in the plate reference frame
+    height = -origins[2]
+    loaded = np.abs(fz) > threshold
+    fz_loaded = np.where(loaded, fz, np.nan)
+    px = (height * fx - my) / fz_loaded
+    py = (mx + height * fy) / fz_loaded
+    free_moment = mz - px * fy + py * fx
+    cop = np.stack([px + origins[0], py + origins[1], np.zeros_like(px)])
+
+    # moments at the center of the plate surface
+    moments_center = moments + np.cross(origins, forces, axis=0)
+
+    def to_global(vector: np.array) -> np.array:
+        return np.einsum("pij,jpt->ipt", rotation, vector)
+
+    data = np.concatenate(
+        [
+            to_global(forces),
+            to_global(moments_center),
+            centers[..., np.newaxis] + to_global(cop),
+            free_moment[np.newaxis],
+        ]
+    )
+    return wrench.reindex(axis=FORCE_PLATES_AXES).copy(data=data)
@@ -2,6 +2,9 @@ from typing import Union
 
 import numpy as np
 import xarray as xr
+from scipy.signal import resample_poly
+
+from pyomeca.processing import rototrans
 
 
 def time_normalize(
@@ -19,4 +22,50 @@ def time_normalize(
         else:
             first_last_time = (array.time[0], array.time[-1])
         time_vector = np.linspace(first_last_time[0], first_last_time[1], n_frames)
+    if array.name == "rototrans":
+        # interpolating the matrix entries would not give rotation matrices
+        quaternions = rototrans.quaternions_from_rototrans(array)
+        return rototrans.rototrans_from_quaternions(
+            rototrans.slerp(quaternions, time_vector)
+        ).assign_attrs(array.attrs)
     return array.interp(time=time_vector)
+
+
+def downsample(
+    array: xr.DataArray, rate: Union[int, float], method: str = "mean"
+) -> xr.DataArray:
+    if "rate" not in array.attrs:
+        raise ValueError("The array has no `rate` attribute")
+    methods = ("mean", "rms", "decimate")
+    if method not in methods:
+        raise ValueError(f"method should be one of {methods}. You provided {method}")
+    ratio = array.attrs["rate"] / rate
+    if not np.isclose(ratio, round(ratio)) or round(ratio) < 1:
+        raise ValueError(
+            f"The rate of the array ({array.attrs['rate']}) must be a multiple of rate ({rate})"
+        )
+    ratio = int(round(ratio))
+    dims = array.dims
+    array = array.transpose(..., "time")
+
+    if method == "decimate":
+        # polyphase filtering: the anti-aliasing filter is only evaluated at the kept samples
+        data = resample_poly(array.values, up=1, down=ratio, axis=-1)
+        n_frames = data.shape[-1]
+    else:
+        # the samples of each frame are aggregated, the last incomplete frame is dropped
+        n_frames = array.time.size // ratio
+        data = array.data[..., : n_frames * ratio]
+        data = data.reshape(data.shape[:-1] + (n_frames, ratio))
+        data = (
+            data.mean(axis=-1)
+            if method == "mean"
+            else np.sqrt((data**2).mean(axis=-1))
+        )
+    # each frame is timed at its first sample, which aligns the analogs with the markers of a c3d file
+    return (
+        array.isel(time=slice(0, n_frames * ratio, ratio))
+        .copy(data=data)
+        .assign_attrs(rate=rate)
+        .transpose(*dims)
+    )
@@ -10,11 +10,11 @@ def rotate_markers(markers: xr.DataArray, rt: xr.DataArray) -> xr.DataArray:
     rotated_markers = markers.copy()
 
     if rt.ndim == 3 and markers.ndim == 3:
-        rotated_markers.data = np.einsum("ijk,jlk->ilk", rt, markers)
+        rotated_markers.data = np.einsum("ijk,jlk->ilk", rt.data, markers.data)
     elif rt.ndim == 2 and markers.ndim == 2:
-        rotated_markers.data = np.dot(rt, markers)
+        rotated_markers.data = np.dot(rt.data, markers.data)
     elif rt.ndim == 2 and markers.ndim == 3:
-        rotated_markers.data = np.einsum("ij,jkl->ikl", rt, markers)
+        rotated_markers.data = np.einsum("ij,jkl->ikl", rt.data, markers.data)
     else:
         raise ValueError("`rt` and `markers` dimensions do not match.")
 
@@ -1,8 +1,10 @@
 from typing import Union
 
 import numpy as np
+import pandas as pd
 import xarray as xr
-from scipy import fftpack
+from scipy import fft as sp_fft
+from scipy.signal import get_window
 
 
 def has_correct_name(array: xr.DataArray, name: str):
@@ -11,26 +13,127 @@ def has_correct_name(array: xr.DataArray, name: str):
 
 
 def fft(
-    array: xr.DataArray, freq: Union[int, float], only_positive=True
+    array: xr.DataArray,
+    freq: Union[int, float],
+    only_positive=True,
+    pad: bool = False,
+    workers: int = None,
 ) -> xr.DataArray:
     n = array.time.shape[0]
-    yfft = fftpack.fft(array.values, n)
-    freqs = fftpack.fftfreq(n, 1 / freq)
+    # zero-padding to a length with small prime factors, for which the FFT is the fastest
+    n_fft = sp_fft.next_fast_len(n, real=True) if pad else n
     if only_positive:
-        amp = 2 * np.abs(yfft) / n
-        half = int(np.floor(n / 2))
-        amp = amp[..., :half]
-        freqs = freqs[:half]
+        freqs = sp_fft.rfftfreq(n_fft, 1 / freq)[: int(np.floor(n_fft / 2))]
     else:
-        amp = np.abs(yfft) / n
+        freqs = sp_fft.fftfreq(n_fft, 1 / freq)
 
-    coords = {}
-    if "axis" in array.dims:
-        coords["axis"] = array.axis
-    coords["channel"] = array.channel
-    coords["freq"] = freqs
+    def amplitudes(x: np.array) -> np.array:
+        if only_positive:
+            # the spectrum of a real signal is symmetric: only its positive half is computed
+            yfft = sp_fft.rfft(x, n_fft, workers=workers)[..., : freqs.size]
+            return 2 * np.abs(yfft) / n
+        return np.abs(sp_fft.fft(x, n_fft, workers=workers)) / n
+
+    return (
+        xr.apply_ufunc(
+            amplitudes,
+            array,
+            input_core_dims=[["time"]],
+            output_core_dims=[["freq"]],
+            exclude_dims={"time"},
+            dask="parallelized",
+            output_dtypes=[float],
+            dask_gufunc_kwargs={
+                "output_sizes": {"freq": freqs.size},
+                "allow_rechunk": True,
+            },
+        )
+        .assign_coords(freq=freqs)
+        .rename(None)
+    )
+
+
+def spectrogram(
+    array: xr.DataArray,
+    freq: Union[int, float],
+    window_length: int,
+    step: int = None,
+    window: str = "hann",
+    workers: int = None,
+) -> xr.DataArray:
+    n = array.time.shape[0]
+    if not 0 < window_length <= n:
+        raise ValueError(
+            f"window_length must be between 1 and the number of frames ({n}). You provided {window_length}"
+        )
+    if step is None:
+        step = max(window_length // 2, 1)
+    if step < 1:
+        raise ValueError(f"step must be at least 1. You provided {step}")
+    first = np.arange(0, n - window_length + 1, step)
+    freqs = sp_fft.rfftfreq(window_length, 1 / freq)
+    taper = get_window(window, window_length)
+    # one-sided power spectral density (the DC and Nyquist components are not doubled)
+    scale = np.full(freqs.size, 2 / (freq * np.sum(taper**2)))
+    scale[0] /= 2
+    if window_length % 2 == 0:
+        scale[-1] /= 2
+
+    def power(x: np.array) -> np.array:
+        # read-only view on the overlapping windows: the frames are not copied before the detrending
+        segments = np.lib.stride_tricks.as_strided(
+            x,
+            shape=x.shape[:-1] + (first.size, window_length),
+            strides=x.strides[:-1] + (x.strides[-1] * step, x.strides[-1]),
+            writeable=False,
+        )
+        segments = (segments - segments.mean(axis=-1, keepdims=True)) * taper
+        spectrum = sp_fft.rfft(segments, axis=-1, workers=workers)
+        return (spectrum.real**2 + spectrum.imag**2) * scale
+
+    time = array.time.values
+    return (
+        xr.apply_ufunc(
+            power,
+            array,
+            input_core_dims=[["time"]],
+            output_core_dims=[["window_time", "freq"]],
+            exclude_dims={"time"},
+            dask="parallelized",
+            output_dtypes=[float],
+            dask_gufunc_kwargs={
+                "output_sizes": {"window_time": first.size, "freq": freqs.size},
+                "allow_rechunk": True,
+            },
+        )
+        .assign_coords(
+            window_time=(time[first] + time[first + window_length - 1]) / 2,
+            freq=freqs,
+        )
+        .rename(None)
+    )
+
+
+def median_frequency(array: xr.DataArray) -> xr.DataArray:
+    def median(power: np.array) -> np.array:
+        cumulative = np.cumsum(power, axis=-1)
+        half = cumulative >= cumulative[..., -1:] / 2
+        frequencies = array.freq.values[np.argmax(half, axis=-1)]
+        return np.where(np.isnan(cumulative[..., -1]), np.nan, frequencies)
+
+    return xr.apply_ufunc(
+        median,
+        array,
+        input_core_dims=[["freq"]],
+        dask="parallelized",
+        output_dtypes=[float],
+    )
 
-    return xr.DataArray(data=amp, dims=coords.keys(), coords=coords)
+
+def mean_frequency(array: xr.DataArray) -> xr.DataArray:
+    return (array * array.freq).sum("freq", skipna=False) / array.sum(
+        "freq", skipna=False
+    )
 
 
 def detect_onset(
@@ -65,19 +168,64 @@ def detect_onset(
         inds = inds[inds[:, 1] - inds[:, 0] >= n_above - 1, :]
         # minimum amplitude of n_above2 values in x to detect
         if threshold2 is not None and inds.size:
-            idel = np.ones(inds.shape[0], dtype=bool)
-            for i in range(inds.shape[0]):
-                if (
-                    np.count_nonzero(x[inds[i, 0] : inds[i, 1] + 1] >= threshold2)
-                    < n_above2
-                ):
-                    idel[i] = False
-            inds = inds[idel, :]
+            n_above_threshold2 = np.hstack((0, np.cumsum(x >= threshold2)))
+            n_above_threshold2 = (
+                n_above_threshold2[inds[:, 1] + 1] - n_above_threshold2[inds[:, 0]]
+            )
+            inds = inds[n_above_threshold2 >= n_above2, :]
     if not inds.size:
         inds = np.array([])
     return inds
 
 
+def detect_onsets(
+    array: xr.DataArray,
+    threshold: Union[float, int, xr.DataArray],
+    n_above: int = 1,
+    n_below: int = 0,
+    threshold2: Union[float, int, xr.DataArray] = None,
+    n_above2: int = 1,
+) -> pd.DataFrame:
+    dims = [dim for dim in array.dims if dim != "time"]
+    above = (array >= threshold).transpose(*dims, "time")
+    n_series, n_frames = int(np.prod(above.shape[:-1])), above.shape[-1]
+    above = above.values.reshape(n_series, n_frames)
+
+    # run-length encoding of the samples above threshold, for all the series at once
+    edges = np.diff(np.pad(above.astype(np.int8), ((0, 0), (1, 1))), axis=1)
+    series, starts = np.nonzero(edges == 1)
+    stops = np.nonzero(edges == -1)[1] - 1
+
+    # runs separated by at most n_below samples below threshold are merged
+    breaks = (np.diff(series) != 0) | (starts[1:] - stops[:-1] - 1 > n_below)
+    first_runs, last_runs = np.ones((2, series.size), dtype=bool)
+    first_runs[1:], last_runs[:-1] = breaks, breaks
+    series, starts, stops = series[first_runs], starts[first_runs], stops[last_runs]
+
+    # runs longer than or equal to n_above
+    keep = stops - starts >= n_above - 1
+    series, starts, stops = series[keep], starts[keep], stops[keep]
+
+    # minimum amplitude of n_above2 values to detect
+    if threshold2 is not None and series.size:
+        above2 = (array >= threshold2).transpose(*dims, "time").values
+        n_above_threshold2 = np.pad(
+            np.cumsum(above2.reshape(n_series, n_frames), axis=1), ((0, 0), (1, 0))
+        )
+        n_above_threshold2 = (
+            n_above_threshold2[series, stops + 1] - n_above_threshold2[series, starts]
+        )
+        keep = n_above_threshold2 >= n_above2
+        series, starts, stops = series[keep], starts[keep], stops[keep]
+
+    labels = np.unravel_index(series, array.transpose(*dims, "time").shape[:-1])
+    table = {
+        dim: array[dim].values[label] if dim in array.coords else label
+        for dim, label in zip(dims, labels)
+    }
+    return pd.DataFrame({**table, "start": starts, "stop": stops})
+
+
 def detect_outliers(array: xr.DataArray, threshold: int = 3) -> xr.DataArray:
     mu = array.mean(dim="time")
     sigma = array.std(dim="time")
@@ -2,7 +2,6 @@ from typing import Optional, Callable
 
 import numpy as np
 import xarray as xr
-from scipy.optimize import least_squares
 
 from pyomeca import Angles
 from pyomeca.processing import misc
@@ -50,43 +49,61 @@ def rototrans_from_euler_angles(
     if angles.time.size == 0:
         return caller()
 
-    empty_rt = np.repeat(np.eye(4)[..., np.newaxis], repeats=angles.time.size, axis=2)
-    rt = empty_rt.copy()
-    for i in range(angles.axis.size):
-        a = angles[i, ...]
-        matrix_to_prod = empty_rt.copy()
-        if angle_sequence[i] == "x":
-            # [[1, 0     ,  0     ],
-            #  [0, cos(a), -sin(a)],
-            #  [0, sin(a),  cos(a)]]
-            matrix_to_prod[1, 1, :] = np.cos(a)
-            matrix_to_prod[1, 2, :] = -np.sin(a)
-            matrix_to_prod[2, 1, :] = np.sin(a)
-            matrix_to_prod[2, 2, :] = np.cos(a)
-        elif angle_sequence[i] == "y":
-            # [[ cos(a), 0, sin(a)],
-            #  [ 0     , 1, 0     ],
-            #  [-sin(a), 0, cos(a)]]
-            matrix_to_prod[0, 0, :] = np.cos(a)
-            matrix_to_prod[0, 2, :] = np.sin(a)
-            matrix_to_prod[2, 0, :] = -np.sin(a)
-            matrix_to_prod[2, 2, :] = np.cos(a)
-        elif angle_sequence[i] == "z":
-            # [[cos(a), -sin(a), 0],
-            #  [sin(a),  cos(a), 0],
-            #  [0     ,  0     , 1]]
-            matrix_to_prod[0, 0, :] = np.cos(a)
-            matrix_to_prod[0, 1, :] = -np.sin(a)
-            matrix_to_prod[1, 0, :] = np.sin(a)
-            matrix_to_prod[1, 1, :] = np.cos(a)
-        else:
+    angles = angles.transpose("axis", ..., "time")
+    extra_dims = angles.dims[1:-1]
+    rt = np.zeros((4, 4) + angles.shape[1:])
+    for i in range(4):
+        rt[i, i] = 1
+    for axis, a in zip(angle_sequence, angles.values):
+        if axis not in "xyz":
             raise ValueError(
                 "angle_sequence must be a permutation of axes (e.g. 'xyz', 'yzx', ...)"
             )
-        rt = np.einsum("ijk,jlk->ilk", rt, matrix_to_prod)
-    # Put the translations
-    rt[:-1, -1:, :] = translations[:3, ...]
-    return caller(rt)
+        # right-multiplying by the elemental rotation around `axis` only mixes the two other columns:
+        # col_i <- cos(a) * col_i + sin(a) * col_j and col_j <- cos(a) * col_j - sin(a) * col_i
+        k = "xyz".index(axis)
+        i, j = (k + 1) % 3, (k + 2) % 3
+        cos, sin = np.cos(a), np.sin(a)
+        col_i, col_j = rt[:3, i].copy(), rt[:3, j]
+        rt[:3, i] = cos * col_i + sin * col_j
+        rt[:3, j] = cos * col_j - sin * col_i
+    # Put the translations, matched with the angles by dimension name
+    rt[:3, 3] = _broadcast_translations(translations, angles)
+
+    if extra_dims == ("channel",) and rt.shape[2] == 1:
+        return caller(rt[:, :, 0])
+    return xr.DataArray(
+        rt,
+        dims=("row", "col", *extra_dims, "time"),
+        coords={
+            name: coord
+            for name, coord in angles.coords.items()
+            if set(coord.dims) <= set(extra_dims)
+        },
+        name="rototrans",
+    )
+
+
+def _broadcast_translations(
+    translations: xr.DataArray, angles: xr.DataArray
+) -> np.array:
+    translations = translations.isel(axis=slice(None, 3))
+    for dim in translations.dims:
+        if dim not in ("axis", "time") and translations.sizes[dim] == 1:
+            if angles.sizes.get(dim) != 1:
+                # e.g., the same translation for all the channels
+                translations = translations.squeeze(dim, drop=True)
+    unknown = set(translations.dims) - set(angles.dims)
+    if unknown:
+        raise ValueError(
+            f"The translations have dimensions {sorted(unknown)} that the angles do not have"
+        )
+    sizes = {**angles.sizes, "axis": translations.sizes["axis"]}
+    return (
+        translations.variable.set_dims({dim: sizes[dim] for dim in angles.dims})
+        .transpose(*angles.dims)
+        .values
+    )
 
 
 def rototrans_from_markers(
@@ -162,41 +179,241 @@ def rototrans_from_markers(
     return rt
 
 
+def rototrans_from_segments(markers: xr.DataArray, segments: dict) -> xr.DataArray:
+    misc.has_correct_name(markers, "markers")
+    names = list(segments)
+    definitions = [segments[name] for name in names]
+    for name, definition in zip(names, definitions):
+        axes_name = definition["axes_name"]
+        if (
+            len(axes_name) != 2
+            or set(axes_name) - set("xyz")
+            or axes_name[0] == axes_name[1]
+        ):
+            raise ValueError(
+                f"Axes names of `{name}` should be 2 values of `x`, `y` and `z` permutations"
+            )
+        if definition["axis_to_recalculate"] not in ("x", "y", "z"):
+            raise ValueError(
+                f"`axis_to_recalculate` of `{name}` must be `x`, `y` or `z`"
+            )
+
+    # one selection per role of marker for all the segments: (xyz, segment, time)
+    def select(role, i=None):
+        channels = [d[role] if i is None else d[role][i] for d in definitions]
+        return (
+            markers.sel(channel=channels)
+            .transpose("axis", "channel", "time")
+            .values[:3]
+        )
+
+    origin = select("origin")
+    vector_1 = select("axis_1", 1) - select("axis_1", 0)
+    vector_2 = select("axis_2", 1) - select("axis_2", 0)
+
+    # axes[k, :, s] is the k-th axis (x, y or z) of the s-th segment
+    segment = np.arange(len(names))
+    first = np.array(["xyz".index(d["axes_name"][0]) for d in definitions])
+    second = np.array(["xyz".index(d["axes_name"][1]) for d in definitions])
+    recalculated = np.array(
+        ["xyz".index(d["axis_to_recalculate"]) for d in definitions]
+    )
+    axes = np.empty((3,) + vector_1.shape)
+    axes[first, :, segment] = vector_1.swapaxes(0, 1)
+    axes[second, :, segment] = vector_2.swapaxes(0, 1)
+    for k in (3 - first - second, recalculated):
+        # right-handed system: x = y ^ z, y = z ^ x, z = x ^ y
+        axes[k, :, segment] = np.cross(
+            axes[(k + 1) % 3, :, segment], axes[(k + 2) % 3, :, segment], axis=1
+        )
+    axes /= np.linalg.norm(axes, axis=1, keepdims=True)
+
+    rt = np.zeros((4, 4) + vector_1.shape[1:])
+    rt[:3, :3] = axes.swapaxes(0, 1)
+    rt[:3, 3] = origin
+    rt[3, 3] = 1
+    return xr.DataArray(
+        rt,
+        dims=("row", "col", "segment", "time"),
+        coords={"segment": names, "time": markers.time},
+        name="rototrans",
+    )
+
+
 def rototrans_from_transposed_rototrans(
     caller: Callable, rt: xr.DataArray
 ) -> xr.DataArray:
-    rt_t = caller(np.zeros((4, 4, rt.time.size)))
+    return inverse(rt)
 
-    # the rotation part is just the transposed of the rotation
-    rt_t.meca.rotation = rt.meca.rotation.transpose("col", "row", "time")
 
-    # the translation part is "- rt_t * translation"
-    rt_t.meca.translation = np.einsum(
-        "ijk,jlk->ilk", -rt_t.meca.rotation, rt.meca.translation
-    )
+def inverse(rt: xr.DataArray) -> xr.DataArray:
+    misc.has_correct_name(rt, "rototrans")
+    rt = rt.transpose("row", "col", ...)
+    data = rt.values
+    rotation, translation = data[:3, :3], data[:3, 3]
 
-    return rt_t
+    inverted = np.zeros_like(data)
+    # the rotation part is just the transposed of the rotation
+    inverted[:3, :3] = rotation.swapaxes(0, 1)
+    # the translation part is "- rotation.T * translation"
+    inverted[:3, 3] = -np.einsum("ji...,j...->i...", rotation, translation)
+    inverted[3, 3] = 1
+    return rt.copy(data=inverted)
+
+
+def compose(rt: xr.DataArray, other: xr.DataArray) -> xr.DataArray:
+    misc.has_correct_name(rt, "rototrans")
+    misc.has_correct_name(other, "rototrans")
+    # dimensions are matched by name, so a chain of segments can be composed with a single rototrans
+    rt, other = xr.broadcast(rt, other)
+    rt = rt.transpose("row", "col", ..., "time")
+    other = other.transpose(*rt.dims)
+    data, other_data = rt.values, other.values
+
+    composed = np.zeros(data.shape)
+    composed[:3, :3] = np.einsum("ij...,jk...->ik...", data[:3, :3], other_data[:3, :3])
+    composed[:3, 3] = (
+        np.einsum("ij...,j...->i...", data[:3, :3], other_data[:3, 3]) + data[:3, 3]
+    )
+    composed[3, 3] = 1
+    return rt.copy(data=composed)
 
 
 def rototrans_from_averaged_rototrans(
-    caller: Callable, rt: xr.DataArray
+    caller: Callable, rt: xr.DataArray, dim: str = "time"
 ) -> xr.DataArray:
-    # arbitrary angle sequence
-    seq = "xyz"
+    # a rototrans averaged over missing matrices is missing, not an average of the remaining ones
+    target = rt.mean(dim=dim, skipna=False).transpose("row", "col", ...)
+    data = target.values.copy()
+
+    # the closest rotation (in the Frobenius sense) to the averaged matrices is the polar factor
+    # of their SVD, with the last singular vector flipped when the projection is a reflection
+    mean_rotation = np.moveaxis(data[:3, :3], (0, 1), (-2, -1))
+    valid = np.isfinite(mean_rotation).all(axis=(-2, -1))
+    u, _, vt = np.linalg.svd(
+        np.where(valid[..., np.newaxis, np.newaxis], mean_rotation, np.eye(3))
+    )
+    u[..., -1] *= np.sign(np.linalg.det(u @ vt))[..., np.newaxis]
+    rotation = u @ vt
+    rotation[~valid] = np.nan
+    data[:3, :3] = np.moveaxis(rotation, (-2, -1), (0, 1))
+
+    averaged = target.copy(data=data)
+    if dim == "time":
+        return averaged.expand_dims("time", axis=-1)
+    return averaged.transpose("row", "col", ..., "time")
+
+
+QUATERNION_AXES = ["qw", "qx", "qy", "qz", "tx", "ty", "tz"]
+
+
+def quaternions_from_rototrans(rt: xr.DataArray) -> xr.DataArray:
+    misc.has_correct_name(rt, "rototrans")
+    rt = rt.transpose("row", "col", ...)
+    r = rt.values[:3, :3]
+    trace = r[0, 0] + r[1, 1] + r[2, 2]
+
+    # Shepperd's method: the four candidate solutions, each one being stable when its first component is large
+    candidates = np.stack(
+        [
+            [1 + trace, r[2, 1] - r[1, 2], r[0, 2] - r[2, 0], r[1, 0] - r[0, 1]],
+            [
+                r[2, 1] - r[1, 2],
+                1 + 2 * r[0, 0] - trace,
+                r[0, 1] + r[1, 0],
+                r[0, 2] + r[2, 0],
+            ],
+            [
+                r[0, 2] - r[2, 0],
+                r[0, 1] + r[1, 0],
+                1 + 2 * r[1, 1] - trace,
+                r[1, 2] + r[2, 1],
+            ],
+            [
+                r[1, 0] - r[0, 1],
+                r[0, 2] + r[2, 0],
+                r[1, 2] + r[2, 1],
+                1 + 2 * r[2, 2] - trace,
+            ],
+        ]
+    )
+    best = np.argmax(np.stack([trace, r[0, 0], r[1, 1], r[2, 2]]), axis=0)
+    quaternions = np.take_along_axis(candidates, best[np.newaxis, np.newaxis], axis=0)[
+        0
+    ]
+    quaternions /= np.linalg.norm(quaternions, axis=0)
+    # q and -q are the same rotation, the scalar part is kept positive
+    quaternions *= np.where(quaternions[0] < 0, -1, 1)
+
+    return xr.DataArray(
+        np.concatenate([quaternions, rt.values[:3, 3]]),
+        dims=("axis", *rt.dims[2:]),
+        coords={
+            "axis": QUATERNION_AXES,
+            **{k: v for k, v in rt.coords.items() if k not in ("row", "col")},
+        },
+        name="quaternions",
+    )
 
-    target = rt.mean(dim="time").expand_dims("time", axis=-1)
 
-    angles = Angles(np.ndarray((3, 1, 1)))
+def rototrans_from_quaternions(quaternions: xr.DataArray) -> xr.DataArray:
+    quaternions = quaternions.transpose("axis", ...)
+    w, x, y, z = quaternions.values[:4] / np.linalg.norm(quaternions.values[:4], axis=0)
+
+    rt = np.zeros((4, 4) + quaternions.shape[1:])
+    rt[0, 0] = 1 - 2 * (y**2 + z**2)
+    rt[0, 1] = 2 * (x * y - z * w)
+    rt[0, 2] = 2 * (x * z + y * w)
+    rt[1, 0] = 2 * (x * y + z * w)
+    rt[1, 1] = 1 - 2 * (x**2 + z**2)
+    rt[1, 2] = 2 * (y * z - x * w)
+    rt[2, 0] = 2 * (x * z - y * w)
+    rt[2, 1] = 2 * (y * z + x * w)
+    rt[2, 2] = 1 - 2 * (x**2 + y**2)
+    rt[:3, 3] = quaternions.values[4:7]
+    rt[3, 3] = 1
+
+    return xr.DataArray(
+        rt,
+        dims=("row", "col", *quaternions.dims[1:]),
+        coords={k: v for k, v in quaternions.coords.items() if k != "axis"},
+        name="rototrans",
+    )
+
 
-    def objective_function(x):
-        angles[:3, 0, 0] = x
-        rt = caller.from_euler_angles(angles, seq)
-        return (rt[:3, :3] - target[:3, :3]).values.reshape(9)
-        # return np.ravel(rt.meca.rotation - target.meca.rotation)
+def slerp(quaternions: xr.DataArray, time_vector: np.array) -> xr.DataArray:
+    quaternions = quaternions.transpose("axis", ..., "time")
+    time = quaternions.time.values
+    time_vector = np.asarray(time_vector)
+    data = quaternions.values
 
-    initia_guess = Angles.from_rototrans(target, seq).squeeze()
-    angles[:3, 0, 0] = least_squares(objective_function, initia_guess).x
-    return caller.from_euler_angles(angles, seq, translations=target.meca.translation)
+    # frame before each new time and relative position between this frame and the next one
+    before = np.clip(
+        np.searchsorted(time, time_vector, side="right") - 1, 0, time.size - 2
+    )
+    u = (time_vector - time[before]) / (time[before + 1] - time[before])
+    u[(u < 0) | (u > 1)] = np.nan
+    q0, q1 = data[:4, ..., before], data[:4, ..., before + 1]
+
+    # shortest path: q1 is flipped if it is in the other hemisphere
+    dot = np.sum(q0 * q1, axis=0)
+    q1 = q1 * np.where(dot < 0, -1, 1)
+    theta = np.arccos(np.clip(np.abs(dot), 0, 1))
+    sin_theta = np.sin(theta)
+    # close rotations are linearly interpolated to avoid dividing by zero
+    close = sin_theta < 1e-6
+    safe_sin_theta = np.where(close, 1, sin_theta)
+    w0 = np.where(close, 1 - u, np.sin((1 - u) * theta) / safe_sin_theta)
+    w1 = np.where(close, u, np.sin(u * theta) / safe_sin_theta)
+    interpolated = w0 * q0 + w1 * q1
+    interpolated /= np.linalg.norm(interpolated, axis=0)
+
+    translations = (1 - u) * data[4:, ..., before] + u * data[4:, ..., before + 1]
+    return (
+        quaternions.isel(time=before)
+        .copy(data=np.concatenate([interpolated, translations]))
+        .assign_coords(time=time_vector)
+    )
 
 
 def rotation_getter(array: xr.DataArray) -> xr.DataArray:
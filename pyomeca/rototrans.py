@@ -134,7 +134,9 @@ class Rototrans:
         Rototrans DataArray from euler angles and specified angle sequence.
 
         Arguments:
-            angles: Euler angles of the rototranslation matrix
+            angles: Euler angles of the rototranslation matrix.
+                Angles with several channels or extra dimensions (e.g., `segment`) give one matrix per channel,
+                with the `row`, `col`, extra dimensions and `time` dimensions
             angle_sequence: Euler sequence of angles. Valid values are all permutations of "xyz"
             translations: Translation part of the Rototrans matrix
 
@@ -162,6 +164,13 @@ class Rototrans:
                 angles=angles, angle_sequence=angles_sequence, translations=translation
             )
             ```
+
+            The matrices of several segments can be built at once:
+
+            ```python
+            segments_angles = Angles.from_random_data(size=(3, 15, 100))
+            rt = Rototrans.from_euler_angles(angles=segments_angles, angle_sequence=angles_sequence)
+            ```
         """
         return rototrans.rototrans_from_euler_angles(
             cls, angles, angle_sequence, translations
@@ -213,6 +222,79 @@ class Rototrans:
             cls, origin, axis_1, axis_2, axes_name, axis_to_recalculate
         )
 
+    @classmethod
+    def from_segments(cls, markers: xr.DataArray, segments: dict) -> xr.DataArray:
+        """
+        Rototrans DataArray of several segments defined from markers, computed at once.
+
+        Arguments:
+            markers: Markers containing the markers used in the segments definition
+            segments: Mapping of segment names to their definition, i.e. the arguments of `Rototrans.from_markers`
+                given as marker names (`origin`, `axis_1`, `axis_2`, `axes_name` and `axis_to_recalculate`)
+
+        Returns:
+            Rototrans `xarray.DataArray` with the `row`, `col`, `segment` and `time` dimensions
+
+        !!! example
+            To create the systems of axes of the thorax and the humerus:
+
+            ```python
+            from pyomeca import Markers, Rototrans
+
+            data_path = "./tests/data/markers_analogs.c3d"
+            markers = Markers.from_c3d(data_path, prefix_delimiter=":")
+
+            rt = Rototrans.from_segments(
+                markers,
+                segments={
+                    "thorax": {
+                        "origin": "STER",
+                        "axis_1": ("T1", "STER"),  # vector from T1 to STER
+                        "axis_2": ("XIPH", "STER"),  # vector from XIPH to STER
+                        "axes_name": "xy",
+                        "axis_to_recalculate": "x",
+                    },
+                    "humerus": {
+                        "origin": "ACRO_tip",
+                        "axis_1": ("EPICl", "ACRO_tip"),
+                        "axis_2": ("EPICm", "EPICl"),
+                        "axes_name": "yz",
+                        "axis_to_recalculate": "z",
+                    },
+                },
+            )
+            ```
+
+        !!! notes
+            The axes of all the segments are computed with one set of vectorized cross products,
+            which is much faster than calling `Rototrans.from_markers` for each segment.
+        """
+        return rototrans.rototrans_from_segments(markers, segments)
+
+    @classmethod
+    def from_quaternions(cls, quaternions: xr.DataArray) -> xr.DataArray:
+        """
+        Rototrans DataArray from quaternions and translations.
+
+        Arguments:
+            quaternions: Quaternions and translations with an `axis` dimension (`qw`, `qx`, `qy`, `qz`, `tx`, `ty` and `tz`)
+                as returned by `rt.meca.to_quaternions()`
+
+        Returns:
+            Rototrans `xarray.DataArray` from the specified quaternions and translations
+
+        !!! example
+            ```python
+            from pyomeca import Rototrans
+
+            rt = Rototrans.from_random_data()
+            quaternions = rt.meca.to_quaternions()
+
+            rt_from_quaternions = Rototrans.from_quaternions(quaternions)
+            ```
+        """
+        return rototrans.rototrans_from_quaternions(quaternions)
+
     @classmethod
     def from_transposed_rototrans(cls, rt: xr.DataArray) -> xr.DataArray:
         """
@@ -239,12 +321,21 @@ class Rototrans:
         return rototrans.rototrans_from_transposed_rototrans(cls, rt)
 
     @classmethod
-    def from_averaged_rototrans(cls, rt: xr.DataArray) -> xr.DataArray:
+    def from_averaged_rototrans(
+        cls, rt: xr.DataArray, dim: str = "time"
+    ) -> xr.DataArray:
         """
         Rototrans DataArray from an averaged Rototrans.
 
+        The rotation is the closest rotation matrix to the mean of the rotation matrices
+        (projection of the mean matrix with a singular value decomposition), without any iterative optimization.
+
         Arguments:
             rt: Rototrans to average
+            dim: Dimension along which the rototrans are averaged (e.g., `time`, `trial` or a rolling `window`).
+                When averaging along `time`, the result keeps a `time` dimension of length 1.
+                The average of rototrans with missing values (`nan`) is missing
+                (e.g., the incomplete windows at the edges of a rolling average)
 
         Returns:
             Averaged Rototrans `xarray.DataArray`
@@ -273,5 +364,12 @@ class Rototrans:
             error = (angles_mean - angles_mean_ref).meca.abs().sum()
             print(error)
             ```
+
+            A moving average over windows of 10 frames:
+
+            ```python
+            windows = rt.rolling(time=10, center=True).construct("window")
+            rt_moving_mean = Rototrans.from_averaged_rototrans(windows, dim="window")
+            ```
         """
-        return rototrans.rototrans_from_averaged_rototrans(cls, rt)
+        return rototrans.rototrans_from_averaged_rototrans(cls, rt, dim)
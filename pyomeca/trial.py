@@ -0,0 +1,48 @@
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import xarray as xr
+
+from pyomeca.analogs import Analogs
+from pyomeca.io import read
+from pyomeca.markers import Markers
+
+
+def read_c3d_trial(
+    filename: Union[str, Path],
+    markers_kwargs: Optional[dict] = None,
+    analogs_kwargs: Optional[dict] = None,
+) -> Tuple[xr.DataArray, xr.DataArray, dict]:
+    """
+    Markers, Analogs and metadata of a c3d file, read with only one parse of the file.
+
+    `Markers.from_c3d` followed by `Analogs.from_c3d` parses the same file twice.
+    Use this function when both the markers and the analogs of a trial are needed.
+
+    Arguments:
+        filename: Any valid string path
+        markers_kwargs: Keyword arguments of `Markers.from_c3d`
+            (`usecols`, `prefix_delimiter`, `suffix_delimiter`, `attrs`, `start` and `stop`)
+        analogs_kwargs: Keyword arguments of `Analogs.from_c3d`
+            (`usecols`, `prefix_delimiter`, `suffix_delimiter`, `attrs`, `start` and `stop`)
+
+    Returns:
+        Markers and Analogs `xarray.DataArray` of the c3d file, and its metadata
+            (`{"header": ..., "parameters": {group: {parameter: value}}}`)
+
+    !!! example
+        ```python
+        from pyomeca import read_c3d_trial
+
+        data_path = "./tests/data/markers_analogs.c3d"
+        markers, analogs, metadata = read_c3d_trial(
+            data_path,
+            markers_kwargs=dict(prefix_delimiter=":"),
+            analogs_kwargs=dict(prefix_delimiter=".", usecols=["EMG1", "EMG10"]),
+        )
+        subject = metadata["parameters"]["SUBJECTS"]["NAMES"]
+        ```
+    """
+    return read.read_c3d_trial(
+        Markers, Analogs, filename, markers_kwargs, analogs_kwargs
+    )
@@ -21,6 +21,7 @@ else:
 
 MARKERS_CSV = DATA_FOLDER / "markers.csv"
 MARKERS_ANALOGS_C3D = DATA_FOLDER / "markers_analogs.c3d"
+FORCE_PLATES_C3D = DATA_FOLDER / "force_plates.c3d"
 ANALOGS_CSV = DATA_FOLDER / "analogs.csv"
 MARKERS_CSV_WITHOUT_HEADER = DATA_FOLDER / "markers_without_header.csv"
 MARKERS_XLSX = DATA_FOLDER / "markers.xlsx"
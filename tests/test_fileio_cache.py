@@ -0,0 +1,110 @@
+import shutil
+import warnings
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from pyomeca import Analogs, Markers
+from pyomeca.io import cache, read
+from ._constants import ANALOGS_STO, MARKERS_ANALOGS_C3D, ANALOGS_XLSX
+
+
+@pytest.fixture
+def cache_directory(tmp_path):
+    cache.enable(tmp_path / "cache")
+    yield tmp_path / "cache"
+    cache.disable()
+
+
+def test_cache_hit(cache_directory, monkeypatch):
+    markers = Markers.from_c3d(MARKERS_ANALOGS_C3D, usecols=[1, 2])
+    analogs = Analogs.from_excel(ANALOGS_XLSX, header=3, first_row=5, first_column=2)
+    assert len(list(cache_directory.glob("*.nc"))) == 2
+
+    def not_parsed(*args, **kwargs):
+        raise AssertionError("the file should be loaded from the cache")
+
+    monkeypatch.setattr(read.ezc3d, "c3d", not_parsed)
+    monkeypatch.setattr(read.pd, "read_excel", not_parsed)
+    xr.testing.assert_identical(
+        Markers.from_c3d(MARKERS_ANALOGS_C3D, usecols=[1, 2]), markers
+    )
+    xr.testing.assert_identical(
+        Analogs.from_excel(ANALOGS_XLSX, header=3, first_row=5, first_column=2), analogs
+    )
+    assert (
+        Markers.from_c3d(MARKERS_ANALOGS_C3D, usecols=[1, 2]).channel.dtype.kind == "U"
+    )
+
+    # other arguments are other entries
+    with pytest.raises(AssertionError):
+        Markers.from_c3d(MARKERS_ANALOGS_C3D, usecols=[1, 3])
+
+
+def test_cache_invalidation(cache_directory, tmp_path):
+    filename = tmp_path / "analogs.sto"
+    shutil.copy(ANALOGS_STO, filename)
+    analogs = Analogs.from_sto(filename)
+    # sto files are read with from_csv, but only one entry is cached
+    assert len(list(cache_directory.glob("*.nc"))) == 1
+
+    filename.write_text(filename.read_text().replace("\n1.56,", "\n1.55,", 1))
+    assert Analogs.from_sto(filename).time[0] != analogs.time[0]
+    assert len(list(cache_directory.glob("*.nc"))) == 2
+
+    cache.clear()
+    assert not list(cache_directory.glob("*.nc"))
+
+
+def test_cache_eviction(cache_directory):
+    Markers.from_c3d(MARKERS_ANALOGS_C3D, usecols=[1])
+    entry_size = next(cache_directory.glob("*.nc")).stat().st_size
+    cache.enable(cache_directory, max_size=int(entry_size * 2.5))
+
+    first = Markers.from_c3d(MARKERS_ANALOGS_C3D, usecols=[1])
+    Markers.from_c3d(MARKERS_ANALOGS_C3D, usecols=[2])
+    Markers.from_c3d(MARKERS_ANALOGS_C3D, usecols=[1])  # most recently used
+    Markers.from_c3d(MARKERS_ANALOGS_C3D, usecols=[3])
+    entries = list(cache_directory.glob("*.nc"))
+    assert len(entries) == 2
+
+    cache.disable()
+    Markers.from_c3d(MARKERS_ANALOGS_C3D, usecols=[4])
+    assert len(list(cache_directory.glob("*.nc"))) == 2
+    cache.enable(cache_directory)
+    xr.testing.assert_identical(
+        Markers.from_c3d(MARKERS_ANALOGS_C3D, usecols=[1]), first
+    )
+
+
+def test_cache_memmap_not_cached(cache_directory):
+    Markers.from_c3d(MARKERS_ANALOGS_C3D, engine="memmap")
+    assert not list(cache_directory.glob("*.nc"))
+
+
+def test_cache_concurrent_reads(cache_directory):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        analogs = Analogs.from_c3d_many([MARKERS_ANALOGS_C3D] * 8, n_jobs=8)
+    expected = Analogs.from_c3d(MARKERS_ANALOGS_C3D)
+    for array in analogs:
+        xr.testing.assert_identical(array, expected)
+    assert len(list(cache_directory.glob("*.nc"))) == 1
+    assert not list(cache_directory.glob("*.tmp"))
+
+
+def test_cache_key_large_arrays():
+    # numpy abbreviates the repr of arrays larger than 1000 elements
+    first, second = np.arange(2000), np.arange(2000)
+    second[1000] = -1
+    assert repr(first) == repr(second)
+    keys = [
+        cache._key(
+            read.read_c3d,
+            {"filename": MARKERS_ANALOGS_C3D, "caller": Markers, "usecols": usecols},
+        )
+        for usecols in (first, second, first.copy())
+    ]
+    assert keys[0] != keys[1]
+    assert keys[0] == keys[2]
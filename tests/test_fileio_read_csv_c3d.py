@@ -1,7 +1,10 @@
 import numpy as np
 import pytest
+import xarray as xr
+from xarray.core import indexing
 
-from pyomeca import Analogs, Markers
+from pyomeca import Analogs, Markers, read_c3d_trial
+from pyomeca.io import c3d, read
 from tests._constants import (
     MARKERS_ANALOGS_C3D,
     ANALOGS_CSV,
@@ -188,3 +191,213 @@ def test_read_xlsx():
         Analogs.from_excel(**{**analogs_csv_kwargs, **dict(filename=ANALOGS_XLSX)}),
         **EXPECTED_VALUES[61],
     )
+
+
+def test_read_c3d_trial():
+    markers_kwargs = dict(usecols=["CLAV_post", "PSISl"], prefix_delimiter=":")
+    analogs_kwargs = dict(usecols=["EMG1", "EMG10"], prefix_delimiter=".")
+    markers, analogs, metadata = read.read_c3d_trial(
+        Markers,
+        Analogs,
+        MARKERS_ANALOGS_C3D,
+        markers_kwargs=markers_kwargs,
+        analogs_kwargs=analogs_kwargs,
+    )
+
+    expected_markers = Markers.from_c3d(MARKERS_ANALOGS_C3D, **markers_kwargs)
+    expected_analogs = Analogs.from_c3d(MARKERS_ANALOGS_C3D, **analogs_kwargs)
+    xr.testing.assert_identical(markers, expected_markers)
+    xr.testing.assert_identical(analogs, expected_analogs)
+
+    assert metadata["header"]["points"]["frame_rate"] == markers.attrs["rate"]
+    assert metadata["header"]["analogs"]["frame_rate"] == analogs.attrs["rate"]
+    assert len(metadata["parameters"]["POINT"]["LABELS"]) == 51
+
+    public_markers, public_analogs, public_metadata = read_c3d_trial(
+        MARKERS_ANALOGS_C3D,
+        markers_kwargs=markers_kwargs,
+        analogs_kwargs=analogs_kwargs,
+    )
+    xr.testing.assert_identical(public_markers, expected_markers)
+    xr.testing.assert_identical(public_analogs, expected_analogs)
+    assert public_metadata["header"] == metadata["header"]
+    assert public_metadata["parameters"].keys() == metadata["parameters"].keys()
+
+
+def test_read_c3d_analogs_without_points():
+    reader = {
+        "header": {
+            "points": {"frame_rate": 0, "first_frame": 0, "last_frame": 0},
+            "analogs": {"frame_rate": 1000},
+        },
+        "parameters": {
+            "ANALOG": {"LABELS": {"value": ["EMG1", "EMG2"]}, "UNITS": {"value": ["V"]}}
+        },
+        "data": {"analogs": np.random.rand(1, 2, 50)},
+    }
+    analogs = read._c3d_group_to_dataarray(Analogs, reader, "ANALOG", stop=0.01)
+    assert analogs.attrs["rate"] == 1000
+    assert analogs.time.size == 10
+
+
+@pytest.mark.parametrize(
+    "usecols", [None, ["EMG1", "EMG10", "EMG11", "EMG12"], [1, 3, 5, 7], ["EMG1"]]
+)
+@pytest.mark.parametrize("engine", ["native", "memmap"])
+def test_read_analogs_c3d_native_engine(usecols, engine):
+    kwargs = dict(filename=MARKERS_ANALOGS_C3D, prefix_delimiter=".", usecols=usecols)
+    xr.testing.assert_identical(
+        Analogs.from_c3d(**kwargs, engine=engine), Analogs.from_c3d(**kwargs)
+    )
+
+
+@pytest.mark.parametrize(
+    "usecols", [None, ["CLAV_post", "PSISl", "STERr", "CLAV_post"], [1, 3, 5, 7]]
+)
+@pytest.mark.parametrize("engine", ["native", "memmap"])
+def test_read_markers_c3d_native_engine(usecols, engine):
+    kwargs = dict(filename=MARKERS_ANALOGS_C3D, prefix_delimiter=":", usecols=usecols)
+    xr.testing.assert_identical(
+        Markers.from_c3d(**kwargs, engine=engine), Markers.from_c3d(**kwargs)
+    )
+
+    with pytest.raises(ValueError):
+        Markers.from_c3d(**kwargs, engine="unknown")
+
+
+def test_read_c3d_frames():
+    layout = c3d.read_c3d_layout(MARKERS_ANALOGS_C3D)
+    points = Markers.from_c3d(MARKERS_ANALOGS_C3D)
+    analogs = Analogs.from_c3d(MARKERS_ANALOGS_C3D)
+
+    np.testing.assert_array_equal(
+        c3d.read_c3d_frames(MARKERS_ANALOGS_C3D, layout, "POINT", [3, 7], 10, 50),
+        points[:, [3, 7], 10:50],
+    )
+    by_frame = layout["analog_by_frame"]
+    np.testing.assert_array_equal(
+        c3d.read_c3d_frames(MARKERS_ANALOGS_C3D, layout, "ANALOG", [3, 7], 10, 50),
+        analogs[[3, 7], 10 * by_frame : 50 * by_frame],
+    )
+
+
+def test_read_c3d_memmap_is_lazy():
+    markers = Markers.from_c3d(MARKERS_ANALOGS_C3D, engine="memmap")
+    analogs = Analogs.from_c3d(MARKERS_ANALOGS_C3D, engine="memmap")
+    assert isinstance(markers.variable._data, indexing.LazilyIndexedArray)
+    assert isinstance(analogs.variable._data, indexing.LazilyIndexedArray)
+
+    window = dict(time=slice(1, 2))
+    xr.testing.assert_identical(
+        markers.sel(**window), Markers.from_c3d(MARKERS_ANALOGS_C3D).sel(**window)
+    )
+    xr.testing.assert_identical(
+        analogs.isel(channel=3, time=slice(100, 150)),
+        Analogs.from_c3d(MARKERS_ANALOGS_C3D).isel(channel=3, time=slice(100, 150)),
+    )
+
+
+@pytest.mark.parametrize("engine", ["ezc3d", "native", "memmap"])
+@pytest.mark.parametrize("start, stop", [(10, 50), (0.1, 0.5), (None, 30), (570, None)])
+def test_read_c3d_window(engine, start, stop):
+    kwargs = dict(filename=MARKERS_ANALOGS_C3D, engine=engine)
+    markers = Markers.from_c3d(**kwargs)
+    analogs = Analogs.from_c3d(**kwargs)
+    frames = slice(
+        int(start * 100) if isinstance(start, float) else start,
+        int(stop * 100) if isinstance(stop, float) else stop,
+    )
+    by_frame = 20
+    samples = slice(
+        frames.start * by_frame if frames.start else None,
+        frames.stop * by_frame if frames.stop else None,
+    )
+
+    xr.testing.assert_allclose(
+        Markers.from_c3d(**kwargs, start=start, stop=stop), markers.isel(time=frames)
+    )
+    xr.testing.assert_allclose(
+        Analogs.from_c3d(
+            **kwargs,
+            start=start * by_frame if isinstance(start, int) else start,
+            stop=stop * by_frame if isinstance(stop, int) else stop,
+        ),
+        analogs.isel(time=samples),
+    )
+
+
+def test_read_csv_window():
+    full = Analogs.from_csv(**analogs_csv_kwargs, attrs={"rate": 2000})
+    xr.testing.assert_allclose(
+        Analogs.from_csv(**analogs_csv_kwargs, attrs={"rate": 2000}, start=10, stop=50),
+        full.isel(time=slice(10, 50)),
+    )
+    xr.testing.assert_allclose(
+        Analogs.from_csv(**analogs_csv_kwargs, attrs={"rate": 2000}, start=0.01),
+        full.isel(time=slice(20, None)),
+    )
+
+    with pytest.raises(ValueError):
+        Analogs.from_csv(**analogs_csv_kwargs, start=0.01)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_read_c3d_many(n_jobs):
+    expected = Analogs.from_c3d(MARKERS_ANALOGS_C3D, usecols=[1, 2])
+    with pytest.warns(UserWarning, match="could not be read"):
+        analogs = Analogs.from_c3d_many(
+            [MARKERS_ANALOGS_C3D, "not_a_file.c3d", MARKERS_ANALOGS_C3D],
+            n_jobs=n_jobs,
+            usecols=[1, 2],
+        )
+    assert analogs[1] is None
+    xr.testing.assert_identical(analogs[0], expected)
+    xr.testing.assert_identical(analogs[2], expected)
+
+    markers = Markers.from_c3d_many(
+        [MARKERS_ANALOGS_C3D, MARKERS_ANALOGS_C3D],
+        n_jobs=n_jobs,
+        concat=True,
+        stop=100,
+    )
+    assert markers.dims == ("trial", "axis", "channel", "time")
+    xr.testing.assert_equal(
+        markers.isel(trial=1, drop=True),
+        Markers.from_c3d(MARKERS_ANALOGS_C3D, stop=100),
+    )
+
+    with pytest.raises(ValueError), pytest.warns(UserWarning):
+        Markers.from_c3d_many(["not_a_file.c3d"], n_jobs=n_jobs, concat=True)
+
+
+@pytest.mark.parametrize("chunksize", [7, 100, 1000])
+def test_read_csv_chunks(chunksize):
+    attrs = {"rate": 2000}
+    analogs = Analogs.from_csv(**analogs_csv_kwargs, attrs=attrs)
+    chunks = list(
+        Analogs.from_csv_chunks(**analogs_csv_kwargs, chunksize=chunksize, attrs=attrs)
+    )
+    assert all(chunk.time.size <= chunksize for chunk in chunks)
+    xr.testing.assert_identical(xr.concat(chunks, "time"), analogs)
+
+    usecols = ["CLAV_post", "PSISl"]
+    markers = Markers.from_csv(**markers_csv_kwargs, usecols=usecols, start=5, stop=60)
+    chunks = Markers.from_csv_chunks(
+        **markers_csv_kwargs, usecols=usecols, start=5, stop=60, chunksize=chunksize
+    )
+    xr.testing.assert_identical(xr.concat(list(chunks), "time"), markers)
+
+
+@pytest.mark.parametrize("engine", ["ezc3d", "memmap"])
+def test_read_c3d_chunks(engine):
+    dask = pytest.importorskip("dask")
+    kwargs = dict(filename=MARKERS_ANALOGS_C3D, engine=engine)
+    markers = Markers.from_c3d(**kwargs, chunks={"channel": 10})
+    analogs = Analogs.from_c3d(**kwargs, chunks={"time": 1000})
+    assert dask.is_dask_collection(markers) and dask.is_dask_collection(analogs)
+    xr.testing.assert_identical(markers.compute(), Markers.from_c3d(**kwargs).load())
+    xr.testing.assert_identical(analogs.compute(), Analogs.from_c3d(**kwargs).load())
+
+    csv = Analogs.from_csv(**analogs_csv_kwargs, chunks=100)
+    assert dask.is_dask_collection(csv)
+    xr.testing.assert_identical(csv.compute(), Analogs.from_csv(**analogs_csv_kwargs))
@@ -1,4 +1,8 @@
+import tracemalloc
+
+import numpy as np
 import pytest
+import xarray as xr
 
 from pyomeca import Analogs, Markers
 from ._constants import (
@@ -23,3 +27,111 @@ def test_read_mot():
 
 def test_read_trc():
     is_expected_array(Markers.from_trc(MARKERS_TRC), **EXPECTED_VALUES[64])
+
+
+def test_read_window():
+    trc = Markers.from_trc(MARKERS_TRC)
+    xr.testing.assert_allclose(
+        Markers.from_trc(MARKERS_TRC, start=0.2, stop=0.6), trc.isel(time=slice(20, 60))
+    )
+    sto = Analogs.from_sto(ANALOGS_STO)
+    xr.testing.assert_allclose(
+        Analogs.from_sto(ANALOGS_STO, start=5, stop=15), sto.isel(time=slice(5, 15))
+    )
+    mot = Analogs.from_mot(ANALOGS_MOT)
+    xr.testing.assert_allclose(
+        Analogs.from_mot(ANALOGS_MOT, stop=10), mot.isel(time=slice(None, 10))
+    )
+
+
+def test_read_window_one_frame():
+    sto = Analogs.from_sto(ANALOGS_STO)
+    one_frame = Analogs.from_sto(ANALOGS_STO, start=5, stop=6)
+    xr.testing.assert_allclose(one_frame, sto.isel(time=slice(5, 6)))
+    assert one_frame.attrs["rate"] == sto.attrs["rate"]
+
+    mot = Analogs.from_mot(ANALOGS_MOT)
+    one_frame = Analogs.from_mot(ANALOGS_MOT, start=0.05, stop=0.06)
+    xr.testing.assert_allclose(one_frame, mot.isel(time=slice(5, 6)))
+    assert one_frame.attrs["rate"] == mot.attrs["rate"]
+
+    trc = Markers.from_trc(MARKERS_TRC)
+    one_frame = Markers.from_trc(MARKERS_TRC, start=5, stop=6)
+    xr.testing.assert_allclose(one_frame, trc.isel(time=slice(5, 6)))
+    assert one_frame.attrs["rate"] == trc.attrs["rate"]
+
+
+def read_trc_with_csv(filename, **kwargs):
+    # generic csv reader, with the rate of the trc reader
+    return Markers.from_csv(
+        filename, header=3, first_row=6, first_column=1, time_column=1, **kwargs
+    ).assign_attrs(rate=100.0)
+
+
+def test_read_trc_same_as_csv():
+    trc = Markers.from_trc(MARKERS_TRC)
+    csv = read_trc_with_csv(MARKERS_TRC)
+    xr.testing.assert_identical(trc, csv)
+    xr.testing.assert_identical(
+        Markers.from_trc(MARKERS_TRC, usecols=["STER", "STERl"], start=0.1, stop=50),
+        csv.sel(channel=["STER", "STERl"]).isel(time=slice(10, 50)),
+    )
+    xr.testing.assert_identical(
+        Markers.from_trc(MARKERS_TRC, skiprows=[4, 5, 7, 9], attrs={"units": "mm"}),
+        read_trc_with_csv(MARKERS_TRC, skiprows=[4, 5, 7, 9], attrs={"units": "mm"}),
+    )
+    xr.testing.assert_identical(
+        Markers.from_trc(MARKERS_TRC, pandas_kwargs={"dtype": np.float32}),
+        read_trc_with_csv(MARKERS_TRC, pandas_kwargs={"dtype": np.float32}),
+    )
+
+
+def test_read_trc_tab_delimited(tmp_path):
+    lines = [
+        "PathFileType\t4\t(X/Y/Z)\tfile.trc",
+        "DataRate\tCameraRate\tNumFrames\tNumMarkers\tUnits",
+        "200\t200\t3\t2\tm",
+        "Frame#\tTime\tA\t\t\tB",
+        "\t\tX1\tY1\tZ1\tX2\tY2\tZ2",
+        "1\t0\t1\t2\t3\t4\t5\t6",
+        "2\t0.005\t\t\t\t4\t5\t6",
+        "3\t0.01\t1\t2\t3\t\t\t",
+    ]
+    filename = tmp_path / "markers.trc"
+    filename.write_text("\n".join(lines))
+
+    markers = Markers.from_trc(filename)
+    assert markers.attrs == {"rate": 200.0}
+    assert markers.channel.values.tolist() == ["A", "B"]
+    np.testing.assert_array_equal(markers.time, [0, 0.005, 0.01])
+    np.testing.assert_array_equal(
+        markers.sel(axis="x"), [[1, np.nan, 1], [4, 4, np.nan]]
+    )
+    np.testing.assert_array_equal(markers.sel(channel="B", axis="z"), [6, 6, np.nan])
+
+
+def test_read_trc_peak_memory(tmp_path):
+    # the trc reader parses the numeric block in one pass, without the generic csv round trip
+    lines = MARKERS_TRC.read_text().splitlines()
+    n_frames = 3000
+    lines[2] = lines[2].replace("652", f"{n_frames}", 1)
+    data = np.random.default_rng(0).random((n_frames, 153)) * 1000
+    rows = [
+        ",".join([f"{i + 1}", f"{i / 100}", *(f"{value:.4f}" for value in row)])
+        for i, row in enumerate(data)
+    ]
+    filename = tmp_path / "markers.trc"
+    filename.write_text("\n".join(lines[:6] + rows))
+
+    def peak_memory(reader):
+        tracemalloc.start()
+        markers = reader(filename)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return markers, peak
+
+    trc, trc_peak = peak_memory(Markers.from_trc)
+    csv, csv_peak = peak_memory(read_trc_with_csv)
+    xr.testing.assert_identical(trc, csv)
+    assert trc.time.size == n_frames
+    assert trc_peak < csv_peak
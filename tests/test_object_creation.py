@@ -43,6 +43,18 @@ def test_markers_creation():
         Markers(ANALOGS_DATA)
 
 
+def test_dask_backed_creation():
+    dask = pytest.importorskip("dask")
+    analogs = Analogs(ANALOGS_DATA.values, chunks={"time": 100})
+    assert dask.is_dask_collection(analogs)
+    assert analogs.chunks[-1][0] == 100
+    xr.testing.assert_identical(analogs.compute(), Analogs(ANALOGS_DATA.values))
+
+    markers = Markers(MARKERS_DATA.values[:3], chunks={"channel": 2})
+    assert dask.is_dask_collection(markers)
+    np.testing.assert_array_equal(markers, MARKERS_DATA)
+
+
 def test_angles_creation():
     dims = ("axis", "channel", "time")
     array = Angles()
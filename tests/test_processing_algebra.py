@@ -1,4 +1,6 @@
 import numpy as np
+import pytest
+import xarray as xr
 
 from pyomeca import Markers
 from tests._constants import MARKERS_DATA, ANALOGS_DATA, EXPECTED_VALUES
@@ -82,6 +84,36 @@ def test_proc_rms():
     np.testing.assert_array_almost_equal(a, 0.00011321, decimal=6)
 
 
+def test_proc_moving_average_rms():
+    for array in (MARKERS_DATA, ANALOGS_DATA):
+        averaged = array.meca.moving_average(window=20, step=5)
+        expected = array.rolling(time=20).mean().isel(time=slice(19, None, 5))
+        np.testing.assert_allclose(averaged, expected, rtol=1e-6, atol=1e-12)
+        np.testing.assert_allclose(
+            averaged.time,
+            (array.time[:-19:5].values + array.time[19::5].values) / 2,
+        )
+
+        rms = array.meca.moving_rms(window=20)
+        expected = np.sqrt(np.square(array).rolling(time=20).mean()).isel(
+            time=slice(19, None)
+        )
+        np.testing.assert_allclose(rms, expected, rtol=1e-6, atol=1e-12)
+
+    # a window over the whole signal is the rms
+    np.testing.assert_allclose(
+        ANALOGS_DATA.meca.moving_rms(window=ANALOGS_DATA.time.size).squeeze(),
+        np.sqrt(np.square(ANALOGS_DATA).mean("time")),
+    )
+    with pytest.raises(ValueError):
+        ANALOGS_DATA.meca.moving_rms(window=ANALOGS_DATA.time.size + 1)
+    for window, step in ((0, 1), (-5, 1), (20, 0), (20, -1)):
+        with pytest.raises(ValueError):
+            ANALOGS_DATA.meca.moving_average(window=window, step=step)
+        with pytest.raises(ValueError):
+            ANALOGS_DATA.meca.moving_rms(window=window, step=step)
+
+
 def test_proc_center():
     is_expected_array(MARKERS_DATA.meca.center(), **EXPECTED_VALUES[5])
     is_expected_array(
@@ -109,3 +141,16 @@ def test_proc_normalize():
         ANALOGS_DATA.meca.normalize(ref=ANALOGS_DATA.sel(time=5.76)),
         **EXPECTED_VALUES[25]
     )
+
+
+def test_proc_norm_rms_dask():
+    dask = pytest.importorskip("dask")
+    chunked = MARKERS_DATA.chunk({"channel": 10})
+
+    norm = chunked.meca.norm(dim="axis")
+    assert dask.is_dask_collection(norm)
+    xr.testing.assert_allclose(norm.compute(), MARKERS_DATA.meca.norm(dim="axis"))
+
+    rms = chunked.meca.rms()
+    assert dask.is_dask_collection(rms)
+    xr.testing.assert_allclose(rms.compute(), MARKERS_DATA.meca.rms())
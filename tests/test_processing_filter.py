@@ -1,3 +1,9 @@
+import numpy as np
+import pytest
+import xarray as xr
+
+from pyomeca import StreamingFilter
+from pyomeca.processing import filter
 from tests._constants import ANALOGS_DATA, MARKERS_DATA, EXPECTED_VALUES
 from tests.utils import is_expected_array
 
@@ -40,3 +46,98 @@ def test_proc_filters():
         MARKERS_DATA.meca.band_stop(freq=freq, order=order, cutoff=[5, 6]),
         **EXPECTED_VALUES[39],
     )
+
+
+def test_proc_filters_dask():
+    dask = pytest.importorskip("dask")
+    freq = ANALOGS_DATA.rate
+    chunked = ANALOGS_DATA.chunk({"channel": 10, "time": 1000})
+
+    low_pass = chunked.meca.low_pass(freq=freq, order=2, cutoff=5)
+    assert dask.is_dask_collection(low_pass)
+    xr.testing.assert_allclose(
+        low_pass.compute(), ANALOGS_DATA.meca.low_pass(freq=freq, order=2, cutoff=5)
+    )
+    band_pass = chunked.meca.band_pass(freq=freq, order=2, cutoff=[10, 200])
+    assert dask.is_dask_collection(band_pass)
+    xr.testing.assert_allclose(
+        band_pass.compute(),
+        ANALOGS_DATA.meca.band_pass(freq=freq, order=2, cutoff=[10, 200]),
+    )
+
+
+def test_proc_filters_sos():
+    freq = ANALOGS_DATA.rate
+    filter.butterworth_sos.cache_clear()
+    for _ in range(3):
+        ANALOGS_DATA.meca.low_pass(freq=freq, order=2, cutoff=5)
+    assert filter.butterworth_sos.cache_info().misses == 1
+    assert filter.butterworth_sos.cache_info().hits == 2
+
+    # the transfer function form is unstable for high orders at low normalized cutoffs
+    band_pass = ANALOGS_DATA.meca.band_pass(freq=freq, order=8, cutoff=[0.5, 2])
+    assert np.isfinite(band_pass).all()
+    assert np.abs(band_pass).max() < np.abs(ANALOGS_DATA).max()
+
+
+def test_proc_filters_time_dimension():
+    freq = MARKERS_DATA.rate
+    low_pass = MARKERS_DATA.meca.low_pass(freq=freq, order=2, cutoff=5)
+    transposed = MARKERS_DATA.transpose("time", "axis", "channel")
+    filtered = transposed.meca.low_pass(freq=freq, order=2, cutoff=5)
+    assert filtered.dims == transposed.dims
+    xr.testing.assert_allclose(filtered.transpose(*low_pass.dims), low_pass)
+
+    dask = pytest.importorskip("dask")
+    # the chunks along time are filtered with an overlap on their neighbours
+    # (a NaN only spreads in its own chunks, the channels with NaNs are not compared)
+    complete = ~transposed.isnull().any(["time", "axis"]).values
+    chunked = (
+        transposed.isel(channel=complete)
+        .chunk({"time": 50})
+        .meca.low_pass(freq=freq, order=2, cutoff=5)
+    )
+    assert dask.is_dask_collection(chunked)
+    xr.testing.assert_allclose(chunked.compute(), filtered.isel(channel=complete))
+
+
+def test_proc_envelope():
+    freq = ANALOGS_DATA.rate
+    envelope = ANALOGS_DATA.meca.envelope(
+        freq=freq, order=4, cutoff=5, band_pass_cutoff=[10, 425], band_pass_order=2
+    )
+    xr.testing.assert_allclose(
+        envelope,
+        ANALOGS_DATA.meca.band_pass(freq=freq, order=2, cutoff=[10, 425])
+        .meca.abs()
+        .meca.low_pass(freq=freq, order=4, cutoff=5),
+    )
+    xr.testing.assert_allclose(
+        ANALOGS_DATA.meca.envelope(freq=freq, order=2, cutoff=5),
+        ANALOGS_DATA.meca.abs().meca.low_pass(freq=freq, order=2, cutoff=5),
+    )
+
+
+def test_streaming_filter():
+    freq = ANALOGS_DATA.rate
+    streaming_filter = StreamingFilter(
+        freq=freq, order=4, cutoff=[10, 200], btype="bandpass"
+    )
+    chunks = [
+        streaming_filter(ANALOGS_DATA.isel(time=slice(first, first + 1000)))
+        for first in range(0, ANALOGS_DATA.time.size, 1000)
+    ]
+    whole = StreamingFilter(freq=freq, order=4, cutoff=[10, 200], btype="bandpass")(
+        ANALOGS_DATA
+    )
+    xr.testing.assert_allclose(xr.concat(chunks, "time"), whole)
+    # causal filter: the phase is not preserved but the frequency content is the one of band_pass
+    band_pass = ANALOGS_DATA.meca.band_pass(freq=freq, order=4, cutoff=[10, 200])
+    np.testing.assert_allclose(whole.std("time"), band_pass.std("time"), rtol=0.1)
+
+    with pytest.raises(ValueError):
+        streaming_filter(ANALOGS_DATA.isel(channel=[0, 1]))
+    streaming_filter.reset()
+    xr.testing.assert_allclose(
+        streaming_filter(ANALOGS_DATA.isel(channel=[0, 1])), whole.isel(channel=[0, 1])
+    )
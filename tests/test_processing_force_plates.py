@@ -0,0 +1,198 @@
+import ezc3d
+import numpy as np
+import pytest
+
+from pyomeca import Analogs, ForcePlates, Markers
+from tests._constants import FORCE_PLATES_C3D, MARKERS_ANALOGS_C3D
+
+MARKERS_RATE, ANALOGS_RATE, N_FRAMES = 100, 1000, 40
+TIME = np.arange(N_FRAMES * ANALOGS_RATE // MARKERS_RATE) / ANALOGS_RATE
+
+# plate 1 (type 2): x along the global x axis, z downward
+# plate 2 (type 4): x along the global y axis, z downward
+CORNERS = np.stack(
+    [
+        np.array([[250, -300, 0], [-250, -300, 0], [-250, 300, 0], [250, 300, 0]]).T
+        + [[250], [300], [0]],
+        np.array([[300, 250, 0], [300, -250, 0], [-300, -250, 0], [-300, 250, 0]]).T
+        + [[800], [300], [0]],
+    ],
+    axis=-1,
+)
+ROTATIONS = np.array(
+    [[[1, 0, 0], [0, -1, 0], [0, 0, -1]], [[0, 1, 0], [1, 0, 0], [0, 0, -1]]]
+)
+CENTERS = np.array([[250, 300, 0], [800, 300, 0]]).T
+ORIGINS = np.array([[1, -2, 40], [0, 0, 35]]).T
+# asymmetric cross-talk, so that a transposed calibration matrix is detected
+CALIBRATION = np.diag([2.0, 2.0, 4.0, 100.0, 100.0, 50.0]) + np.triu(
+    np.full((6, 6), 0.5), k=1
+)
+
+
+def expected_plates():
+    """Forces, centers of pressure (from the plate center) and free moments in the plates reference frames."""
+    sine, cosine = np.sin(2 * np.pi * TIME), np.cos(2 * np.pi * TIME)
+    forces = np.stack(
+        [
+            [20 * sine, 10 * cosine, 600 + 100 * sine],
+            [-5 * cosine, 15 * sine, 300 + 50 * cosine],
+        ],
+        axis=1,
+    )
+    cop = np.stack(
+        [
+            [100 * cosine, 50 * sine, 0 * sine],
+            [-80 * sine, 60 * cosine, 0 * sine],
+        ],
+        axis=1,
+    )
+    free_moment = np.stack([3 * sine, -2 * cosine])
+    return forces, cop, free_moment
+
+
+def write_force_plates_c3d(filename):
+    forces, cop, free_moment = expected_plates()
+    # moments at the plates origins
+    lever = cop - ORIGINS[..., np.newaxis]
+    moments = np.cross(lever, forces, axis=0)
+    moments[2] += free_moment
+    wrenches = np.concatenate([forces, moments])
+    voltages = np.einsum("ij,jt->it", np.linalg.inv(CALIBRATION), wrenches[:, 1])
+
+    labels = ["EMG"] + [
+        f"{quantity}{axis}{plate}"
+        for plate in (1, 2)
+        for quantity in ("F", "M")
+        for axis in "xyz"
+    ]
+    analogs = np.concatenate([np.sin(TIME)[np.newaxis], wrenches[:, 0], voltages])
+
+    c3d = ezc3d.c3d()
+    c3d["parameters"]["POINT"]["RATE"]["value"] = [MARKERS_RATE]
+    c3d["parameters"]["POINT"]["LABELS"]["value"] = ("marker",)
+    c3d["parameters"]["POINT"]["UNITS"]["value"] = ["mm"]
+    c3d["parameters"]["ANALOG"]["RATE"]["value"] = [ANALOGS_RATE]
+    c3d["parameters"]["ANALOG"]["LABELS"]["value"] = tuple(labels)
+    points = np.ones((4, 1, N_FRAMES))
+    c3d["data"]["points"] = points
+    c3d["data"]["analogs"] = analogs[np.newaxis]
+    for name, value in (
+        ("USED", [2]),
+        ("TYPE", [2, 4]),
+        ("CHANNEL", (np.arange(12).reshape(2, 6).T + 2).tolist()),
+    ):
+        c3d.add_parameter("FORCE_PLATFORM", name, value)
+        # ezc3d stores lists of integers as floats, the c3d format expects integers
+        c3d["parameters"]["FORCE_PLATFORM"][name]["type"] = ezc3d.ezc3d.INT
+    c3d.add_parameter("FORCE_PLATFORM", "CORNERS", CORNERS.astype(float).tolist())
+    c3d.add_parameter("FORCE_PLATFORM", "ORIGIN", ORIGINS.astype(float).tolist())
+    c3d.add_parameter(
+        "FORCE_PLATFORM",
+        "CAL_MATRIX",
+        np.stack([np.eye(6), CALIBRATION], axis=-1).tolist(),
+    )
+    c3d.write(f"{filename}")
+
+
+def test_force_plates_from_c3d(tmp_path):
+    filename = tmp_path / "force_plates.c3d"
+    write_force_plates_c3d(filename)
+    plates = ForcePlates.from_c3d(filename)
+
+    np.testing.assert_array_equal(plates.types, [2, 4])
+    np.testing.assert_allclose(plates.corners, CORNERS)
+    np.testing.assert_allclose(plates.origins, ORIGINS)
+    np.testing.assert_array_equal(
+        plates.channels,
+        [[f"{q}{a}{p}" for p in (1, 2)] for q in "FM" for a in "xyz"],
+    )
+    np.testing.assert_allclose(plates.calibration_matrices[..., 1], CALIBRATION)
+
+    with pytest.raises(ValueError):
+        ForcePlates.from_c3d(MARKERS_ANALOGS_C3D)
+
+
+def test_force_plates_compute(tmp_path):
+    filename = tmp_path / "force_plates.c3d"
+    write_force_plates_c3d(filename)
+    plates = ForcePlates.from_c3d(filename)
+    analogs = Analogs.from_c3d(filename)
+    forces, cop, free_moment = expected_plates()
+
+    wrenches = plates.wrenches(analogs)
+    assert wrenches.dims == ("axis", "plate", "time")
+    np.testing.assert_allclose(
+        wrenches.sel(axis=["Fx", "Fy", "Fz"]), forces, rtol=1e-5, atol=1e-3
+    )
+
+    computed = plates.compute(analogs)
+    assert computed.dims == ("axis", "plate", "time")
+    np.testing.assert_array_equal(
+        computed.axis,
+        ["Fx", "Fy", "Fz", "Mx", "My", "Mz", "COPx", "COPy", "COPz", "Tz"],
+    )
+    to_global = lambda vector: np.einsum("pij,jpt->ipt", ROTATIONS, vector)
+    np.testing.assert_allclose(
+        computed.sel(axis=["Fx", "Fy", "Fz"]), to_global(forces), rtol=1e-5, atol=1e-3
+    )
+    np.testing.assert_allclose(
+        computed.sel(axis=["COPx", "COPy", "COPz"]),
+        CENTERS[..., np.newaxis] + to_global(cop),
+        atol=1e-3,
+    )
+    np.testing.assert_allclose(computed.sel(axis="Tz"), free_moment, atol=1e-2)
+    moments_center = np.cross(cop, forces, axis=0)
+    moments_center[2] += free_moment
+    np.testing.assert_allclose(
+        computed.sel(axis=["Mx", "My", "Mz"]), to_global(moments_center), atol=1e-1
+    )
+
+    # at the markers rate, the forces are averaged over the analog samples of each frame
+    markers = Markers.from_c3d(filename)
+    downsampled = plates.compute(analogs, rate=markers.rate)
+    assert downsampled.time.size == markers.time.size
+    np.testing.assert_allclose(downsampled.time, markers.time)
+    np.testing.assert_allclose(
+        downsampled.sel(axis="Fz"),
+        computed.sel(axis="Fz").coarsen(time=10).mean(),
+        rtol=1e-6,
+    )
+    with pytest.raises(ValueError):
+        plates.compute(analogs, rate=300)
+
+    # no center of pressure without load
+    unloaded = plates.compute(analogs, threshold=1000)
+    assert unloaded.sel(axis=["COPx", "COPy", "COPz", "Tz"]).isnull().all()
+    assert unloaded.sel(axis="Fz").notnull().all()
+
+    # a type 4 plate is never left uncalibrated
+    plates.calibration_matrices = None
+    with pytest.raises(ValueError):
+        plates.wrenches(analogs)
+    plates.types = np.array([2, 2])
+    plates.wrenches(analogs)
+
+
+def test_force_plates_data_file():
+    plates = ForcePlates.from_c3d(FORCE_PLATES_C3D)
+    computed = plates.compute(Analogs.from_c3d(FORCE_PLATES_C3D))
+    _, cop, _ = expected_plates()
+    np.testing.assert_allclose(
+        computed.sel(axis=["COPx", "COPy", "COPz"]),
+        CENTERS[..., np.newaxis] + np.einsum("pij,jpt->ipt", ROTATIONS, cop),
+        atol=1e-3,
+    )
+
+    # same results as the force platforms of ezc3d, which also validates the file
+    reference = ezc3d.c3d(f"{FORCE_PLATES_C3D}", extract_forceplat_data=True)
+    for plate, platform in zip(computed.plate, reference["data"]["platform"]):
+        plate = computed.sel(plate=plate)
+        for axis, key in (
+            (["Fx", "Fy", "Fz"], "force"),
+            (["Mx", "My", "Mz"], "moment"),
+            (["COPx", "COPy", "COPz"], "center_of_pressure"),
+        ):
+            np.testing.assert_allclose(plate.sel(axis=axis), platform[key], atol=1e-6)
+        # ezc3d expresses the free moment in the global reference frame (z upward)
+        np.testing.assert_allclose(plate.sel(axis="Tz"), -platform["Tz"][2], atol=1e-6)
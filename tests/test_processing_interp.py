@@ -1,4 +1,7 @@
 import numpy as np
+import pytest
+
+from pyomeca import Analogs, Angles, Rototrans
 
 from tests._constants import MARKERS_DATA, ANALOGS_DATA, EXPECTED_VALUES
 from tests.utils import is_expected_array
@@ -25,3 +28,57 @@ def test_proc_time_normalize():
     is_expected_array(
         ANALOGS_DATA.meca.time_normalize(time_vector=time_vector), **EXPECTED_VALUES[31]
     )
+
+
+def test_proc_time_normalize_rototrans():
+    # rotation around z from 0 to 1.5 rad in 4 frames
+    angles = Angles(np.linspace(0, 1.5, 4).reshape(1, 1, 4), time=[0, 1, 2, 3])
+    rt = Rototrans.from_euler_angles(angles, "z")
+    rt.attrs["units"] = "mm"
+    time_normalized = rt.meca.time_normalize(n_frames=7)
+
+    assert time_normalized.dims == ("row", "col", "time")
+    assert time_normalized.attrs == rt.attrs
+    np.testing.assert_allclose(time_normalized.time, np.linspace(0, 3, 7))
+    np.testing.assert_allclose(
+        Angles.from_rototrans(time_normalized, "z").squeeze(),
+        np.linspace(0, 1.5, 7),
+        atol=1e-12,
+    )
+
+
+def test_proc_downsample():
+    # 2 kHz analogs aligned on 100 Hz markers
+    downsampled = ANALOGS_DATA.meca.downsample(rate=100)
+    assert downsampled.dims == ANALOGS_DATA.dims
+    assert downsampled.attrs["rate"] == 100
+    assert downsampled.time.size == ANALOGS_DATA.time.size // 20
+    np.testing.assert_array_equal(downsampled.time, ANALOGS_DATA.time[::20])
+    np.testing.assert_allclose(
+        downsampled.isel(time=1), ANALOGS_DATA.isel(time=slice(20, 40)).mean("time")
+    )
+    np.testing.assert_allclose(
+        ANALOGS_DATA.meca.downsample(rate=100, method="rms").isel(time=1),
+        np.sqrt((ANALOGS_DATA.isel(time=slice(20, 40)) ** 2).mean("time")),
+    )
+
+    # the decimation keeps the low frequencies and removes the aliased high frequencies
+    time = np.arange(2000) / 1000
+    analogs = Analogs(
+        np.stack([np.sin(2 * np.pi * 5 * time), np.sin(2 * np.pi * 90 * time)]),
+        time=time,
+        attrs={"rate": 1000},
+    )
+    decimated = analogs.meca.downsample(rate=100, method="decimate")
+    assert decimated.time.size == 200
+    np.testing.assert_allclose(
+        decimated.isel(channel=0, time=slice(20, -20)),
+        analogs.isel(channel=0, time=slice(200, -200, 10)),
+        atol=1e-2,
+    )
+    assert np.abs(decimated.isel(channel=1, time=slice(20, -20))).max() < 0.05
+
+    with pytest.raises(ValueError):
+        ANALOGS_DATA.meca.downsample(rate=300)
+    with pytest.raises(ValueError):
+        ANALOGS_DATA.meca.downsample(rate=100, method="median")
@@ -49,3 +49,16 @@ def test_rotate():
 
     with pytest.raises(ValueError):
         markers.isel(time=0).meca.rotate(rt)
+
+
+def test_rotate_dask():
+    dask = pytest.importorskip("dask")
+    angles = Angles.from_random_data(size=(3, 1, 100))
+    rt = Rototrans.from_euler_angles(angles, "xyz")
+    markers = Markers.from_random_data(size=(3, 10, 100)).chunk({"channel": 5})
+
+    rotated_markers = markers.meca.rotate(rt)
+    assert dask.is_dask_collection(rotated_markers)
+    np.testing.assert_array_almost_equal(
+        rotated_markers, markers.compute().meca.rotate(rt), decimal=10
+    )
@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
 import xarray as xr
+from scipy import signal
 
 from pyomeca.processing import misc
 from tests._constants import MARKERS_DATA, ANALOGS_DATA, EXPECTED_VALUES
@@ -25,6 +26,64 @@ def test_proc_fft():
     )
 
 
+def test_proc_fft_pad_dims():
+    freq = ANALOGS_DATA.rate
+    trials = xr.concat([ANALOGS_DATA, ANALOGS_DATA * 2], dim="trial").transpose(
+        "channel", "time", "trial"
+    )
+    amplitudes = trials.meca.fft(freq=freq, workers=2)
+    assert amplitudes.dims == ("channel", "trial", "freq")
+    xr.testing.assert_allclose(
+        amplitudes.isel(trial=1), 2 * ANALOGS_DATA.meca.fft(freq=freq)
+    )
+
+    # 10007 is a prime number, the signal is padded to 10125 frames
+    sine = xr.DataArray(np.sin(2 * np.pi * 50 * np.arange(10007) / 1000), dims="time")
+    padded = sine.meca.fft(freq=1000, pad=True)
+    assert padded.freq.size == 10125 // 2
+    np.testing.assert_allclose(padded.freq.diff("freq"), 1000 / 10125)
+    np.testing.assert_allclose(padded.idxmax("freq"), 50, atol=1000 / 10125)
+
+
+def test_proc_spectrogram():
+    freq = ANALOGS_DATA.rate
+    psd = ANALOGS_DATA.meca.spectrogram(freq=freq, window_length=256, step=128)
+    assert psd.dims == ("channel", "window_time", "freq")
+    assert psd.shape == (4, 89, 129)
+    np.testing.assert_allclose(psd.freq, np.fft.rfftfreq(256, 1 / freq))
+
+    _, _, expected = signal.spectrogram(
+        ANALOGS_DATA.values, fs=freq, window="hann", nperseg=256, noverlap=128
+    )
+    np.testing.assert_allclose(psd, expected.transpose(0, 2, 1), atol=1e-20)
+    _, expected = signal.welch(ANALOGS_DATA.values, fs=freq, nperseg=256)
+    np.testing.assert_allclose(
+        ANALOGS_DATA.meca.welch(freq=freq, window_length=256), expected, atol=1e-20
+    )
+
+    # sine of 100 Hz: median and mean frequencies of 100 Hz in each window
+    time = np.arange(4000) / 1000
+    sine = xr.DataArray(
+        np.sin(2 * np.pi * 100 * time), dims="time", coords={"time": time}
+    )
+    psd = sine.meca.spectrogram(freq=1000, window_length=500, step=250)
+    np.testing.assert_allclose(psd.window_time, np.arange(0.2495, 3.75, 0.25))
+    np.testing.assert_allclose(psd.meca.median_frequency(), 100)
+    np.testing.assert_allclose(psd.meca.mean_frequency(), 100, rtol=1e-3)
+
+    np.testing.assert_allclose(
+        ANALOGS_DATA.meca.welch(freq=freq, window_length=256, workers=2), expected
+    )
+
+    # a window of one frame moves one frame at a time
+    assert sine.meca.spectrogram(freq=1000, window_length=1).window_time.size == 4000
+    for window_length, step in ((20000, None), (0, None), (256, 0), (256, -1)):
+        with pytest.raises(ValueError):
+            ANALOGS_DATA.meca.spectrogram(
+                freq=freq, window_length=window_length, step=step
+            )
+
+
 def test_proc_detect_onset():
     m = MARKERS_DATA[0, 0, :]
     r = xr.DataArray(m.meca.detect_onset(threshold=m.mean() + m.std()))
@@ -67,3 +126,45 @@ def test_has_correct_name():
 
     with pytest.raises(ValueError):
         misc.has_correct_name(MARKERS_DATA, "rototrans")
+
+
+def test_proc_fft_dask():
+    dask = pytest.importorskip("dask")
+    fft = MARKERS_DATA.chunk({"channel": 10}).meca.fft(freq=MARKERS_DATA.rate)
+    assert dask.is_dask_collection(fft)
+    xr.testing.assert_allclose(
+        fft.compute(), MARKERS_DATA.meca.fft(freq=MARKERS_DATA.rate)
+    )
+
+
+def test_proc_detect_onsets():
+    trials = xr.concat(
+        [MARKERS_DATA[:3], MARKERS_DATA[:3] * -1], dim="trial"
+    ).assign_coords(trial=["a", "b"])
+    threshold = MARKERS_DATA[:3].mean("time")
+    kwargs = [
+        dict(n_above=1),
+        dict(n_above=10, n_below=5),
+        dict(n_below=10, threshold2=trials.max() / 2, n_above2=20),
+    ]
+    for kwarg in kwargs:
+        onsets = trials.meca.detect_onsets(threshold=threshold, **kwarg)
+        assert onsets.columns.tolist() == ["trial", "axis", "channel", "start", "stop"]
+
+        expected = []
+        for trial, axis, channel in np.ndindex(trials.shape[:-1]):
+            series = trials[trial, axis, channel]
+            inds = series.meca.detect_onset(threshold=threshold[axis, channel], **kwarg)
+            expected.extend(
+                (
+                    trials.trial.values[trial],
+                    trials.axis.values[axis],
+                    trials.channel.values[channel],
+                    start,
+                    stop,
+                )
+                for start, stop in inds.reshape(-1, 2)
+            )
+        assert [tuple(row) for row in onsets.values.tolist()] == expected
+
+    assert trials.meca.detect_onsets(threshold=np.inf).empty
@@ -2,15 +2,15 @@ from itertools import permutations
 
 import numpy as np
 import pytest
+import xarray as xr
 
-from pyomeca import Angles, Rototrans, Markers
+from pyomeca import Angles, KinematicChain, Rototrans, Markers
 
 SEQ = (
     ["".join(p) for i in range(1, 4) for p in permutations("xyz", i)]
     + ["zyzz"]
-    + ["zxz"]
+    + ["xyx", "xzx", "yxy", "yzy", "zxz", "zyz"]
 )
-SEQ = [s for s in SEQ if s not in ["yxz"]]
 EPSILON = 1e-12
 ANGLES = Angles(np.random.rand(4, 1, 100))
 
@@ -27,6 +27,84 @@ def test_euler2rot_rot2euleur(seq, angles=ANGLES, epsilon=EPSILON):
     np.testing.assert_array_less((a - angles_to_test).meca.abs().sum(), epsilon)
 
 
+def test_rot2euler_batched():
+    seq = "zxy"
+    rt = xr.concat(
+        [
+            Rototrans.from_euler_angles(angles=ANGLES[:3, ...] * i, angle_sequence=seq)
+            for i in (1, -1, 0.5)
+        ],
+        dim="segment",
+    ).assign_coords(segment=["pelvis", "thigh", "leg"])
+    a = Angles.from_rototrans(rototrans=rt, angle_sequence=seq)
+
+    assert a.dims == ("axis", "segment", "time")
+    np.testing.assert_array_equal(a.segment, ["pelvis", "thigh", "leg"])
+    for i, segment in zip((1, -1, 0.5), a.segment.values):
+        np.testing.assert_allclose(
+            a.sel(segment=segment), ANGLES[:3, 0, :] * i, atol=EPSILON
+        )
+
+    with pytest.raises(ValueError):
+        Angles.from_rototrans(rototrans=rt.isel(segment=0), angle_sequence="xxy")
+
+
+def test_euler2rot_batched():
+    angles = Angles(np.random.rand(3, 5, 100)).assign_coords(channel=list("abcde"))
+    translations = Angles(np.random.rand(3, 1, 100))
+    rt = Rototrans.from_euler_angles(
+        angles=angles, angle_sequence="yzx", translations=translations
+    )
+
+    assert rt.dims == ("row", "col", "channel", "time")
+    np.testing.assert_array_equal(rt.channel, list("abcde"))
+    for i in range(angles.channel.size):
+        np.testing.assert_allclose(
+            rt[:, :, i, :],
+            Rototrans.from_euler_angles(
+                angles=angles[:, i : i + 1, :],
+                angle_sequence="yzx",
+                translations=translations,
+            ),
+        )
+    np.testing.assert_allclose(
+        Angles.from_rototrans(rototrans=rt, angle_sequence="yzx"), angles
+    )
+
+
+def test_euler2rot_translations_extra_dims():
+    angles = xr.DataArray(
+        np.random.rand(3, 2, 4, 100), dims=("axis", "trial", "channel", "time")
+    )
+    # same extra dimensions as the angles, in another order
+    translations = xr.DataArray(
+        np.random.rand(3, 4, 2, 100), dims=("axis", "channel", "trial", "time")
+    )
+    rt = Rototrans.from_euler_angles(
+        angles=angles, angle_sequence="xyz", translations=translations
+    )
+    assert rt.dims == ("row", "col", "trial", "channel", "time")
+    np.testing.assert_allclose(
+        rt[:3, 3], translations.transpose("axis", "trial", "channel", "time")
+    )
+
+    # a translation shared by all the channels
+    rt = Rototrans.from_euler_angles(
+        angles=angles, angle_sequence="xyz", translations=translations.isel(channel=[0])
+    )
+    for channel in range(angles.channel.size):
+        np.testing.assert_allclose(
+            rt[:3, 3, :, channel], translations.isel(channel=0).transpose("axis", ...)
+        )
+
+    with pytest.raises(ValueError):
+        Rototrans.from_euler_angles(
+            angles=angles.isel(trial=0),
+            angle_sequence="xyz",
+            translations=translations,
+        )
+
+
 def test_construct_rt():
     eye = Rototrans()
     np.testing.assert_equal(eye.time.size, 1)
@@ -256,3 +334,183 @@ def test_average_rt():
     angles_mean_ref = Angles.from_rototrans(rt, seq).mean(dim="time")
 
     np.testing.assert_array_almost_equal(angles_mean, angles_mean_ref, decimal=2)
+
+
+def test_average_rt_dim():
+    angles = Angles(np.random.rand(3, 1, 100))
+    rt = Rototrans.from_euler_angles(angles, "xyz")
+    trials = xr.concat([rt, rt.isel(time=slice(None, None, -1))], dim="trial")
+
+    rt_mean = Rototrans.from_averaged_rototrans(trials, dim="trial")
+    assert rt_mean.dims == ("row", "col", "time")
+
+    rotation = np.moveaxis(rt_mean.meca.rotation.values, -1, 0)
+    np.testing.assert_allclose(
+        rotation @ rotation.transpose(0, 2, 1),
+        np.tile(np.eye(3), (100, 1, 1)),
+        atol=EPSILON,
+    )
+    np.testing.assert_allclose(np.linalg.det(rotation), 1)
+    np.testing.assert_allclose(
+        Rototrans.from_averaged_rototrans(trials.isel(trial=[0]), dim="trial"), rt
+    )
+
+    # missing matrices are not left out of the average
+    missing = trials.copy()
+    missing[dict(trial=0, time=slice(None, 10))] = np.nan
+    rt_mean = Rototrans.from_averaged_rototrans(missing, dim="trial")
+    assert rt_mean.isel(time=slice(None, 10)).isnull().all()
+    assert rt_mean.isel(time=slice(10, None)).notnull().all()
+    rt_mean = Rototrans.from_averaged_rototrans(missing)
+    assert rt_mean.isel(trial=0).isnull().all()
+    assert rt_mean.isel(trial=1).notnull().all()
+
+
+def test_rt_inv_compose():
+    segments = Rototrans.from_euler_angles(
+        Angles(np.random.rand(3, 4, 100)),
+        "xyz",
+        translations=Angles(np.random.rand(3, 1, 100)),
+    )
+    parent = Rototrans.from_euler_angles(
+        Angles(np.random.rand(3, 1, 100)),
+        "zyx",
+        translations=Angles(np.random.rand(3, 1, 100)),
+    )
+
+    composed = parent.meca.compose(segments)
+    assert composed.dims == ("row", "col", "channel", "time")
+    np.testing.assert_allclose(composed, np.einsum("ijk,jlck->ilck", parent, segments))
+
+    identity = segments.meca.inv().meca.compose(segments)
+    np.testing.assert_allclose(
+        identity,
+        np.broadcast_to(np.eye(4)[..., np.newaxis, np.newaxis], identity.shape),
+        atol=EPSILON,
+    )
+    np.testing.assert_allclose(
+        parent.meca.inv()[..., 0], np.linalg.inv(parent[..., 0]), atol=EPSILON
+    )
+
+    with pytest.raises(ValueError):
+        parent.meca.compose(Angles(np.random.rand(4, 4, 100)))
+
+
+def test_kinematic_chain():
+    markers = Markers.from_c3d(
+        "tests/data/markers_analogs.c3d", prefix_delimiter=":"
+    ).isel(time=slice(0, 100))
+    segments = {
+        "thorax": {
+            "origin": "STER",
+            "axis_1": ("T1", "STER"),
+            "axis_2": ("XIPH", "STER"),
+            "axes_name": "xy",
+            "axis_to_recalculate": "x",
+        },
+        "humerus": {
+            "origin": "ACRO_tip",
+            "axis_1": ("EPICl", "ACRO_tip"),
+            "axis_2": ("EPICm", "EPICl"),
+            "axes_name": "zy",
+            "axis_to_recalculate": "z",
+            "parent": "thorax",
+        },
+    }
+    chain = KinematicChain(segments, angle_sequence="yxy")
+
+    rt = chain.rototrans(markers)
+    assert rt.dims == ("row", "col", "segment", "time")
+    for name, definition in segments.items():
+        expected = Rototrans.from_markers(
+            origin=markers.sel(channel=[definition["origin"]]),
+            axis_1=markers.sel(channel=list(definition["axis_1"])),
+            axis_2=markers.sel(channel=list(definition["axis_2"])),
+            axes_name=definition["axes_name"],
+            axis_to_recalculate=definition["axis_to_recalculate"],
+        )
+        np.testing.assert_allclose(rt.sel(segment=name), expected)
+
+    angles = chain.joint_angles(markers)
+    assert angles.dims == ("axis", "joint", "time")
+    np.testing.assert_array_equal(angles.joint, ["thorax", "humerus"])
+    thorax = Rototrans.from_transposed_rototrans(rt.sel(segment="thorax"))
+    np.testing.assert_allclose(
+        angles.sel(joint="humerus"),
+        Angles.from_rototrans(
+            thorax.meca.compose(rt.sel(segment="humerus")), "yxy"
+        ).isel(channel=0),
+    )
+    np.testing.assert_allclose(
+        angles.sel(joint="thorax"),
+        Angles.from_rototrans(rt.sel(segment="thorax"), "yxy").isel(channel=0),
+    )
+
+    with pytest.raises(ValueError):
+        KinematicChain({"humerus": {**segments["humerus"]}}, angle_sequence="yxy")
+    with pytest.raises(ValueError):
+        KinematicChain({"thorax": {"origin": "STER"}}, angle_sequence="yxy")
+
+
+def test_rt_from_segments():
+    markers = Markers.from_random_data(size=(3, 6, 50)).assign_coords(
+        channel=list("abcdef")
+    )
+    segments = {
+        "first": dict(origin="a", axis_1=("a", "b"), axis_2=("a", "c"), axes_name="xz"),
+        "second": dict(
+            origin="d", axis_1=("e", "d"), axis_2=("f", "a"), axes_name="zy"
+        ),
+        "third": dict(origin="f", axis_1=("c", "e"), axis_2=("b", "f"), axes_name="yz"),
+    }
+    for recalculate in "xyz":
+        for definition in segments.values():
+            definition["axis_to_recalculate"] = recalculate
+        rt = Rototrans.from_segments(markers, segments)
+
+        assert rt.dims == ("row", "col", "segment", "time")
+        np.testing.assert_array_equal(rt.segment, list(segments))
+        for name, definition in segments.items():
+            expected = Rototrans.from_markers(
+                origin=markers.sel(channel=[definition["origin"]]),
+                axis_1=markers.sel(channel=list(definition["axis_1"])),
+                axis_2=markers.sel(channel=list(definition["axis_2"])),
+                axes_name=definition["axes_name"],
+                axis_to_recalculate=recalculate,
+            )
+            np.testing.assert_allclose(rt.sel(segment=name), expected)
+
+    with pytest.raises(ValueError):
+        Rototrans.from_segments(
+            markers, {"wrong": {**segments["first"], "axes_name": "xx"}}
+        )
+    with pytest.raises(ValueError):
+        Rototrans.from_segments(
+            markers, {"wrong": {**segments["first"], "axis_to_recalculate": "w"}}
+        )
+
+
+def test_rt_quaternions():
+    angles = Angles(np.random.rand(3, 4, 100) * 6 - 3)
+    rt = Rototrans.from_euler_angles(
+        angles, "zxy", translations=Angles(np.random.rand(3, 1, 100))
+    )
+    quaternions = rt.meca.to_quaternions()
+
+    assert quaternions.dims == ("axis", "channel", "time")
+    np.testing.assert_array_equal(
+        quaternions.axis, ["qw", "qx", "qy", "qz", "tx", "ty", "tz"]
+    )
+    np.testing.assert_allclose(np.linalg.norm(quaternions[:4], axis=0), 1)
+    assert (quaternions[0] >= 0).all()
+    np.testing.assert_allclose(
+        Rototrans.from_quaternions(quaternions), rt, atol=EPSILON
+    )
+
+    # rotation of pi / 3 around z
+    quaternion = Rototrans.from_euler_angles(
+        Angles(np.full((1, 1, 1), np.pi / 3)), "z"
+    ).meca.to_quaternions()
+    np.testing.assert_allclose(
+        quaternion.squeeze(), [np.cos(np.pi / 6), 0, 0, np.sin(np.pi / 6), 0, 0, 0]
+    )